@@ -8,7 +8,8 @@ try:
 except ImportError:
     pass
 try:
-    from .base import visualize, compute, persist, is_dask_collection
+    from .base import (visualize, compute, persist, is_dask_collection,
+                       estimate_memory)
 except ImportError:
     pass
 
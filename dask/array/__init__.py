@@ -1,9 +1,10 @@
 from __future__ import absolute_import, division, print_function
 
-from ..utils import ignoring
+from ..utils import ignoring, LazyModule
 from .core import (Array, block, concatenate, stack, from_array, store,
                    map_blocks, atop, to_hdf5, to_npy_stack, from_npy_stack,
-                   from_delayed, asarray, asanyarray, broadcast_to)
+                   to_npy_blocks, from_npy_blocks, from_delayed, asarray,
+                   asanyarray, broadcast_to)
 from .routines import (take, choose, argwhere, where, coarsen, insert,
                        ravel, roll, unique, squeeze, topk, ptp, diff, ediff1d,
                        bincount, digitize, histogram, cov, array, dstack,
@@ -12,7 +13,7 @@ from .routines import (take, choose, argwhere, where, coarsen, insert,
                        allclose, corrcoef, swapaxes, tensordot, transpose, dot,
                        vdot, matmul, apply_along_axis, apply_over_axes,
                        result_type, atleast_1d, atleast_2d, atleast_3d,
-                       flip, flipud, fliplr)
+                       flip, flipud, fliplr, sort, argsort, searchsorted)
 from .reshape import reshape
 from .ufunc import (add, subtract, multiply, divide, logaddexp, logaddexp2,
         true_divide, floor_divide, negative, power, remainder, mod, conj, exp,
@@ -31,17 +32,22 @@ except ImportError:
     # Absent for NumPy versions prior to 1.12.
     pass
 from .reductions import (sum, prod, mean, std, var, any, all, min, max, vnorm,
-                         moment,
+                         moment, aggregate,
                          argmin, argmax,
                          nansum, nanmean, nanstd, nanvar, nanmin,
                          nanmax, nanargmin, nanargmax,
                          cumsum, cumprod)
-from .percentile import percentile
+from .percentile import percentile, approx_percentile
 with ignoring(ImportError):
     from .reductions import nanprod, nancumprod, nancumsum
 with ignoring(ImportError):
     from . import ma
-from . import random, linalg, ghost, learn, fft
+# Rarely used submodules are imported on first use to reduce startup time
+random = LazyModule('dask.array.random')
+linalg = LazyModule('dask.array.linalg')
+ghost = LazyModule('dask.array.ghost')
+learn = LazyModule('dask.array.learn')
+fft = LazyModule('dask.array.fft')
 from .wrap import ones, zeros, empty, full
 from .creation import ones_like, zeros_like, empty_like, full_like
 from .rechunk import rechunk
@@ -9,6 +9,7 @@ import math
 from numbers import Number
 import operator
 from operator import add, getitem, mul
+import json
 import os
 import sys
 import traceback
@@ -37,7 +38,8 @@ from ..context import _globals, globalmethod
 from ..utils import (homogeneous_deepmap, ndeepmap, ignoring, concrete,
                      is_integer, IndexCallable, funcname, derived_from,
                      SerializableLock, ensure_dict, Dispatch)
-from ..compatibility import unicode, long, getargspec, zip_longest, apply
+from ..compatibility import (unicode, long, getargspec, zip_longest, apply,
+                             BytesIO)
 from ..delayed import to_task_dask
 from .. import threaded, core
 from .. import sharedict
@@ -814,7 +816,8 @@ def broadcast_chunks(*chunkss):
     return tuple(result)
 
 
-def store(sources, targets, lock=True, regions=None, compute=True, **kwargs):
+def store(sources, targets, lock=True, regions=None, compute=True,
+          coalesce=True, **kwargs):
     """ Store dask arrays in array-like objects, overwrite data in target
 
     This stores dask arrays into object that supports numpy-style setitem
@@ -831,16 +834,25 @@ def store(sources, targets, lock=True, regions=None, compute=True, **kwargs):
     sources: Array or iterable of Arrays
     targets: array-like or iterable of array-likes
         These should support setitem syntax ``target[10:20] = ...``
-    lock: boolean or threading.Lock, optional
+    lock: boolean, 'region' or threading.Lock, optional
         Whether or not to lock the data stores while storing.
-        Pass True (lock each file individually), False (don't lock) or a
-        particular ``threading.Lock`` object to be shared among all writes.
+        Pass True (lock each file individually), 'region' (lock each chunk
+        of a chunked target like an h5py or zarr dataset individually, so
+        that writes to different chunks run in parallel), False (don't lock)
+        or a particular ``threading.Lock`` object to be shared among all
+        writes.  With True or 'region', targets that are safe to write to
+        from many threads at once, as long as the writes don't overlap, are
+        not locked.  These are numpy arrays, memory mapped files and objects
+        with the attribute ``__dask_disjoint_writes__ = True``.
     regions: tuple of slices or iterable of tuple of slices
         Each ``region`` tuple in ``regions`` should be such that
         ``target[region].shape = source.shape``
         for the corresponding source and target in sources and targets, respectively.
     compute: boolean, optional
         If true compute immediately, return ``dask.delayed.Delayed`` otherwise
+    coalesce: boolean, optional
+        Whether to join adjacent blocks that lie within the same chunk of a
+        chunked target, and write them at once
 
     Examples
     --------
@@ -890,7 +902,8 @@ def store(sources, targets, lock=True, regions=None, compute=True, **kwargs):
         except AttributeError:
             dsk = {}
 
-        update = insert_to_ooc(tgt, src, lock=lock, region=reg)
+        update = insert_to_ooc(tgt, src, lock=lock, region=reg,
+                               coalesce=coalesce)
         keys.extend(update)
 
         update.update(dsk)
@@ -1685,25 +1698,27 @@ class Array(Base):
         from .ghost import map_overlap
         return map_overlap(self, func, depth, boundary, trim, **kwargs)
 
-    def cumsum(self, axis, dtype=None, out=None):
+    def cumsum(self, axis, dtype=None, out=None, method='blelloch'):
         """ See da.cumsum for docstring """
         from .reductions import cumsum
-        return cumsum(self, axis, dtype, out=out)
+        return cumsum(self, axis, dtype, out=out, method=method)
 
-    def cumprod(self, axis, dtype=None, out=None):
+    def cumprod(self, axis, dtype=None, out=None, method='blelloch'):
         """ See da.cumprod for docstring """
         from .reductions import cumprod
-        return cumprod(self, axis, dtype, out=out)
+        return cumprod(self, axis, dtype, out=out, method=method)
 
     @derived_from(np.ndarray)
     def squeeze(self):
         from .routines import squeeze
         return squeeze(self)
 
-    def rechunk(self, chunks, threshold=None, block_size_limit=None):
+    def rechunk(self, chunks, threshold=None, block_size_limit=None,
+                method=None, num_workers=None, memory_limit=None):
         """ See da.rechunk for docstring """
         from . import rechunk   # avoid circular import
-        return rechunk(self, chunks, threshold, block_size_limit)
+        return rechunk(self, chunks, threshold, block_size_limit, method,
+                       num_workers, memory_limit)
 
     @property
     def real(self):
@@ -2562,33 +2577,144 @@ def concatenate(seq, axis=0, allow_unknown_chunksizes=False):
     return Array(dsk2, name, chunks, dtype=dt)
 
 
-def insert_to_ooc(out, arr, lock=True, region=None):
-    if lock is True:
+def insert_to_ooc(out, arr, lock=True, region=None, coalesce=True):
+    """ Tasks to store the blocks of ``arr`` in ``out``, see ``store`` """
+    if (lock is True or lock == 'region') and _disjoint_writes(out):
+        lock = False
+    elif lock is True:
         lock = Lock()
 
     def store(out, x, index, lock, region):
-        if lock:
-            lock.acquire()
+        locks = lock if isinstance(lock, tuple) else (lock,) if lock else ()
+        for l in locks:
+            l.acquire()
         try:
             if region is None:
                 out[index] = np.asanyarray(x)
             else:
                 out[fuse_slice(region, index)] = np.asanyarray(x)
         finally:
-            if lock:
-                lock.release()
+            for l in locks[::-1]:
+                l.release()
 
         return None
 
-    slices = slices_from_chunks(arr.chunks)
+    target_chunks = _target_chunks(out)
+    offsets = _region_offsets(region, arr.ndim)
+    aligned = target_chunks is not None and offsets is not None
+    if coalesce and aligned:
+        groups = [coalesce_chunks(c, t, o)
+                  for c, t, o in zip(arr.chunks, target_chunks, offsets)]
+    else:
+        groups = [[(i, i + 1) for i in range(len(c))] for c in arr.chunks]
+    bounds = [list(accumulate(add, (0,) + c)) for c in arr.chunks]
+
+    if lock == 'region':
+        if aligned:
+            region_locks = {}
+        else:
+            lock = Lock()
 
     name = 'store-%s' % arr.name
-    dsk = {(name,) + t[1:]: (store, out, t, slc, lock, region)
-           for t, slc in zip(core.flatten(arr.__dask_keys__()), slices)}
+    dsk = {}
+    for index in product(*map(range, map(len, groups))):
+        blocks = [groups[d][i] for d, i in enumerate(index)]
+        slc = tuple(slice(bounds[d][lo], bounds[d][hi])
+                    for d, (lo, hi) in enumerate(blocks))
+        if all(hi - lo == 1 for lo, hi in blocks):
+            x = (arr.name,) + tuple(lo for lo, _ in blocks)
+        else:
+            x = (concatenate3, _nested_keys(arr.name, blocks))
+        if lock == 'region':
+            # Locks are taken in the order of the target's chunks, so that
+            # writes spanning several chunks can't deadlock
+            touched = [range((o + s.start) // t, (o + s.stop - 1) // t + 1)
+                       for s, t, o in zip(slc, target_chunks, offsets)]
+            task_lock = tuple(region_locks.setdefault(ix, Lock())
+                              for ix in product(*touched))
+        else:
+            task_lock = lock
+        dsk[(name,) + index] = (store, out, x, slc, task_lock, region)
 
     return dsk
 
 
+def _disjoint_writes(target):
+    """ Whether writes to disjoint regions of ``target`` are thread safe
+
+    This holds for numpy arrays and memory mapped files, and for any target
+    that sets the attribute ``__dask_disjoint_writes__ = True``.
+    """
+    return (isinstance(target, np.ndarray) or
+            getattr(target, '__dask_disjoint_writes__', False) is True)
+
+
+def _target_chunks(target):
+    """ The shape of the chunks of a target like an h5py or zarr dataset """
+    chunks = getattr(target, 'chunks', None)
+    shape = getattr(target, 'shape', None)
+    if (isinstance(chunks, tuple) and isinstance(shape, tuple) and
+            len(chunks) == len(shape) and
+            all(is_integer(c) and c > 0 for c in chunks)):
+        return chunks
+    return None
+
+
+def _region_offsets(region, ndim):
+    """ The start of a contiguous ``region`` in each dimension, or None """
+    if region is None:
+        return (0,) * ndim
+    if not isinstance(region, tuple) or len(region) != ndim:
+        return None
+    offsets = []
+    for r in region:
+        if not isinstance(r, slice) or r.step not in (None, 1):
+            return None
+        if r.start is None:
+            offsets.append(0)
+        elif is_integer(r.start) and r.start >= 0:
+            offsets.append(r.start)
+        else:
+            return None
+    return tuple(offsets)
+
+
+def coalesce_chunks(chunks, target_chunk, offset=0):
+    """ Group adjacent chunks that lie within the same chunk of a target
+
+    Returns the ranges of the chunks of each group.
+
+    >>> coalesce_chunks((2, 2, 2, 2, 2), 5)
+    [(0, 2), (2, 3), (3, 5)]
+    >>> coalesce_chunks((2, 2, 2, 2, 2), 5, offset=1)
+    [(0, 2), (2, 4), (4, 5)]
+    """
+    groups = []
+    last_chunk = None
+    start = offset
+    for i, c in enumerate(chunks):
+        first = start // target_chunk
+        if c and first == (start + c - 1) // target_chunk:
+            if first == last_chunk:
+                groups[-1] = (groups[-1][0], i + 1)
+            else:
+                groups.append((i, i + 1))
+            last_chunk = first
+        else:
+            groups.append((i, i + 1))
+            last_chunk = None
+        start += c
+    return groups
+
+
+def _nested_keys(name, blocks, index=()):
+    """ Nested lists of the keys of ``name`` in the ranges of ``blocks`` """
+    (lo, hi), rest = blocks[0], blocks[1:]
+    if not rest:
+        return [(name,) + index + (i,) for i in range(lo, hi)]
+    return [_nested_keys(name, rest, index + (i,)) for i in range(lo, hi)]
+
+
 def asarray(a):
     """Convert the input to a dask array.
 
@@ -3454,3 +3580,197 @@ def from_npy_stack(dirname, mmap_mode='r'):
     dsk = dict(zip(keys, values))
 
     return Array(dsk, name, chunks, dtype)
+
+
+_NPY_BLOCKS_VERSION = 1
+
+
+def to_npy_blocks(dirname, x, compression=None, compute=True, **kwargs):
+    """ Write dask array to a directory of .npy files, one per block
+
+    Each block is written to its own file in parallel, named by the index of
+    the block, and compressed with ``compression`` if given.  When all blocks
+    are written, an ``index.json`` file records the shape, chunks, dtype and
+    compression of the array.  Unlike ``to_npy_stack`` the array may be
+    chunked along any number of axes.
+
+    Examples
+    --------
+
+    >>> x = da.ones((5, 10), chunks=(2, 5))  # doctest: +SKIP
+    >>> da.to_npy_blocks('data/', x)  # doctest: +SKIP
+
+        $ tree data/
+        data/
+        |-- 0.0.npy
+        |-- 0.1.npy
+        |-- 1.0.npy
+        |-- 1.1.npy
+        |-- 2.0.npy
+        |-- 2.1.npy
+        |-- index.json
+
+    You can load these blocks with the ``da.from_npy_blocks`` function.
+
+    >>> y = da.from_npy_blocks('data/')  # doctest: +SKIP
+
+    Parameters
+    ----------
+    dirname: string
+        Directory of .npy files, created if it doesn't exist
+    x: dask array
+    compression: string, optional
+        The compression of each file, like ``'zlib'``, or ``'lz4'`` and
+        ``'blosc'`` if these are installed.  Uncompressed files are memory
+        mapped when read.
+    compute: boolean, optional
+        If true compute immediately, return ``dask.delayed.Delayed`` otherwise
+
+    See Also
+    --------
+    from_npy_blocks
+    """
+    compress, _ = _npy_block_codecs()
+    if compression not in compress:
+        raise ValueError("Compression type %s not supported" % compression)
+    if x.dtype.hasobject:
+        raise ValueError("Can not write arrays of objects to .npy files")
+
+    if not os.path.exists(dirname):
+        os.makedirs(dirname)
+    # Only a complete directory has an index
+    with ignoring(OSError):
+        os.remove(os.path.join(dirname, 'index.json'))
+
+    meta = {'format': 'npy-blocks',
+            'version': _NPY_BLOCKS_VERSION,
+            'dtype': np.lib.format.dtype_to_descr(x.dtype),
+            'compression': compression}
+
+    token = tokenize(x, dirname, compression)
+    name = 'to-npy-blocks-' + token
+    dsk = {(name,) + key[1:]: (_save_block, dirname, key[1:], key,
+                               compression)
+           for key in core.flatten(x.__dask_keys__())}
+    index = 'to-npy-blocks-index-' + token
+    dsk[index] = (_save_npy_blocks_index, dirname, meta, x.numblocks,
+                  sorted(dsk))
+    dsk = sharedict.merge((name, dsk), x.dask)
+    if compute:
+        compute_as_if_collection(Array, dsk, [index], **kwargs)
+    else:
+        from ..delayed import Delayed
+        return Delayed(index, dsk)
+
+
+def _npy_block_codecs():
+    """ Compression and decompression functions for blocks, by name
+
+    These are those of ``dask.bytes.compression``, along with ``'blosc'``
+    if it is installed.
+    """
+    from ..bytes.compression import compress, decompress
+    compress, decompress = dict(compress), dict(decompress)
+    with ignoring(ImportError):
+        import blosc
+        compress['blosc'] = blosc.compress
+        decompress['blosc'] = blosc.decompress
+    return compress, decompress
+
+
+def _block_filename(index, compression):
+    fn = ('.'.join(map(str, index)) or 'scalar') + '.npy'
+    if compression is not None:
+        fn += '.' + compression
+    return fn
+
+
+def _save_block(dirname, index, block, compression):
+    fn = os.path.join(dirname, _block_filename(index, compression))
+    block = np.asarray(block)
+    if compression is None:
+        np.save(fn, block)
+    else:
+        compress, _ = _npy_block_codecs()
+        f = BytesIO()
+        np.lib.format.write_array(f, block)
+        with open(fn, 'wb') as out:
+            out.write(compress[compression](f.getvalue()))
+    return block.shape
+
+
+def _save_npy_blocks_index(dirname, meta, numblocks, shapes):
+    """ Write the index of blocks written with ``to_npy_blocks`` """
+    # Shapes are given in the order of the blocks' indices, so the chunks of
+    # each axis are the shapes of the first blocks along it
+    strides = [reduce(mul, numblocks[i + 1:], 1)
+               for i in range(len(numblocks))]
+    chunks = [[shapes[j * stride][i] for j in range(n)]
+              for i, (n, stride) in enumerate(zip(numblocks, strides))]
+    meta = dict(meta, shape=list(map(sum, chunks)), chunks=chunks)
+    with open(os.path.join(dirname, 'index.json'), 'w') as f:
+        json.dump(meta, f)
+
+
+def _load_block(fn, compression, mmap_mode):
+    if compression is None:
+        return np.load(fn, mmap_mode=mmap_mode)
+    _, decompress = _npy_block_codecs()
+    with open(fn, 'rb') as f:
+        data = decompress[compression](f.read())
+    # Read the array in place, without copying it out of the buffer
+    f = BytesIO(data)
+    if np.lib.format.read_magic(f) == (1, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+    else:
+        shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+    count = reduce(mul, shape, 1)
+    x = np.frombuffer(data, dtype=dtype, count=count, offset=f.tell())
+    return x.reshape(shape, order='F' if fortran_order else 'C')
+
+
+def _descr_to_dtype(descr):
+    # JSON turns the tuples of structured dtypes into lists
+    if isinstance(descr, list):
+        return np.dtype([(tuple(f[0]) if isinstance(f[0], list) else f[0],
+                          _descr_to_dtype(f[1])) + tuple(map(tuple, f[2:]))
+                         for f in descr])
+    return np.dtype(descr)
+
+
+def from_npy_blocks(dirname, mmap_mode='r'):
+    """ Load dask array from a directory of .npy files, one per block
+
+    See ``da.to_npy_blocks`` for docstring.  Each block is read only when
+    needed, so slicing the array reads only the blocks that it overlaps.
+
+    Parameters
+    ----------
+    dirname: string
+        Directory of .npy files
+    mmap_mode: (None or 'r')
+        Read uncompressed data in memory map mode, so that only the parts of
+        blocks that are used are read, without copies
+    """
+    fn = os.path.join(dirname, 'index.json')
+    with open(fn) as f:
+        meta = json.load(f)
+    if meta.get('format') != 'npy-blocks':
+        raise ValueError("%s is not an index of .npy blocks" % fn)
+    if meta['version'] > _NPY_BLOCKS_VERSION:
+        raise ValueError("Can not read version %d of .npy blocks"
+                         % meta['version'])
+
+    chunks = tuple(map(tuple, meta['chunks']))
+    dtype = _descr_to_dtype(meta['dtype'])
+    compression = meta['compression']
+
+    name = 'from-npy-blocks-' + tokenize(os.path.abspath(dirname), meta,
+                                         os.path.getmtime(fn), mmap_mode)
+    dsk = {(name,) + index: (_load_block,
+                             os.path.join(dirname,
+                                          _block_filename(index, compression)),
+                             compression, mmap_mode)
+           for index in product(*map(range, map(len, chunks)))}
+
+    return Array(dsk, name, chunks, dtype)
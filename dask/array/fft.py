@@ -3,15 +3,10 @@ from __future__ import absolute_import, division, print_function
 import collections
 from functools import wraps
 import inspect
+import sys
 
 import numpy as np
 
-try:
-    import scipy
-    import scipy.fftpack
-except ImportError:
-    scipy = None
-
 from .core import concatenate as _concatenate
 from .creation import arange as _arange
 
@@ -130,10 +125,12 @@ def fft_wrap(fft_func, kind=None, dtype=None):
     >>> parallel_fft = fft_wrap(np.fft.fft)
     >>> parallel_ifft = fft_wrap(np.fft.ifft)
     """
-    if scipy is not None:
-        if fft_func is scipy.fftpack.rfft:
+    # Only check against SciPy if it's already in use, to avoid importing it
+    fftpack = sys.modules.get('scipy.fftpack')
+    if fftpack is not None:
+        if fft_func is fftpack.rfft:
             raise ValueError("SciPy's `rfft` doesn't match the NumPy API.")
-        elif fft_func is scipy.fftpack.irfft:
+        elif fft_func is fftpack.irfft:
             raise ValueError("SciPy's `irfft` doesn't match the NumPy API.")
 
     if kind is None:
@@ -1,12 +1,15 @@
 from __future__ import absolute_import, division, print_function
 
+from numbers import Integral, Number
+import operator
 from operator import getitem
 
 import numpy as np
 
 from .core import getter, getter_nofancy, getter_inline
 from ..compatibility import zip_longest
-from ..core import flatten, reverse_dict
+from ..context import _globals
+from ..core import flatten, reverse_dict, istask, ishashable
 from ..optimize import cull, fuse, inline_functions
 from ..utils import ensure_dict
 
@@ -21,12 +24,14 @@ GETNOREMOVE = (getter, getter_nofancy)
 
 def optimize(dsk, keys, fuse_keys=None, fast_functions=None,
              inline_functions_fast_functions=(getter_inline,), rename_fused_keys=True,
-             **kwargs):
+             fuse_elemwise=None, **kwargs):
     """ Optimize dask for array computation
 
     1.  Cull tasks not necessary to evaluate keys
-    2.  Remove full slicing, e.g. x[:]
-    3.  Inline fast functions like getitem and np.transpose
+    2.  Fuse linear chains of tasks
+    3.  Fuse trees of elementwise operations into kernels
+    4.  Remove full slicing, e.g. x[:]
+    5.  Inline fast functions like getitem and np.transpose
     """
     dsk = ensure_dict(dsk)
     keys = list(flatten(keys))
@@ -38,6 +43,13 @@ def optimize(dsk, keys, fuse_keys=None, fast_functions=None,
 
     dsk3, dependencies = fuse(dsk2, hold + keys + (fuse_keys or []),
                               dependencies, rename_keys=rename_fused_keys)
+    if fuse_elemwise is None:
+        # As other fusion, unless turned off with ``fuse_ave_width=0``
+        fuse_elemwise = (_globals.get('fuse_elemwise', True) and
+                         _globals.get('fuse_ave_width') != 0)
+    if fuse_elemwise:
+        dsk3, dependencies = fuse_elemwise_kernels(
+            dsk3, hold + keys + (fuse_keys or []), dependencies)
     if inline_functions_fast_functions:
         dsk4 = inline_functions(dsk3, keys, dependencies=dependencies,
                                 fast_functions=inline_functions_fast_functions)
@@ -161,6 +173,292 @@ def optimize_slices(dsk):
     return dsk
 
 
+# Elementwise functions, and the ufuncs that compute them into an output
+# buffer.  ``ndarray.__pow__`` takes shortcuts for some scalar exponents, so
+# ``operator.pow`` is handled separately.
+_operator_ufuncs = {operator.add: np.add,
+                    operator.sub: np.subtract,
+                    operator.mul: np.multiply,
+                    operator.truediv: np.true_divide,
+                    operator.floordiv: np.floor_divide,
+                    operator.mod: np.remainder,
+                    operator.neg: np.negative,
+                    operator.abs: np.absolute}
+if hasattr(operator, 'div'):
+    _operator_ufuncs[operator.div] = np.divide
+
+# Ufuncs whose result has the dtype of their inputs, for floating point and
+# complex inputs
+_dtype_preserving = {getattr(np, name) for name in
+                     ['add', 'subtract', 'multiply', 'divide', 'true_divide',
+                      'floor_divide', 'remainder', 'fmod', 'power',
+                      'negative', 'absolute', 'square', 'sqrt', 'reciprocal', 'exp',
+                      'exp2', 'expm1', 'log', 'log2', 'log10', 'log1p', 'sin',
+                      'cos', 'tan', 'arcsin', 'arccos', 'arctan', 'sinh',
+                      'cosh', 'tanh', 'arcsinh', 'arccosh', 'arctanh',
+                      'arctan2', 'hypot', 'maximum', 'minimum', 'fmax',
+                      'fmin', 'floor', 'ceil', 'trunc', 'rint', 'conjugate',
+                      'copysign', 'deg2rad', 'rad2deg']
+                     if hasattr(np, name)}
+
+# Exponents for which ``ndarray.__pow__`` doesn't call ``np.power``
+_fast_exponents = (-1, 0, 0.5, 1, 2)
+
+
+def _is_elemwise(task):
+    if not istask(task):
+        return False
+    func = task[0]
+    if isinstance(func, np.ufunc):
+        return func.nout == 1 and len(task) - 1 == func.nin
+    return (func is operator.pow and len(task) == 3 or
+            func in _operator_ufuncs and
+            len(task) - 1 == _operator_ufuncs[func].nin)
+
+
+def fuse_elemwise_kernels(dsk, keys, dependencies):
+    """ Fuse trees of elementwise operations into kernels that reuse memory
+
+    Elementwise tasks, those that call a ufunc or an arithmetic operator,
+    are merged with the elementwise tasks and subtasks they depend on, if
+    nothing else uses their results.  The merged tasks call an
+    ``ElemwiseKernel``, which computes intermediate results into the memory
+    of earlier intermediates where dtypes allow, rather than allocating a new
+    array for each operation.
+
+    Parameters
+    ----------
+    dsk : dict
+    keys : list
+        Keys to keep in the graph
+    dependencies : dict
+        Mapping of keys to their dependencies
+
+    Returns
+    -------
+    dsk : dict
+    dependencies : dict
+
+    Examples
+    --------
+    >>> from operator import add, mul
+    >>> dsk = {'a': 1, 'b': (add, 'a', 1), 'c': (mul, 'b', 'a')}
+    >>> deps = {'a': set(), 'b': {'a'}, 'c': {'a', 'b'}}
+    >>> dsk2, deps2 = fuse_elemwise_kernels(dsk, ['c'], deps)
+    >>> sorted(dsk2)
+    ['a', 'c']
+    >>> dsk2['c']  # doctest: +SKIP
+    (ElemwiseKernel(mul(add(0, 1), 0)), 'a', 1)
+    >>> dask.get(dsk2, 'c')  # doctest: +SKIP
+    4
+    """
+    dependents = reverse_dict(dependencies)
+    dependencies = dict(dependencies)
+    keys = set(keys)
+
+    def inlinable(k):
+        """ The keys, through any aliases, and elementwise task to inline """
+        chain = []
+        while (ishashable(k) and k in dsk and k not in keys and
+               len(dependents[k]) == 1):
+            chain.append(k)
+            task = dsk[k]
+            if _is_elemwise(task):
+                return chain, task
+            if istask(task):
+                break
+            k = task
+        return None, None
+
+    def dependent_is_elemwise(k):
+        while True:
+            k = next(iter(dependents[k]))
+            task = dsk[k]
+            if istask(task) or k in keys or len(dependents[k]) != 1:
+                return _is_elemwise(task)
+
+    fused = set()
+    new = dict()
+    kernels = dict()
+    for k, task in dsk.items():
+        if k in fused or not _is_elemwise(task):
+            continue
+        if inlinable(k)[0] and dependent_is_elemwise(k):
+            continue  # fused into its dependent
+        instructions = []
+        args = []
+        arg_index = dict()
+        inlined = []
+        seen = dict()
+
+        def build(task):
+            operands = []
+            for a in task[1:]:
+                if _is_elemwise(a):
+                    operands.append((1, build(a)))
+                elif ishashable(a) and a in seen:
+                    operands.append((1, seen[a]))
+                elif inlinable(a)[0]:
+                    chain, subtask = inlinable(a)
+                    inlined.extend(chain)
+                    seen[a] = build(subtask)
+                    operands.append((1, seen[a]))
+                else:
+                    try:
+                        i = arg_index[a]
+                    except (KeyError, TypeError):
+                        i = len(args)
+                        args.append(a)
+                        if ishashable(a):
+                            arg_index[a] = i
+                    operands.append((0, i))
+            instructions.append((task[0], tuple(operands)))
+            return len(instructions) - 1
+
+        build(task)
+        if len(instructions) == 1:
+            continue
+        instructions = tuple(instructions)
+        if instructions not in kernels:
+            kernels[instructions] = ElemwiseKernel(instructions)
+        new[k] = (kernels[instructions],) + tuple(args)
+        fused.update(inlined)
+        deps = set(dependencies[k])
+        for a in inlined:
+            deps.update(dependencies[a])
+        dependencies[k] = deps - set(inlined)
+
+    if not new:
+        return dsk, dependencies
+    dsk = dict((k, v) for k, v in dsk.items() if k not in fused)
+    dsk.update(new)
+    dependencies = dict((k, v) for k, v in dependencies.items()
+                        if k not in fused)
+    return dsk, dependencies
+
+
+class ElemwiseKernel(object):
+    """ A tree of elementwise operations, computed with few temporaries
+
+    Each instruction is a function and its operands, each of which is either
+    ``(0, i)``, the ``i``th argument of the kernel, or ``(1, j)``, the
+    result of the ``j``th instruction.  The last instruction gives the result.
+
+    Once an intermediate result is used for the last time, its memory is
+    reused for the output of the operation, if the operation is a ufunc that
+    gives the same dtype.  Arguments are never written to.  Only plain NumPy
+    arrays and scalars are computed this way, other types of arrays have
+    their operations called as usual.
+
+    Examples
+    --------
+    >>> from operator import add, mul
+    >>> kernel = ElemwiseKernel([(add, ((0, 0), (0, 1))),
+    ...                          (mul, ((1, 0), (0, 0)))])
+    >>> kernel
+    ElemwiseKernel(mul(add(0, 1), 0))
+    >>> kernel(np.arange(3.0), 1.0)
+    array([ 0.,  2.,  6.])
+    """
+    def __init__(self, instructions):
+        self.instructions = [(func, tuple(operands))
+                             for func, operands in instructions]
+        uses = [0] * len(self.instructions)
+        for _, operands in self.instructions:
+            for kind, i in operands:
+                if kind:
+                    uses[i] += 1
+        self.uses = uses
+
+    def __call__(self, *args):
+        results = [None] * len(self.instructions)
+        remaining = list(self.uses)
+        for j, (func, operands) in enumerate(self.instructions):
+            values = []
+            buffers = []
+            for kind, i in operands:
+                if kind:
+                    values.append(results[i])
+                    remaining[i] -= 1
+                    if not remaining[i]:
+                        buffers.append(results[i])
+                        results[i] = None
+                else:
+                    values.append(args[i])
+            results[j] = _apply(func, values, buffers)
+        return results[-1]
+
+    def __repr__(self):
+        def expr(j):
+            func, operands = self.instructions[j]
+            return '%s(%s)' % (getattr(func, '__name__', func),
+                               ', '.join(expr(i) if kind else str(i)
+                                         for kind, i in operands))
+        return 'ElemwiseKernel(%s)' % expr(len(self.instructions) - 1)
+
+    def __eq__(self, other):
+        return (type(other) is ElemwiseKernel and
+                self.instructions == other.instructions)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(tuple(self.instructions))
+
+
+def _apply(func, values, buffers):
+    """ Call an elementwise function, writing to a spent buffer if possible
+    """
+    ufunc_values = values
+    if isinstance(func, np.ufunc):
+        ufunc = func
+    elif func is operator.pow:
+        exponent = values[1]
+        if not isinstance(exponent, Number):
+            ufunc = np.power
+        elif exponent == 2:
+            ufunc, ufunc_values = np.square, values[:1]
+        elif exponent in _fast_exponents:
+            ufunc = None
+        else:
+            ufunc = np.power
+    else:
+        ufunc = _operator_ufuncs.get(func)
+
+    if ufunc in _dtype_preserving:
+        for out in buffers:
+            if type(out) is np.ndarray and _same_dtype(out, values, ufunc):
+                shape = np.broadcast(*ufunc_values).shape
+                if shape == out.shape:
+                    return ufunc(*ufunc_values, out=out)
+    return func(*values)
+
+
+def _same_dtype(out, values, ufunc):
+    """ Whether ``ufunc(*values)`` has the dtype of the buffer ``out`` """
+    kind = out.dtype.kind
+    if kind not in 'fc' or ufunc is np.absolute and kind == 'c':
+        return False
+    for v in values:
+        if type(v) is np.ndarray:
+            if v.dtype != out.dtype:
+                return False
+        elif isinstance(v, (bool, np.bool_)):
+            return False
+        elif isinstance(v, (np.integer, np.floating, float)):
+            continue
+        elif isinstance(v, Integral):
+            # Python integers too large for int64 are objects to NumPy
+            if np.min_scalar_type(v).kind not in 'biu':
+                return False
+        elif isinstance(v, (complex, np.complexfloating)) and kind == 'c':
+            continue
+        else:
+            return False
+    return True
+
+
 def normalize_slice(s):
     """ Replace Nones in slices with integers
 
@@ -1,12 +1,14 @@
 from __future__ import absolute_import, division, print_function
 
-from functools import wraps
+from functools import partial, wraps
 from collections import Iterator
+import warnings
 
 import numpy as np
 from toolz import merge, merge_sorted
 
 from .core import Array
+from .reductions import reduction
 from ..base import tokenize
 from .. import sharedict
 
@@ -166,3 +168,290 @@ def merge_percentiles(finalq, qs, vals, Ns, interpolation='lower'):
             raise ValueError("interpolation can only be 'linear', 'lower', "
                              "'higher', 'midpoint', or 'nearest'")
     return rv
+
+
+def _tdigest_dtype(compression):
+    """ The dtype of t-digests, with room for ``compression // 2 + 1``
+    centroids """
+    size = int(compression // 2) + 1
+    return np.dtype([('mean', 'f8', (size,)), ('weight', 'f8', (size,)),
+                     ('min', 'f8'), ('max', 'f8')])
+
+
+def _sort_centroids(means, weights):
+    """ Sort centroids along the last axis by mean, empty centroids last """
+    rows = np.arange(len(means))[:, None]
+    order = np.argsort(np.where(weights > 0, means, np.inf), axis=1)
+    return means[rows, order], weights[rows, order]
+
+
+def tdigest_compress(means, weights, compression):
+    """ Merge centroids into at most ``compression // 2 + 1`` per digest
+
+    Centroids are sorted, and those whose midpoints have the same integer
+    part of the scale function ``k(q) = compression * (arcsin(2q - 1) / pi +
+    1 / 2) / 2`` of their quantile ``q`` are merged.  This keeps centroids
+    small near the tails, where quantiles change quickly.  Centroids with no
+    weight are ignored.
+
+    Parameters
+    ----------
+    means, weights : np.ndarray
+        Centroids along the last axis, one digest per position of the other
+        axes
+    compression : number
+
+    Returns
+    -------
+    means, weights : np.ndarray
+        Merged centroids, with ``compression // 2 + 1`` along the last axis,
+        some of which may be empty
+
+    Examples
+    --------
+    >>> means, weights = tdigest_compress(np.arange(8.), np.ones(8), 4)
+    >>> means
+    array([ 1.5,  5.5,  nan])
+    >>> weights
+    array([ 4.,  4.,  0.])
+    """
+    shape = means.shape[:-1]
+    size = int(compression // 2) + 1
+    rows = (int(np.prod(shape)), means.shape[-1])
+    means, weights = _sort_centroids(means.reshape(rows),
+                                     weights.reshape(rows))
+    rows = np.arange(len(means))[:, None]
+
+    cumulative = np.cumsum(weights, axis=1)
+    total = cumulative[:, -1:]
+    k = _scale((cumulative - weights / 2) / np.where(total > 0, total, 1),
+               compression)
+
+    index = (rows * size + k).ravel()
+    n = len(means) * size
+    new_weights = np.bincount(index, weights.ravel(), minlength=n)
+    sums = np.bincount(index, (np.where(weights > 0, means, 0) *
+                               weights).ravel(), minlength=n)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        new_means = np.where(new_weights > 0, sums / new_weights, np.nan)
+    return (new_means.reshape(shape + (size,)),
+            new_weights.reshape(shape + (size,)))
+
+
+def _scale(q, compression):
+    """ The centroid of each quantile, by the integer part of ``k(q)`` """
+    k = (compression / (2 * np.pi) * np.arcsin(np.clip(2 * q - 1, -1, 1)) +
+         compression / 4)
+    return np.clip(np.floor(k), 0, compression // 2).astype(np.intp)
+
+
+def _digest(means, weights, mins, maxes, shape, compression):
+    result = np.empty(shape, dtype=_tdigest_dtype(compression))
+    result['mean'] = means.reshape(shape + means.shape[-1:])
+    result['weight'] = weights.reshape(shape + weights.shape[-1:])
+    result['min'] = mins.reshape(shape)
+    result['max'] = maxes.reshape(shape)
+    return result
+
+
+def _to_last(x, axis):
+    """ Move the reduced axes of ``x`` to the end, flattened into one """
+    other = [i for i in range(x.ndim) if i not in axis]
+    x = x.transpose(other + list(axis))
+    shape = x.shape[:len(other)]
+    return x.reshape(shape + (int(np.prod(x.shape[len(other):])),))
+
+
+def _reduced_shape(shape, axis, keepdims):
+    if keepdims:
+        return tuple(1 if i in axis else n for i, n in enumerate(shape))
+    return tuple(n for i, n in enumerate(shape) if i not in axis)
+
+
+def _fmin_fmax(x):
+    if not x.shape[-1]:
+        nans = np.full(x.shape[:-1], np.nan)
+        return nans, nans
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        return np.fmin.reduce(x, axis=-1), np.fmax.reduce(x, axis=-1)
+
+
+def tdigest_chunk(x, axis=None, keepdims=False, compression=100):
+    """ T-digests of the data of a block, ignoring NaNs """
+    data = _to_last(np.asarray(x, dtype='f8'), axis)
+    shape = _reduced_shape(x.shape, axis, keepdims)
+    mins, maxes = _fmin_fmax(data)
+    if not data.shape[-1] or np.isnan(data).any():
+        means, weights = tdigest_compress(data, (~np.isnan(data)) * 1.0,
+                                          compression)
+        return _digest(means, weights, mins, maxes, shape, compression)
+
+    # Without NaNs, every digest has the same number of values, so the
+    # values of each centroid are those between the same ranks.  Gather them
+    # with a partition rather than a sort.
+    n = data.shape[-1]
+    size = int(compression // 2) + 1
+    # The first rank of each centroid, inverting ``k(q)``
+    q = (np.sin(2 * np.pi * (np.arange(1, size) - compression / 4) /
+                compression) + 1) / 2
+    bounds = np.concatenate([[0], np.clip(np.ceil(q * n - 0.5), 0, n), [n]])
+    bounds = bounds.astype(np.intp)
+    counts = np.diff(bounds)
+    bins = np.flatnonzero(counts)
+    starts = bounds[bins]
+    if len(starts) > 1:
+        data = np.partition(data, starts[1:], axis=-1)
+    means = np.full(data.shape[:-1] + (size,), np.nan)
+    weights = np.zeros(data.shape[:-1] + (size,))
+    means[..., bins] = np.add.reduceat(data, starts, axis=-1) / counts[bins]
+    weights[..., bins] = counts[bins]
+    return _digest(means, weights, mins, maxes, shape, compression)
+
+
+def tdigest_combine(digests, axis=None, keepdims=False, compression=100):
+    """ Merge t-digests along the given axes """
+    # The centroids of each digest are along an extra last axis
+    means = _to_last(digests['mean'], axis)
+    shape = means.shape[:-2] + (means.shape[-2] * means.shape[-1],)
+    means = means.reshape(shape)
+    weights = _to_last(digests['weight'], axis).reshape(shape)
+    mins, _ = _fmin_fmax(_to_last(digests['min'], axis))
+    _, maxes = _fmin_fmax(_to_last(digests['max'], axis))
+    means, weights = tdigest_compress(means, weights, compression)
+    return _digest(means, weights, mins, maxes,
+                   _reduced_shape(digests.shape, axis, keepdims), compression)
+
+
+def tdigest_percentile(digests, q):
+    """ Percentiles of t-digests
+
+    Interpolates linearly between the means of centroids, placed at the
+    middle of their weight, and the minimum and maximum.  Digests of
+    single values, and the 0th and 100th percentiles, give the same results
+    as ``np.percentile``.
+
+    Parameters
+    ----------
+    digests : np.ndarray
+        T-digests, as made by ``tdigest_chunk``
+    q : np.ndarray
+        Percentiles to compute, between 0 and 100
+
+    Returns
+    -------
+    np.ndarray with the percentiles along a new last axis, NaN for empty
+    digests
+    """
+    shape = digests.shape
+    size = digests.dtype['mean'].shape[0]
+    means, weights = _sort_centroids(digests['mean'].reshape((-1, size)),
+                                     digests['weight'].reshape((-1, size)))
+    mins = digests['min'].reshape((-1, 1))
+    maxes = digests['max'].reshape((-1, 1))
+    rows = np.arange(len(means))
+
+    cumulative = np.cumsum(weights, axis=1)
+    total = cumulative[:, -1:]
+    empty = ~(weights > 0)
+    # Anchors at the middle of each centroid, and at the minimum and maximum,
+    # the middles of the first and last values
+    positions = np.concatenate([np.full_like(total, 0.5),
+                                np.where(empty, total - 0.5,
+                                         cumulative - weights / 2),
+                                total - 0.5], axis=1)
+    values = np.concatenate([mins, np.where(empty, maxes, means), maxes],
+                            axis=1)
+
+    result = np.empty((len(means), len(q)))
+    for j, p in enumerate(q):
+        # Position of the percentile, as in ``np.percentile``
+        t = p / 100 * (total[:, 0] - 1) + 0.5
+        i = (positions <= t[:, None]).sum(axis=1) - 1
+        i = np.clip(i, 0, size)
+        p0, p1 = positions[rows, i], positions[rows, i + 1]
+        v0, v1 = values[rows, i], values[rows, i + 1]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            frac = np.where(p1 > p0, (t - p0) / (p1 - p0), 0)
+        result[:, j] = np.where(total[:, 0] > 0, v0 + frac * (v1 - v0),
+                                np.nan)
+    return result.reshape(shape + (len(q),))
+
+
+def tdigest_agg(digests, q=(), axis=None, keepdims=False, compression=100):
+    """ Percentiles of the merge of t-digests along the given axes """
+    digests = tdigest_combine(digests, axis=axis, keepdims=keepdims,
+                              compression=compression)
+    result = np.empty(digests.shape, dtype=[('q', 'f8', (len(q),))])
+    result['q'] = tdigest_percentile(digests, q)
+    return result
+
+
+def _percentiles_first(x, scalar):
+    x = x['q']
+    if scalar:
+        return x[..., 0]
+    return np.moveaxis(x, -1, 0)
+
+
+def approx_percentile(a, q, axis=None, compression=100, split_every=None):
+    """ Approximate percentiles, with mergeable t-digests
+
+    A t-digest of ``compression // 2 + 1`` centroids is computed for each
+    block, and these are merged in a tree reduction, so that memory stays
+    bounded however large the array.  Centroids are smaller near the tails of
+    the distribution, where accuracy matters most, so that extreme
+    percentiles are accurate.  Any number of percentiles may be computed
+    cheaply from the same digests.  NaNs are ignored, as in
+    ``np.nanpercentile``.
+
+    Parameters
+    ----------
+    a : Array
+    q : float or sequence of floats
+        Percentiles to compute, between 0 and 100
+    axis : int or tuple of ints, optional
+        Axes along which to compute the percentiles, all by default
+    compression : number, optional
+        Larger values give more accurate results with larger digests
+    split_every : int or dict, optional
+        As for other reductions like ``sum``
+
+    Returns
+    -------
+    Array of float64, with the percentiles along the first axis if ``q`` is a
+    sequence, as for ``np.percentile``
+
+    Examples
+    --------
+    >>> import dask.array as da
+    >>> x = da.arange(101, chunks=10)
+    >>> da.approx_percentile(x, [10, 50, 90]).compute()
+    array([ 10.,  50.,  90.])
+
+    See Also
+    --------
+    percentile
+    """
+    if compression < 2:
+        raise ValueError("compression must be at least 2, got %s"
+                         % compression)
+    q = np.asarray(q, dtype='f8')
+    scalar = q.ndim == 0
+    q = q.reshape(-1)
+    if ((q < 0) | (q > 100)).any():
+        raise ValueError("Percentiles must be in the range [0, 100]")
+
+    result = reduction(a, partial(tdigest_chunk, compression=compression),
+                       partial(tdigest_agg, q=tuple(q.tolist()),
+                               compression=compression),
+                       combine=partial(tdigest_combine,
+                                       compression=compression),
+                       axis=axis, keepdims=False, split_every=split_every,
+                       dtype=[('q', 'f8', (len(q),))],
+                       intermediate_dtype=_tdigest_dtype(compression),
+                       name='approx_percentile')
+    if scalar:
+        return result.map_blocks(_percentiles_first, scalar, dtype='f8')
+    return result.map_blocks(_percentiles_first, scalar, dtype='f8',
+                             new_axis=0, chunks=((len(q),),) + result.chunks)
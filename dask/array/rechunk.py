@@ -9,18 +9,26 @@ from __future__ import absolute_import, division, print_function
 
 import math
 import heapq
+import os
+import tempfile
+import uuid
 
+from collections import namedtuple
 from itertools import product, chain, count
+from multiprocessing import cpu_count
 from operator import getitem, add, mul, itemgetter
+from timeit import default_timer
 
 import numpy as np
 import toolz
 from toolz import accumulate, reduce
 
 from ..base import tokenize
-from .core import concatenate3, Array, normalize_chunks
+from ..context import _globals
+from ..utils import ignoring, memory_repr, asciitable
+from .core import concatenate3, Array, normalize_chunks, slices_from_chunks
 from .wrap import empty
-from .. import sharedict
+from .. import sharedict, threaded
 
 
 def cumdims_label(chunks, const):
@@ -203,10 +211,16 @@ def blockshape_dict_to_tuple(old_chunks, d):
 
 DEFAULT_THRESHOLD = 4
 DEFAULT_BLOCK_SIZE_LIMIT = 1e8
+DEFAULT_DISK_THRESHOLD = 10
+# The overhead of a task in seconds and the speed of copying memory in bytes
+# per second assumed when estimating the cost of a rechunk
+DEFAULT_TASK_OVERHEAD = 1e-4
+DEFAULT_BANDWIDTH = 1e9
 
 
 def rechunk(x, chunks, threshold=DEFAULT_THRESHOLD,
-            block_size_limit=DEFAULT_BLOCK_SIZE_LIMIT):
+            block_size_limit=DEFAULT_BLOCK_SIZE_LIMIT, method=None,
+            num_workers=None, memory_limit=None):
     """
     Convert blocks in dask array x for new chunks.
 
@@ -236,6 +250,24 @@ def rechunk(x, chunks, threshold=DEFAULT_THRESHOLD,
     block_size_limit: int
         The maximum block size (in bytes) we want to produce during an
         intermediate step
+    method: {'tasks', 'disk', 'auto'}, optional
+        Whether to rechunk with tasks in memory, or by writing the blocks to
+        a temporary file on disk and reading them back in the new chunks, see
+        ``rechunk_disk``.  With ``'auto'``, arrays larger than
+        ``block_size_limit`` go through disk if rechunking in memory would
+        take more than one intermediate step, or a graph more than
+        ``DEFAULT_DISK_THRESHOLD`` times the size of the input and output.
+        Only use the disk for numpy blocks, and with workers that share the
+        temporary directory.  Defaults to the ``rechunk_method`` option of
+        ``set_options``, or else to ``'tasks'``.
+    num_workers: int, optional
+        The number of tasks run at once, by default the number of cores if
+        ``memory_limit`` is given
+    memory_limit: int, optional
+        The memory (in bytes) the rechunk may use at once.  If given, the
+        plan expected to be fastest within this limit is chosen, see
+        ``explain_rechunk``.  With ``method='auto'``, the array is rechunked
+        on disk if no plan fits.
     """
     threshold = threshold or DEFAULT_THRESHOLD
     block_size_limit = block_size_limit or DEFAULT_BLOCK_SIZE_LIMIT
@@ -260,14 +292,55 @@ def rechunk(x, chunks, threshold=DEFAULT_THRESHOLD,
         if new != old and not math.isnan(old) and not math.isnan(new):
             raise ValueError("Provided chunks are not consistent with shape")
 
+    method = method or _globals.get('rechunk_method') or 'tasks'
+    if method == 'disk':
+        return rechunk_disk(x, chunks)
+    if method not in ('tasks', 'auto'):
+        raise NotImplementedError("Unknown rechunk method %s" % method)
+
     steps = plan_rechunk(x.chunks, chunks, x.dtype.itemsize,
-                         threshold, block_size_limit)
+                         threshold, block_size_limit, num_workers,
+                         memory_limit)
+    if method == 'auto' and _prefer_disk(x, steps, block_size_limit,
+                                         num_workers, memory_limit):
+        return rechunk_disk(x, chunks)
     for c in steps:
         x = _compute_rechunk(x, c)
 
     return x
 
 
+def _prefer_disk(x, steps, block_size_limit, num_workers=None,
+                 memory_limit=None):
+    """ Whether rechunking through disk is cheaper than the planned steps
+
+    This is the case for arrays larger than ``block_size_limit`` if the
+    graph is much larger than the input and output, or if more than one
+    intermediate rechunk is needed to stay within ``block_size_limit``, as
+    each copies the whole array.  It is also the case if the planned steps
+    are expected to use more than ``memory_limit``.
+    """
+    if (x.dtype.hasobject or
+            any(math.isnan(c) for c in chain(*x.chunks))):
+        return False
+    if memory_limit is not None:
+        cost = estimate_rechunk_cost(x.chunks, steps, x.dtype.itemsize,
+                                     num_workers or cpu_count())
+        if cost.memory > memory_limit:
+            return True
+    if x.nbytes < block_size_limit:
+        return False
+    if len(steps) > 2:
+        return True
+    graph_size = 0
+    chunks = x.chunks
+    for c in steps:
+        graph_size += estimate_graph_size(chunks, c)
+        chunks = c
+    linear_size = _number_of_blocks(x.chunks) + _number_of_blocks(chunks)
+    return graph_size > DEFAULT_DISK_THRESHOLD * linear_size
+
+
 def _number_of_blocks(chunks):
     return reduce(mul, map(len, chunks))
 
@@ -456,7 +529,8 @@ def find_split_rechunk(old_chunks, new_chunks, graph_size_limit):
 
 def plan_rechunk(old_chunks, new_chunks, itemsize,
                  threshold=DEFAULT_THRESHOLD,
-                 block_size_limit=DEFAULT_BLOCK_SIZE_LIMIT):
+                 block_size_limit=DEFAULT_BLOCK_SIZE_LIMIT,
+                 num_workers=None, memory_limit=None):
     """ Plan an iterative rechunking from *old_chunks* to *new_chunks*.
     The plan aims to minimize the rechunk graph size.
 
@@ -470,19 +544,39 @@ def plan_rechunk(old_chunks, new_chunks, itemsize,
     block_size_limit: int
         The maximum block size (in bytes) we want to produce during an
         intermediate step
+    num_workers: int, optional
+        The number of tasks run at once
+    memory_limit: int, optional
+        The memory (in bytes) the rechunk may use at once
+
+    If either of ``num_workers`` or ``memory_limit`` is given, several plans
+    are made with decreasing block size limits, and the plan expected to be
+    fastest within ``memory_limit`` is chosen, see ``estimate_rechunk_cost``
+    and ``explain_rechunk``.
 
     Notes
     -----
     No intermediate steps will be planned if any dimension of ``old_chunks``
     is unknown.
     """
-    ndim = len(new_chunks)
-    steps = []
-    has_nans = [any(math.isnan(y) for y in x) for x in old_chunks]
-
-    if ndim <= 1 or not all(new_chunks) or any(has_nans):
+    if _is_trivial(old_chunks, new_chunks):
         # Trivial array / unknown dim => no need / ability for an intermediate
-        return steps + [new_chunks]
+        return [new_chunks]
+    if num_workers is None and memory_limit is None:
+        return _plan_rechunk(old_chunks, new_chunks, itemsize, threshold,
+                             block_size_limit)
+    return _choose_plan(old_chunks, new_chunks, itemsize, threshold,
+                        block_size_limit, num_workers, memory_limit)[0]
+
+
+def _is_trivial(old_chunks, new_chunks):
+    return (len(new_chunks) <= 1 or not all(new_chunks) or
+            any(math.isnan(y) for y in chain(*old_chunks)))
+
+
+def _plan_rechunk(old_chunks, new_chunks, itemsize, threshold,
+                  block_size_limit):
+    steps = []
 
     # Make it a number ef elements
     block_size_limit /= itemsize
@@ -530,6 +624,181 @@ def plan_rechunk(old_chunks, new_chunks, itemsize,
     return steps + [new_chunks]
 
 
+RechunkCost = namedtuple('RechunkCost', ['ntasks', 'nbytes', 'memory',
+                                         'time'])
+
+
+def calibrate_rechunk(ntasks=1000, nbytes=2**24):
+    """ Measure the costs of rechunking on this machine
+
+    Runs a graph of ``ntasks`` trivial tasks on the threaded scheduler and
+    copies an array of ``nbytes`` bytes.  Pass the results to ``set_options``
+    for ``estimate_rechunk_cost`` to use them in place of the defaults.
+    Plans then depend on the timings, so they may differ between runs.
+
+    >>> with dask.set_options(**calibrate_rechunk()):  # doctest: +SKIP
+    ...     y = x.rechunk(chunks, memory_limit=2**30)
+
+    Returns
+    -------
+    Dict with the ``rechunk_task_overhead`` in seconds and the memory
+    ``rechunk_bandwidth`` in bytes per second
+    """
+    dsk = {('calibrate-rechunk', i): (getitem, (), slice(None))
+           for i in range(ntasks)}
+    start = default_timer()
+    threaded.get(dsk, list(dsk))
+    task_overhead = (default_timer() - start) / ntasks
+
+    a = np.ones(max(nbytes // 8, 1))
+    start = default_timer()
+    a.copy()
+    bandwidth = a.nbytes / max(default_timer() - start, 1e-9)
+
+    return {'rechunk_task_overhead': task_overhead,
+            'rechunk_bandwidth': bandwidth}
+
+
+def _largest_span(old, new):
+    """ Largest total width of the old chunks overlapping a new chunk """
+    old_bounds = np.cumsum((0,) + tuple(old))
+    new_bounds = np.cumsum((0,) + tuple(new))
+    first = np.searchsorted(old_bounds, new_bounds[:-1], side='right') - 1
+    last = np.searchsorted(old_bounds, new_bounds[1:], side='left')
+    last = np.maximum(last, first + 1)
+    return int((old_bounds[last] - old_bounds[first]).max())
+
+
+def estimate_rechunk_cost(old_chunks, steps, itemsize, num_workers=1,
+                          task_overhead=None, bandwidth=None):
+    """ Estimate the cost of rechunking from *old_chunks* through *steps*
+
+    Each step creates a task per piece of an old block and per new block,
+    and copies the whole array.  At once, each of ``num_workers`` workers
+    holds a new block along with all of the old blocks it is cut from.
+
+    Parameters
+    ----------
+    old_chunks: tuple
+        The chunks of the array
+    steps: list
+        The chunks after each step, as returned by ``plan_rechunk``
+    itemsize: int
+        The item size of the array
+    num_workers: int
+        The number of tasks run at once
+    task_overhead, bandwidth: float, optional
+        The overhead of a task in seconds and the speed of copying memory in
+        bytes per second.  Default to the ``rechunk_task_overhead`` and
+        ``rechunk_bandwidth`` options of ``set_options``, or else to
+        ``DEFAULT_TASK_OVERHEAD`` and ``DEFAULT_BANDWIDTH``.  These can be
+        measured with ``calibrate_rechunk``.
+
+    Returns
+    -------
+    RechunkCost of the number of tasks, the number of bytes copied, the peak
+    memory in bytes and the expected time in seconds
+    """
+    task_overhead = (task_overhead or _globals.get('rechunk_task_overhead') or
+                     DEFAULT_TASK_OVERHEAD)
+    bandwidth = (bandwidth or _globals.get('rechunk_bandwidth') or
+                 DEFAULT_BANDWIDTH)
+    nbytes = reduce(mul, map(sum, old_chunks), itemsize)
+    ntasks = memory = 0
+    chunks = old_chunks
+    for c in steps:
+        ntasks += estimate_graph_size(chunks, c)
+        inputs = reduce(mul, map(_largest_span, chunks, c), itemsize)
+        output = _largest_block_size(c) * itemsize
+        # Inputs and outputs never take more than the whole array each
+        memory = max(memory, min(num_workers * (inputs + output),
+                                 2 * nbytes))
+        chunks = c
+    moved = nbytes * len(steps)
+    time = ntasks * task_overhead + moved / (bandwidth * num_workers)
+    return RechunkCost(ntasks, moved, memory, time)
+
+
+def _candidate_plans(old_chunks, new_chunks, itemsize, threshold,
+                     block_size_limit):
+    """ Plans with successively halved block size limits, and the direct one
+    """
+    smallest = max(_largest_block_size(old_chunks),
+                   _largest_block_size(new_chunks)) * itemsize
+    plans = []
+    limit = block_size_limit
+    for i in range(8):
+        plan = _plan_rechunk(old_chunks, new_chunks, itemsize, threshold,
+                             limit)
+        if all(plan != p for _, p in plans):
+            plans.append(('limit %s' % memory_repr(limit), plan))
+        limit /= 2
+        if limit < smallest:
+            break
+    if all(len(p) > 1 for _, p in plans):
+        plans.append(('direct', [new_chunks]))
+    return plans
+
+
+def _choose_plan(old_chunks, new_chunks, itemsize, threshold,
+                 block_size_limit, num_workers=None, memory_limit=None):
+    """ The cheapest plan, with all candidates, their costs and the reason """
+    if num_workers is None:
+        num_workers = cpu_count()
+    plans = _candidate_plans(old_chunks, new_chunks, itemsize, threshold,
+                             block_size_limit)
+    costs = [estimate_rechunk_cost(old_chunks, plan, itemsize, num_workers)
+             for _, plan in plans]
+    candidates = [(cost, i) for i, cost in enumerate(costs)
+                  if memory_limit is None or cost.memory <= memory_limit]
+    if candidates:
+        _, best = min((cost.time, i) for cost, i in candidates)
+        if memory_limit is None:
+            reason = "Chose the fastest of %d plans" % len(plans)
+        else:
+            reason = ("Chose the fastest of %d plans within the memory limit of %s"
+                      % (len(candidates), memory_repr(memory_limit)))
+    else:
+        _, best = min((cost.memory, i) for i, cost in enumerate(costs))
+        reason = ("No plan fits within the memory limit of %s, chose the "
+                  "one using the least memory" % memory_repr(memory_limit))
+    return plans[best][1], plans, costs, best, reason
+
+
+def explain_rechunk(old_chunks, new_chunks, itemsize,
+                    threshold=DEFAULT_THRESHOLD,
+                    block_size_limit=DEFAULT_BLOCK_SIZE_LIMIT,
+                    num_workers=None, memory_limit=None):
+    """ Explain the choice of a rechunking plan
+
+    Lists the plans considered by ``plan_rechunk`` when choosing a plan by
+    its cost, with their estimated costs, and why the chosen plan was
+    chosen.  The parameters are those of ``plan_rechunk``.
+
+    >>> print(explain_rechunk(((10,) * 10, (100,)), ((100,), (10,) * 10),
+    ...                       itemsize=8, num_workers=4))  # doctest: +SKIP
+    +---+---------------+-------+-------+----------+----------+----------+------------------------------------+
+    |   | plan          | steps | tasks | copied   | memory   | time     | chunks                             |
+    +---+---------------+-------+-------+----------+----------+----------+------------------------------------+
+    | * | limit 95.4 MB | 2     | 44    | 156.2 KB | 156.2 KB | 0.0045 s | [([100], [100]), ([100], 10*[10])] |
+    |   | direct        | 1     | 121   | 78.1 KB  | 156.2 KB | 0.012 s  | [([100], 10*[10])]                 |
+    +---+---------------+-------+-------+----------+----------+----------+------------------------------------+
+    Chose the fastest of 2 plans
+    """
+    if _is_trivial(old_chunks, new_chunks):
+        return "No intermediate steps are needed or possible"
+    _, plans, costs, best, reason = _choose_plan(
+        old_chunks, new_chunks, itemsize, threshold, block_size_limit,
+        num_workers, memory_limit)
+    rows = [('*' if i == best else '', name, len(plan), cost.ntasks,
+             memory_repr(cost.nbytes), memory_repr(cost.memory),
+             '%.2g s' % cost.time, format_plan(plan))
+            for i, ((name, plan), cost) in enumerate(zip(plans, costs))]
+    table = asciitable(['', 'plan', 'steps', 'tasks', 'copied', 'memory',
+                        'time', 'chunks'], rows)
+    return table + '\n' + reason
+
+
 def _compute_rechunk(x, chunks):
     """ Compute the rechunk of *x* to the given *chunks*.
     """
@@ -585,6 +854,119 @@ def _compute_rechunk(x, chunks):
     return Array(x2, merge_temp_name, chunks, dtype=x.dtype)
 
 
+class _ScratchFile(object):
+    """ A temporary ``.npy`` file, to hold an array while it is rechunked
+
+    The file is removed when this object is garbage collected.  Copies made
+    by pickling, as happens when tasks are sent to other processes, don't
+    remove it.
+    """
+    def __init__(self, shape, dtype, fortran_order=False, dirname=None):
+        dirname = (dirname or _globals.get('temporary_directory') or
+                   tempfile.gettempdir())
+        self.path = os.path.join(dirname,
+                                 'dask-rechunk-%s.npy' % uuid.uuid4().hex)
+        self.shape = shape
+        self.dtype = dtype
+        self.fortran_order = fortran_order
+        self._owner = True
+        self._mmap = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_owner'] = False
+        state['_mmap'] = None
+        return state
+
+    def create(self):
+        self._mmap = np.lib.format.open_memmap(
+            self.path, mode='w+', dtype=self.dtype, shape=self.shape,
+            fortran_order=self.fortran_order)
+
+    def mmap(self):
+        """ The file mapped into memory, once per process """
+        if self._mmap is None:
+            self._mmap = np.load(self.path, mmap_mode='r+')
+        return self._mmap
+
+    def __del__(self):
+        self._mmap = None
+        if self._owner:
+            with ignoring(OSError):
+                os.remove(self.path)
+
+
+def _create_scratch(scratch):
+    scratch.create()
+
+
+def _write_block(scratch, slices, block, created):
+    if type(block) is not np.ndarray and not np.isscalar(block):
+        raise TypeError("Rechunking through disk only supports numpy arrays, "
+                        "got %s.  Use rechunk(..., method='tasks')"
+                        % type(block).__name__)
+    scratch.mmap()[slices] = block
+
+
+def _barrier(args):
+    return None
+
+
+def _read_block(scratch, slices, written):
+    return np.array(scratch.mmap()[slices])
+
+
+def rechunk_disk(x, chunks, dirname=None):
+    """ Rechunk through a temporary file on disk
+
+    Every block of ``x`` is written to a memory mapped ``.npy`` file, which
+    is read back in blocks of the new ``chunks`` once all are written.  The
+    graph grows linearly with the number of blocks, and every task holds a
+    single block in memory, however different the old and new chunks are,
+    at the cost of writing the array to disk.
+
+    The file is created in the ``temporary_directory`` of ``set_options``,
+    or else in the default temporary directory, and is removed when the
+    returned array is garbage collected.  With the distributed scheduler this
+    directory must be shared by all workers.  Only arrays of numpy arrays are
+    supported.
+
+    >>> import dask.array as da
+    >>> x = da.ones((6, 6), chunks=(1, 6))
+    >>> rechunk_disk(x, (6, 1)).chunks
+    ((6,), (1, 1, 1, 1, 1, 1))
+    """
+    chunks = normalize_chunks(chunks, x.shape)
+    if x.size == 0:
+        return empty(x.shape, chunks=chunks, dtype=x.dtype)
+
+    # Lay the file out so that the new blocks are read contiguously where
+    # possible
+    fortran_order = x.ndim > 1 and max(chunks[-1]) < max(x.chunks[-1])
+    scratch = _ScratchFile(x.shape, x.dtype, fortran_order, dirname)
+
+    token = tokenize(x, chunks)
+    create = ('rechunk-create-' + token,)
+    write_name = 'rechunk-write-' + token
+    barrier = ('rechunk-barrier-' + token,)
+    name = 'rechunk-disk-' + token
+
+    dsk = {create: (_create_scratch, scratch)}
+    writes = []
+    for index, slices in zip(product(*map(range, x.numblocks)),
+                             slices_from_chunks(x.chunks)):
+        key = (write_name,) + index
+        dsk[key] = (_write_block, scratch, slices, (x.name,) + index, create)
+        writes.append(key)
+    dsk[barrier] = (_barrier, writes)
+    for index, slices in zip(product(*map(range, map(len, chunks))),
+                             slices_from_chunks(chunks)):
+        dsk[(name,) + index] = (_read_block, scratch, slices, barrier)
+
+    return Array(sharedict.merge(x.dask, (name, dsk)), name, chunks,
+                 dtype=x.dtype)
+
+
 class _PrettyBlocks(object):
 
     def __init__(self, blocks):
@@ -38,10 +38,21 @@ def divide(a, b, dtype=None):
 
 
 def reduction(x, chunk, aggregate, axis=None, keepdims=None, dtype=None,
-              split_every=None, combine=None, name=None, out=None):
+              split_every=None, combine=None, name=None, out=None,
+              intermediate_dtype=None, intermediate_size=1):
     """ General version of reductions
 
     >>> reduction(my_array, np.sum, np.sum, axis=0, keepdims=False)  # doctest: +SKIP
+
+    The results of ``chunk`` are combined in a tree, ``split_every`` blocks
+    at a time, which may be given per axis as a dict.  It defaults to the
+    ``split_every`` option of ``set_options``, or else to 4.  With
+    ``'auto'`` it is chosen from the size of the results of ``chunk`` and
+    ``combine``, see ``auto_split_every``.  These results are taken to be of
+    ``intermediate_dtype``, by default ``dtype``, with ``intermediate_size``
+    elements along each reduced axis, by default 1.  Give more for
+    reductions whose intermediates keep several elements, like the largest
+    ``k`` of a top-k.
     """
     if axis is None:
         axis = tuple(range(x.ndim))
@@ -63,11 +74,86 @@ def reduction(x, chunk, aggregate, axis=None, keepdims=None, dtype=None,
     tmp._chunks = tuple((1, ) * len(c) if i in axis else c for (i, c)
                         in enumerate(tmp.chunks))
 
+    split_every = split_every or _globals.get('split_every', 4)
+    if split_every == 'auto':
+        chunks = tuple((intermediate_size,) * len(c) if i in axis else c
+                       for (i, c) in enumerate(x.chunks))
+        itemsize = np.dtype(intermediate_dtype or dtype).itemsize
+        split_every = auto_split_every(chunks, axis, itemsize)
     result = _tree_reduce(tmp, aggregate, axis, keepdims, dtype, split_every,
                           combine, name=name)
     return handle_out(out, result)
 
 
+# The fan-in of tree reductions with ``split_every='auto'`` is at most this
+AUTO_SPLIT_EVERY_MAX = 32
+
+# The total size in bytes of the intermediate results that are combined by a
+# single task with ``split_every='auto'``
+DEFAULT_COMBINE_SIZE = 2**27
+
+
+def auto_split_every(chunks, axis, itemsize, combine_size=None):
+    """ Choose the fan-in of a tree reduction from the size of intermediates
+
+    Combines as many intermediate results at once as fit within
+    ``combine_size`` bytes, between 2 and ``AUTO_SPLIT_EVERY_MAX``.  The
+    fan-in is spread over the reduced axes, giving no more to an axis than
+    it has blocks.
+
+    Parameters
+    ----------
+    chunks : tuple
+        The chunks of the intermediate results, with one block along each of
+        the reduced axes per block of the input
+    axis : tuple
+        The reduced axes
+    itemsize : int
+        The itemsize of the intermediate results
+    combine_size : int, optional
+        Defaults to the ``reduction_combine_size`` option of
+        ``set_options``, or else to ``DEFAULT_COMBINE_SIZE``
+
+    Returns
+    -------
+    Dict mapping axes to fan-in, usable as the ``split_every`` of reductions
+
+    Examples
+    --------
+    Tiny intermediates are combined many at once
+
+    >>> auto_split_every(((1,) * 100, (1000,) * 4), axis=(0,), itemsize=8)
+    {0: 32}
+
+    Large ones only two at a time
+
+    >>> auto_split_every(((1,) * 100, (10**7,)), axis=(0,), itemsize=8)
+    {0: 2}
+    """
+    combine_size = combine_size or _globals.get('reduction_combine_size',
+                                                DEFAULT_COMBINE_SIZE)
+    block = itemsize
+    for c in chunks:
+        if c:
+            block *= builtins.max(c)
+    if block != block:   # unknown chunks
+        fan_in = 4
+    else:
+        fan_in = int(combine_size // builtins.max(block, 1))
+    fan_in = builtins.min(builtins.max(fan_in, 2), AUTO_SPLIT_EVERY_MAX)
+
+    split_every = {}
+    axes = sorted(axis, key=lambda i: len(chunks[i]))
+    for k, i in enumerate(axes):
+        share = int(round(fan_in ** (1 / (len(axes) - k))))
+        n = builtins.max(builtins.min(share, len(chunks[i])), 1)
+        if len(chunks[i]) > 1:
+            n = builtins.max(n, 2)
+        split_every[i] = n
+        fan_in = builtins.max(fan_in // n, 1)
+    return split_every
+
+
 def _tree_reduce(x, aggregate, axis, keepdims, dtype, split_every=None,
                  combine=None, name=None):
     """Perform the tree reduction step of a reduction.
@@ -76,6 +162,8 @@ def _tree_reduce(x, aggregate, axis, keepdims, dtype, split_every=None,
     """
     # Normalize split_every
     split_every = split_every or _globals.get('split_every', 4)
+    if split_every == 'auto':
+        split_every = auto_split_every(x.chunks, axis, x.dtype.itemsize)
     if isinstance(split_every, dict):
         split_every = dict((k, split_every.get(k, 2)) for k in axis)
     elif isinstance(split_every, int):
@@ -264,6 +352,11 @@ def mean_agg(pair, dtype='f8', **kwargs):
                   pair['n'].sum(dtype=dtype, **kwargs), dtype=dtype)
 
 
+def _mean_dtype(dtype):
+    """ The dtype of the results of ``mean_chunk`` """
+    return np.dtype([('total', dtype), ('n', dtype)])
+
+
 @wraps(chunk.mean)
 def mean(a, axis=None, dtype=None, keepdims=False, split_every=None, out=None):
     if dtype is not None:
@@ -272,7 +365,7 @@ def mean(a, axis=None, dtype=None, keepdims=False, split_every=None, out=None):
         dt = np.mean(np.empty(shape=(1,), dtype=a.dtype)).dtype
     return reduction(a, mean_chunk, mean_agg, axis=axis, keepdims=keepdims,
                      dtype=dt, split_every=split_every, combine=mean_combine,
-                     out=out)
+                     out=out, intermediate_dtype=_mean_dtype(dt))
 
 
 def nanmean(a, axis=None, dtype=None, keepdims=False, split_every=None,
@@ -284,7 +377,8 @@ def nanmean(a, axis=None, dtype=None, keepdims=False, split_every=None,
     return reduction(a, partial(mean_chunk, sum=chunk.nansum, numel=nannumel),
                      mean_agg, axis=axis, keepdims=keepdims, dtype=dt,
                      split_every=split_every, out=out,
-                     combine=partial(mean_combine, sum=chunk.nansum, numel=nannumel))
+                     combine=partial(mean_combine, sum=chunk.nansum, numel=nannumel),
+                     intermediate_dtype=_mean_dtype(dt))
 
 
 with ignoring(AttributeError):
@@ -308,6 +402,12 @@ def moment_chunk(A, order=2, sum=chunk.sum, numel=numel, dtype='f8', **kwargs):
     return result
 
 
+def _moment_dtype(dtype, order=2):
+    """ The dtype of the results of ``moment_chunk`` """
+    return np.dtype([('total', dtype), ('n', np.int64),
+                     ('M', dtype, (order - 1,))])
+
+
 def _moment_helper(Ms, ns, inner_term, order, sum, kwargs):
     M = Ms[..., order - 2].sum(**kwargs) + sum(ns * inner_term ** order, **kwargs)
     for k in range(1, order - 1):
@@ -382,7 +482,8 @@ def moment(a, order, axis=None, dtype=None, keepdims=False, ddof=0,
                      partial(moment_agg, order=order, ddof=ddof),
                      axis=axis, keepdims=keepdims,
                      dtype=dt, split_every=split_every, out=out,
-                     combine=partial(moment_combine, order=order))
+                     combine=partial(moment_combine, order=order),
+                     intermediate_dtype=_moment_dtype(dt, order))
 
 
 @wraps(chunk.var)
@@ -394,7 +495,8 @@ def var(a, axis=None, dtype=None, keepdims=False, ddof=0, split_every=None,
         dt = np.var(np.ones(shape=(1,), dtype=a.dtype)).dtype
     return reduction(a, moment_chunk, partial(moment_agg, ddof=ddof), axis=axis,
                      keepdims=keepdims, dtype=dt, split_every=split_every,
-                     combine=moment_combine, name='var', out=out)
+                     combine=moment_combine, name='var', out=out,
+                     intermediate_dtype=_moment_dtype(dt))
 
 
 def nanvar(a, axis=None, dtype=None, keepdims=False, ddof=0, split_every=None,
@@ -406,7 +508,8 @@ def nanvar(a, axis=None, dtype=None, keepdims=False, ddof=0, split_every=None,
     return reduction(a, partial(moment_chunk, sum=chunk.nansum, numel=nannumel),
                      partial(moment_agg, sum=np.nansum, ddof=ddof), axis=axis,
                      keepdims=keepdims, dtype=dt, split_every=split_every,
-                     combine=partial(moment_combine, sum=np.nansum), out=out)
+                     combine=partial(moment_combine, sum=np.nansum), out=out,
+                     intermediate_dtype=_moment_dtype(dt))
 
 
 with ignoring(AttributeError):
@@ -436,6 +539,141 @@ with ignoring(AttributeError):
     nanstd = wraps(chunk.nanstd)(nanstd)
 
 
+# Statistics computed by ``aggregate``, and those computed by a chunk function
+# of the same name
+aggregations = ('min', 'max', 'sum', 'prod', 'mean', 'var', 'std')
+_simple_aggregations = ('min', 'max', 'sum', 'prod')
+
+
+def _records(parts):
+    """ Join arrays of the same leading shape into one structured array """
+    shape = parts[0][1].shape
+    empty = empty_lookup.dispatch(type(parts[0][1]))
+    result = empty(shape, dtype=[(name, x.dtype, x.shape[len(shape):])
+                                 for name, x in parts])
+    for name, x in parts:
+        result[name] = x
+    return result
+
+
+def _moments(parts, data):
+    if 'M' in data.dtype.names:
+        return parts + [(k, data[k]) for k in ('total', 'n', 'M')]
+    if 'total' in data.dtype.names:
+        return parts + [(k, data[k]) for k in ('total', 'n')]
+    return parts
+
+
+def aggregate_chunk(x, funcs=(), moment_dtype='f8', **kwargs):
+    parts = [(f, getattr(chunk, f)(x, **kwargs))
+             for f in _simple_aggregations if f in funcs]
+    if 'var' in funcs or 'std' in funcs:
+        data = moment_chunk(x, dtype=moment_dtype, **kwargs)
+    elif 'mean' in funcs:
+        data = mean_chunk(x, dtype=moment_dtype, **kwargs)
+    else:
+        return _records(parts)
+    return _records(_moments(parts, data))
+
+
+def aggregate_combine(data, funcs=(), moment_dtype='f8', **kwargs):
+    parts = [(f, getattr(chunk, f)(data[f], **kwargs))
+             for f in _simple_aggregations if f in funcs]
+    if 'M' in data.dtype.names:
+        data = moment_combine(data, dtype=moment_dtype, **kwargs)
+    elif 'total' in data.dtype.names:
+        data = mean_combine(data, dtype=moment_dtype, **kwargs)
+    else:
+        return _records(parts)
+    return _records(_moments(parts, data))
+
+
+def aggregate_agg(data, dtypes=(), ddof=0, **kwargs):
+    parts = []
+    for f, dt in dtypes:
+        if f in _simple_aggregations:
+            result = getattr(chunk, f)(data[f], **kwargs)
+        elif f == 'mean':
+            result = mean_agg(data, dtype=dt, **kwargs)
+        else:
+            result = moment_agg(data, ddof=ddof, dtype=dt, **kwargs)
+            if f == 'std':
+                result = np.sqrt(result)
+        parts.append((f, np.asanyarray(result).astype(dt, copy=False)))
+    return _records(parts)
+
+
+def aggregate(a, funcs, axis=None, keepdims=False, ddof=0, split_every=None):
+    """ Compute several reductions at once, in a single pass over the data
+
+    The reductions share one tree of tasks, so that the chunks of ``a`` are
+    only computed and read once, rather than once per reduction.
+
+    Parameters
+    ----------
+    a : Array
+    funcs : list of str
+        The names of the reductions, from ``'min'``, ``'max'``, ``'sum'``,
+        ``'prod'``, ``'mean'``, ``'var'`` and ``'std'``
+    axis, keepdims, split_every :
+        As for other reductions like ``sum``
+    ddof : int, optional
+        Delta degrees of freedom of ``var`` and ``std``
+
+    Returns
+    -------
+    A tuple of arrays, one per reduction in ``funcs``.  These should be
+    computed together, with ``dask.compute``.
+
+    Examples
+    --------
+    >>> import dask
+    >>> import dask.array as da
+    >>> x = da.arange(10, chunks=5)
+    >>> lo, hi, mean = da.aggregate(x, ['min', 'max', 'mean'])
+    >>> dask.compute(lo, hi, mean)
+    (0, 9, 4.5)
+    """
+    funcs = list(funcs)
+    for f in funcs:
+        if f not in aggregations:
+            raise ValueError("Unknown reduction %r, expected one of %s"
+                             % (f, ', '.join(aggregations)))
+    if not funcs:
+        return ()
+    unique = sorted(set(funcs), key=funcs.index)
+    sample = np.empty((1,), dtype=a.dtype)
+    dtypes = [(f, getattr(np, f)(sample).dtype) for f in unique]
+    if 'var' in funcs or 'std' in funcs:
+        moment_dtype = np.var(sample).dtype
+    else:
+        moment_dtype = np.mean(sample).dtype
+
+    intermediate = [(f, dt) for f, dt in dtypes if f in _simple_aggregations]
+    if 'var' in funcs or 'std' in funcs:
+        intermediate += _moment_dtype(moment_dtype).descr
+    elif 'mean' in funcs:
+        intermediate += _mean_dtype(moment_dtype).descr
+
+    result = reduction(a, partial(aggregate_chunk, funcs=unique,
+                                  moment_dtype=moment_dtype),
+                       partial(aggregate_agg, dtypes=dtypes, ddof=ddof),
+                       axis=axis, keepdims=keepdims, dtype=dtypes,
+                       split_every=split_every, name='aggregate',
+                       combine=partial(aggregate_combine, funcs=unique,
+                                       moment_dtype=moment_dtype),
+                       intermediate_dtype=intermediate)
+    dtypes = dict(dtypes)
+    return tuple(result.map_blocks(_getfield, f, dtype=dtypes[f])
+                 for f in funcs)
+
+
+def _getfield(x, name):
+    x = x[name]
+    # Full reductions give scalars, as do other reductions
+    return x[()] if x.ndim == 0 else x
+
+
 def vnorm(a, ord=None, axis=None, dtype=None, keepdims=False, split_every=None,
           out=None):
     """ Vector norm
@@ -578,6 +816,11 @@ def arg_reduction(x, chunk, combine, agg, axis=None, split_every=None, out=None)
     # The dtype of `tmp` doesn't actually matter, just need to provide something
     tmp = Array(sharedict.merge(x.dask, (name, dsk)), name, chunks, dtype=x.dtype)
     dtype = np.argmin([1]).dtype
+    split_every = split_every or _globals.get('split_every', 4)
+    if split_every == 'auto':
+        # Intermediates hold both values and indices
+        split_every = auto_split_every(chunks, axis,
+                                       x.dtype.itemsize + dtype.itemsize)
     result = _tree_reduce(tmp, agg, axis, False, dtype, split_every, combine)
     return handle_out(out, result)
 
@@ -627,20 +870,31 @@ nanargmin = make_arg_reduction(chunk.nanmin, _nanargmin, True)
 nanargmax = make_arg_reduction(chunk.nanmax, _nanargmax, True)
 
 
-def cumreduction(func, binop, ident, x, axis=None, dtype=None, out=None):
+def cumreduction(func, binop, ident, x, axis=None, dtype=None, out=None,
+                 method='blelloch'):
     """ Generic function for cumulative reduction
 
+    Each block is first scanned with ``func``.  The last values of the
+    blocks are then scanned with ``binop`` and combined with the blocks that
+    follow them.
+
     Parameters
     ----------
     func: callable
         Cumulative function like np.cumsum or np.cumprod
     binop: callable
-        Associated binary operator like ``np.cumsum->add`` or ``np.cumprod->mul``
+        Associated binary operator like ``np.cumsum->add`` or ``np.cumprod->mul``.
+        It must be associative, but needn't be commutative.
     ident: Number
         Associated identity like ``np.cumsum->0`` or ``np.cumprod->1``
     x: dask Array
     axis: int
     dtype: dtype
+    method: {'blelloch', 'sequential'}
+        How to scan the last values of the blocks.  ``'blelloch'`` uses a
+        work-efficient parallel scan, whose longest chain of dependent tasks
+        grows as ``log(n)`` in the number of blocks ``n``.  ``'sequential'``
+        carries the total from block to block, a chain of length ``n``.
 
     Returns
     -------
@@ -650,6 +904,7 @@ def cumreduction(func, binop, ident, x, axis=None, dtype=None, out=None):
     --------
     cumsum
     cumprod
+    prefix_scan
     """
     if axis is None:
         x = x.flatten()
@@ -658,14 +913,38 @@ def cumreduction(func, binop, ident, x, axis=None, dtype=None, out=None):
         dtype = func(np.empty((0,), dtype=x.dtype)).dtype
     assert isinstance(axis, int)
     axis = validate_axis(x.ndim, axis)
+    if method not in ('blelloch', 'sequential'):
+        raise ValueError("Unknown method %r, expected 'blelloch' or "
+                         "'sequential'" % method)
 
     m = x.map_blocks(func, axis=axis, dtype=dtype)
 
-    name = '%s-axis=%d-%s' % (func.__name__, axis, tokenize(x, dtype))
+    name = '%s-axis=%d-%s' % (func.__name__, axis, tokenize(x, dtype, method))
     n = x.numblocks[axis]
     full = slice(None, None, None)
     slc = (full,) * axis + (slice(-1, None),) + (full,) * (x.ndim - axis - 1)
 
+    if method == 'blelloch':
+        dsk = dict()
+        lanes = product(*[range(nb) if i != axis else [None]
+                          for i, nb in enumerate(x.numblocks)])
+        for lane in lanes:
+            def index(i):
+                return lane[:axis] + (i,) + lane[axis + 1:]
+
+            totals = [(operator.getitem, (m.name,) + index(i), slc)
+                      for i in range(n - 1)]
+            prefixes = prefix_scan(dsk, binop, totals,
+                                   lambda *k: (name, 'scan') + k + lane[:axis] +
+                                   lane[axis + 1:])
+            dsk[(name,) + index(0)] = (m.name,) + index(0)
+            for i in range(1, n):
+                dsk[(name,) + index(i)] = (binop, prefixes[i - 1],
+                                           (m.name,) + index(i))
+        result = Array(sharedict.merge(m.dask, (name, dsk)), name, x.chunks,
+                       m.dtype)
+        return handle_out(out, result)
+
     indices = list(product(*[range(nb) if i != axis else [0]
                              for i, nb in enumerate(x.numblocks)]))
     dsk = dict()
@@ -689,6 +968,63 @@ def cumreduction(func, binop, ident, x, axis=None, dtype=None, out=None):
     return handle_out(out, result)
 
 
+def prefix_scan(dsk, binop, keys, make_key):
+    """ Add tasks for the inclusive prefix scan of the values of keys
+
+    A work-efficient parallel scan: neighbouring values are combined in
+    pairs, the pairs are scanned recursively, and the scan of the pairs
+    completes the values in between.  This takes fewer than ``2 * n`` calls
+    to ``binop``, with chains of at most ``2 * log2(n)`` of them.  ``binop``
+    must be associative, and is always called with the earlier value first.
+
+    Parameters
+    ----------
+    dsk : dict
+        Graph to add the tasks to
+    binop : callable
+    keys : list
+        Keys of the values to scan, in order, or cheap tasks that compute
+        them
+    make_key : callable
+        Makes a key for a new task from ``(phase, level, position)``
+
+    Returns
+    -------
+    List of the keys of the prefixes, the first of which is ``keys[0]``
+
+    Examples
+    --------
+    >>> from operator import add
+    >>> from dask.core import get
+    >>> dsk = dict((('x', i), i) for i in range(1, 6))
+    >>> prefixes = prefix_scan(dsk, add, sorted(dsk), lambda *k: ('s',) + k)
+    >>> get(dsk, prefixes)
+    (1, 3, 6, 10, 15)
+    """
+    return _prefix_scan(dsk, binop, list(keys), make_key, 0)
+
+
+def _prefix_scan(dsk, binop, keys, make_key, level):
+    n = len(keys)
+    if n <= 1:
+        return keys
+    pairs = []
+    for j in range(n // 2):
+        key = make_key('up', level, j)
+        dsk[key] = (binop, keys[2 * j], keys[2 * j + 1])
+        pairs.append(key)
+    sums = _prefix_scan(dsk, binop, pairs, make_key, level + 1)
+    prefixes = [keys[0]]
+    for i in range(1, n):
+        if i % 2:
+            prefixes.append(sums[i // 2])
+        else:
+            key = make_key('down', level, i)
+            dsk[key] = (binop, sums[i // 2 - 1], keys[i])
+            prefixes.append(key)
+    return prefixes
+
+
 def _cumsum_merge(a, b):
     if isinstance(a, np.ma.masked_array) or isinstance(b, np.ma.masked_array):
         values = np.ma.getdata(a) + np.ma.getdata(b)
@@ -704,13 +1040,15 @@ def _cumprod_merge(a, b):
 
 
 @wraps(np.cumsum)
-def cumsum(x, axis=None, dtype=None, out=None):
-    return cumreduction(np.cumsum, _cumsum_merge, 0, x, axis, dtype, out=out)
+def cumsum(x, axis=None, dtype=None, out=None, method='blelloch'):
+    return cumreduction(np.cumsum, _cumsum_merge, 0, x, axis, dtype, out=out,
+                        method=method)
 
 
 @wraps(np.cumprod)
-def cumprod(x, axis=None, dtype=None, out=None):
-    return cumreduction(np.cumprod, _cumprod_merge, 1, x, axis, dtype, out=out)
+def cumprod(x, axis=None, dtype=None, out=None, method='blelloch'):
+    return cumreduction(np.cumprod, _cumprod_merge, 1, x, axis, dtype, out=out,
+                        method=method)
 
 
 def validate_axis(ndim, axis):
@@ -195,7 +195,7 @@ def _tensordot(a, b, axes):
 
 
 @wraps(np.tensordot)
-def tensordot(lhs, rhs, axes=2):
+def tensordot(lhs, rhs, axes=2, split_every=None):
     if isinstance(axes, Iterable):
         left_axes, right_axes = axes
     else:
@@ -221,12 +221,15 @@ def tensordot(lhs, rhs, axes=2):
         out_index.remove(right_index[r])
         right_index[r] = left_index[l]
 
+    # Partial products of pairs of blocks, each with a single element along
+    # the contracted axes, that are then summed in a tree reduction
     intermediate = atop(_tensordot, out_index,
                         lhs, left_index,
                         rhs, right_index, dtype=dt,
+                        adjust_chunks={left_index[l]: 1 for l in left_axes},
                         axes=(left_axes, right_axes))
 
-    result = intermediate.sum(axis=left_axes)
+    result = intermediate.sum(axis=left_axes, split_every=split_every)
     return result
 
 
@@ -250,8 +253,12 @@ def _inner_apply_along_axis(arr,
     )
 
 
+def _matmul(a, b):
+    return np.matmul(a, b)[..., np.newaxis]
+
+
 @wraps(np.matmul)
-def matmul(a, b):
+def matmul(a, b, split_every=None):
     a = asanyarray(a)
     b = asanyarray(b)
 
@@ -273,13 +280,18 @@ def matmul(a, b):
     elif a.ndim > b.ndim:
         b = b[(a.ndim - b.ndim) * (np.newaxis,)]
 
+    # Multiply pairs of blocks rather than whole rows and columns of blocks,
+    # and sum the partial products in a tree reduction, to bound the memory
+    # of every task
+    dt = result_type(a, b)
     out = atop(
-        np.matmul, tuple(range(1, a.ndim + 1)),
+        _matmul, tuple(range(1, a.ndim + 1)) + (0,),
         a, tuple(range(1, a.ndim - 1)) + (a.ndim - 1, 0,),
         b, tuple(range(1, a.ndim - 1)) + (0, a.ndim,),
-        dtype=result_type(a, b),
-        concatenate=True
+        dtype=dt,
+        adjust_chunks={0: 1}
     )
+    out = out.sum(axis=-1, dtype=dt, split_every=split_every)
 
     if a_is_1d:
         out = out[..., 0, :]
@@ -884,6 +896,247 @@ def topk(k, x):
     return Array(sharedict.merge((name2, dsk), x.dask), name2, chunks, dtype=x.dtype)
 
 
+def sort(a, axis=-1):
+    """ Sort an array along an axis
+
+    One-dimensional arrays, or all elements if ``axis`` is None, are sorted
+    with a sample sort: every block is sorted, regularly spaced samples of
+    the sorted blocks give splitters between as many buckets as there are
+    blocks, and each bucket merges the pieces of the blocks between its
+    splitters.  Equal values are ordered by their block and position, so
+    that runs of a repeated value are spread over several buckets.  As for a
+    parallel sort by regular sampling, no bucket holds more than about twice
+    the elements of a block.  The sizes of the output chunks are unknown.
+
+    Arrays of more dimensions are rechunked so that each block spans
+    ``axis``, and sorted within blocks.  The size of these blocks is not
+    bounded by that of the blocks of ``a``.
+
+    Examples
+    --------
+    >>> x = from_array(np.array([5, 1, 3, 6, 2, 4]), chunks=2)
+    >>> sort(x).compute()
+    array([1, 2, 3, 4, 5, 6])
+
+    See Also
+    --------
+    argsort
+    searchsorted
+    """
+    return _sort(a, axis, 'sort')
+
+
+def argsort(a, axis=-1):
+    """ Indices that sort an array along an axis
+
+    The sort is stable, and works as ``sort`` does.  For one-dimensional
+    arrays the sizes of the chunks of ``a`` must be known.
+
+    Examples
+    --------
+    >>> x = from_array(np.array([5, 1, 3, 6, 2, 4]), chunks=2)
+    >>> argsort(x).compute()
+    array([1, 4, 2, 5, 0, 3])
+
+    See Also
+    --------
+    sort
+    """
+    return _sort(a, axis, 'argsort')
+
+
+def _sort(a, axis, method):
+    a = asarray(a)
+    if axis is None:
+        a = a.ravel()
+        axis = 0
+    if not -a.ndim <= axis < a.ndim:
+        raise ValueError('axis=(%s) out of bounds' % axis)
+    if axis < 0:
+        axis += a.ndim
+
+    if a.ndim > 1 or a.numblocks[0] <= 1:
+        # The buckets of different lanes would differ in size, so sort whole
+        # lanes instead
+        if a.numblocks[axis] > 1:
+            a = a.rechunk({axis: a.shape[axis]})
+        if method == 'sort':
+            return a.map_blocks(partial(np.sort, axis=axis), dtype=a.dtype)
+        return a.map_blocks(partial(np.argsort, axis=axis, kind='mergesort'),
+                            dtype=np.intp)
+
+    if method == 'argsort' and any(np.isnan(c) for c in a.chunks[0]):
+        raise ValueError("argsort needs the sizes of the chunks of the array "
+                         "to be known")
+
+    token = tokenize(a, method)
+    name = method + '-' + token
+    local = 'sort-local-' + token
+    sample = 'sort-sample-' + token
+    splitters = ('sort-splitters-' + token, 0)
+    split = 'sort-split-' + token
+
+    n = a.numblocks[0]
+    nsamples = min(n, _MAX_SORT_SAMPLES)
+    offsets = np.cumsum((0,) + a.chunks[0][:-1])
+    dsk = {}
+    for i, key in enumerate(a.__dask_keys__()):
+        if method == 'sort':
+            dsk[(local, i)] = (np.sort, key)
+            values = (local, i)
+        else:
+            dsk[(local, i)] = (_argsort_block, key, int(offsets[i]))
+            values = (getitem, (local, i), 0)
+        dsk[(sample, i)] = (_sort_sample, values, nsamples, i)
+        dsk[(split, i)] = (_sort_split, (local, i), splitters, i)
+    dsk[splitters] = (_sort_splitters, [(sample, i) for i in range(n)], n)
+    for j in range(n):
+        dsk[(name, j)] = (_sort_merge,
+                          [(getitem, (split, i), j) for i in range(n)])
+
+    dtype = a.dtype if method == 'sort' else np.dtype(np.intp)
+    return Array(sharedict.merge(a.dask, (name, dsk)), name,
+                 ((np.nan,) * n,), dtype=dtype)
+
+
+# Most samples taken from each block to choose the splitters of a sort
+_MAX_SORT_SAMPLES = 256
+
+
+def _argsort_block(x, offset):
+    """ Sorted values of a block and their indices in the whole array
+
+    >>> _argsort_block(np.array([3, 1, 2]), 10)
+    (array([1, 2, 3]), array([11, 12, 10]))
+    """
+    idx = np.argsort(x, kind='mergesort')
+    return x[idx], idx + offset
+
+
+def _sort_sample(x, n, block):
+    """ Up to ``n`` regularly spaced elements of a sorted block, with their
+    block and position
+
+    >>> _sort_sample(np.arange(10), 4, 1)
+    (array([0, 2, 5, 7]), array([1, 1, 1, 1]), array([0, 2, 5, 7]))
+    """
+    n = min(n, len(x))
+    positions = np.arange(n) * len(x) // max(n, 1)
+    return x[positions], np.full(n, block, dtype=np.intp), positions
+
+
+def _sort_splitters(samples, n):
+    """ Elements that split the samples into ``n`` groups of equal size
+
+    Elements are ordered by value, block and position, as given by
+    ``_sort_sample``.
+
+    >>> _sort_splitters([(np.array([0, 2, 2, 2]), np.array([0, 0, 0, 0]),
+    ...                   np.array([0, 1, 2, 3])),
+    ...                  (np.array([1, 2]), np.array([1, 1]),
+    ...                   np.array([0, 2]))], 3)
+    (array([2, 2]), array([0, 0]), array([1, 3]))
+    """
+    values, blocks, positions = map(np.concatenate, zip(*samples))
+    order = np.lexsort((positions, blocks, values))
+    if len(order):
+        order = order[np.arange(1, n) * len(order) // n]
+    return values[order], blocks[order], positions[order]
+
+
+def _sort_split(x, splitters, block):
+    """ Split a sorted block, or its values and indices, at the splitters
+
+    Elements equal to a splitter go to the piece before it, and values equal
+    to that of a splitter are split by their block and position.
+
+    >>> _sort_split(np.array([1, 2, 4, 5, 6]),
+    ...             (np.array([2, 5]), np.array([0, 0]), np.array([1, 3])), 0)
+    [array([1, 2]), array([4, 5]), array([6])]
+    >>> pieces = _sort_split(np.array([2, 2, 2, 2]),
+    ...                      (np.array([2, 2]), np.array([0, 1]),
+    ...                       np.array([1, 0])), 1)
+    >>> [len(piece) for piece in pieces]
+    [0, 1, 3]
+    """
+    values = x[0] if isinstance(x, tuple) else x
+    split_values, split_blocks, split_positions = splitters
+    lo = np.searchsorted(values, split_values, side='left')
+    hi = np.searchsorted(values, split_values, side='right')
+    equal = np.where(split_blocks < block, 0,
+                     np.where(split_blocks > block, hi - lo,
+                              np.clip(split_positions - lo + 1, 0, hi - lo)))
+    bounds = lo + equal
+    if isinstance(x, tuple):
+        return list(zip(np.split(x[0], bounds), np.split(x[1], bounds)))
+    return np.split(x, bounds)
+
+
+def _sort_merge(pieces):
+    """ Sort the pieces of a bucket, or the indices of their values
+
+    >>> _sort_merge([np.array([1, 3]), np.array([2])])
+    array([1, 2, 3])
+    >>> _sort_merge([(np.array([1, 3]), np.array([0, 1])),
+    ...              (np.array([1]), np.array([5]))])
+    array([0, 5, 1])
+    """
+    if isinstance(pieces[0], tuple):
+        values, indices = zip(*pieces)
+        order = np.argsort(np.concatenate(values), kind='mergesort')
+        return np.concatenate(indices)[order]
+    return np.sort(np.concatenate(pieces))
+
+
+def searchsorted(a, v, side='left', split_every=None):
+    """ Find the indices at which to insert values to keep an array sorted
+
+    Finds the position of each element of ``v`` within the sorted
+    one-dimensional array ``a``, as ``numpy.searchsorted`` does.  Every block
+    of ``a`` is searched, and the positions within the blocks are summed with
+    a tree reduction, so that the sizes of the chunks of ``a``, such as those
+    given by ``sort``, needn't be known.
+
+    Parameters
+    ----------
+    a : dask array
+        One-dimensional array sorted in ascending order
+    v : array_like
+        Values to insert into ``a``
+    side : {'left', 'right'}, optional
+        Give the first or last suitable position for values equal to elements
+        of ``a``
+    split_every : int, optional
+        Number of blocks of ``a`` summed at once
+
+    Examples
+    --------
+    >>> a = from_array(np.array([1, 2, 3, 4, 5]), chunks=2)
+    >>> searchsorted(a, np.array([3, 0, 6])).compute()
+    array([2, 0, 5])
+
+    See Also
+    --------
+    sort
+    """
+    if side not in ('left', 'right'):
+        raise ValueError("side must be 'left' or 'right', got %r" % (side,))
+    a = asarray(a)
+    if a.ndim != 1:
+        raise ValueError("searchsorted only works on sorted arrays of one "
+                         "dimension")
+    v = asarray(v)
+    vind = tuple(range(1, v.ndim + 1))
+    # Block i holds the positions of v within block i of a
+    out = atop(_searchsorted_block, (0,) + vind, a, (0,), v, vind, side=side,
+               dtype=np.intp, adjust_chunks={0: 1})
+    return out.sum(axis=0, dtype=np.intp, split_every=split_every)
+
+
+def _searchsorted_block(a, v, side):
+    return np.asarray(np.searchsorted(a, v, side=side))[None]
+
+
 @wraps(np.compress)
 def compress(condition, a, axis=None):
     if axis is None:
@@ -519,7 +519,7 @@ def take_sorted(outname, inname, blockdims, index, axis=0):
     return tuple(blockdims2), dict(zip(keys, values))
 
 
-def take(outname, inname, blockdims, index, axis=0):
+def take(outname, inname, blockdims, index, axis=0, max_branch=32):
     """ Index array with an iterable of index
 
     Handles a single index by a single list
@@ -543,6 +543,14 @@ def take(outname, inname, blockdims, index, axis=0):
     >>> dsk  # doctest: +SKIP
     {('y', 0): (getitem, ('x', 0), ([1, 3, 5],)),
      ('y', 2): (getitem, ('x', 2), ([7],))}
+
+    Larger unsorted lists are split into blocks as large as the largest
+    input block, and gathered with a shuffle, see ``take_shuffle``
+
+    >>> blockdims, dsk = take('y', 'x', [(20, 20, 20, 20)],
+    ...                       np.arange(80)[::-1], axis=0)
+    >>> blockdims
+    ((20, 20, 20, 20),)
     """
 
     index = np.asanyarray(index)
@@ -550,13 +558,18 @@ def take(outname, inname, blockdims, index, axis=0):
     if issorted(index):
         return take_sorted(outname, inname, blockdims, index, axis)
 
+    sizes = blockdims[axis]  # the blocksizes on the axis that we care about
+    if (len(index) > max(sizes) or
+            len(np.unique(_source_blocks(sizes, index))) > max_branch):
+        return take_shuffle(outname, inname, blockdims, index, axis,
+                            max_branch)
+
     if isinstance(index, np.ndarray) and index.ndim > 0:
         sorted_idx = np.sort(index)
     else:
         sorted_idx = index
 
     n = len(blockdims)
-    sizes = blockdims[axis]  # the blocksizes on the axis that we care about
 
     index_lists = partition_by_size(sizes, sorted_idx)
 
@@ -578,6 +591,185 @@ def take(outname, inname, blockdims, index, axis=0):
     return tuple(blockdims2), dict(zip(keys, vals))
 
 
+def shuffle_join(parts, indices, perm, axis):
+    """ Concatenate pieces of blocks along an axis, then reorder
+
+    >>> shuffle_join([np.array([1, 2, 3]), np.array([4, 5])],
+    ...              [np.array([2, 0]), None], np.array([2, 0, 3, 1]), 0)
+    array([4, 3, 5, 1])
+    """
+    parts = [p if idx is None else np.take(p, idx, axis=axis)
+             for p, idx in zip(parts, indices)]
+    result = parts[0] if len(parts) == 1 else np.concatenate(parts, axis)
+    if perm is not None:
+        result = np.take(result, perm, axis=axis)
+    return result
+
+
+def _source_blocks(sizes, index):
+    """ The block that each index falls in
+
+    >>> _source_blocks((10, 20, 10), [1, 35, 12, 9])
+    array([0, 2, 1, 0])
+    """
+    return np.searchsorted(np.cumsum(sizes), index, side='right')
+
+
+def shuffle_plan(src, dst, max_branch=32):
+    """ Plan a shuffle of elements from source to destination blocks
+
+    Elements move in stages, each of which exchanges them between groups of
+    at most ``max_branch`` blocks, like the task-based shuffle of
+    ``dask.dataframe``, so that the number of pieces exchanged grows as
+    ``n * log(n)`` in the number of blocks rather than as ``n ** 2``.  Every
+    block holds its elements in their original order.  The blocks of stage 0
+    are the source blocks, and those of the last stage the destination
+    blocks.
+
+    Parameters
+    ----------
+    src, dst : np.ndarray
+        Source and destination block of each element
+    max_branch : int
+        Largest number of blocks that a block of a stage gathers from
+
+    Returns
+    -------
+    List of stages, each a list of ``(block, pieces, perm)``, where ``pieces``
+    is a list of ``(source, idx)``: the elements at positions ``idx`` of the
+    ``source`` block of the previous stage, or all of its elements if ``idx``
+    is None.  ``perm`` orders the concatenated pieces, or is None if they are
+    in order.
+
+    Examples
+    --------
+    >>> plan = shuffle_plan(np.array([1, 0, 1]), np.array([0, 0, 1]))
+    >>> plan  # doctest: +NORMALIZE_WHITESPACE
+    [[(0, [(0, None), (1, array([0]))], array([1, 0])),
+      (1, [(1, array([1]))], None)]]
+    """
+    npartitions = int(max(src.max(), dst.max())) + 1
+    if npartitions > max_branch:
+        stages = int(math.ceil(math.log(npartitions) / math.log(max_branch)))
+        k = int(math.ceil(npartitions ** (1.0 / stages)))
+        while k ** stages < npartitions:
+            k += 1
+    else:
+        stages, k = 1, max(npartitions, 2)
+
+    cur = src
+    _, rank, counts = _ranks(cur)
+    plan = []
+    for stage in range(1, stages + 1):
+        # Elements keep the digits of their destination below the stage,
+        # and of their source above it
+        kt = k ** stage
+        nxt = dst % kt + src // kt * kt
+        next_order, next_rank, next_counts = _ranks(nxt)
+
+        # Group the elements of each block by the block they come from
+        blocks = []
+        for segment in np.split(next_order, np.cumsum(next_counts)[:-1]):
+            if not len(segment):
+                continue
+            perm = np.argsort(cur[segment], kind='mergesort')
+            segment = segment[perm]
+            pieces = []
+            by_source = cur[segment]
+            splits = np.flatnonzero(np.diff(by_source)) + 1
+            for part in np.split(segment, splits):
+                a = int(cur[part[0]])
+                idx = None if len(part) == counts[a] else rank[part]
+                pieces.append((a, idx))
+            perm = np.argsort(perm)
+            if issorted(perm):
+                perm = None
+            blocks.append((int(nxt[segment[0]]), pieces, perm))
+        plan.append(blocks)
+        cur, rank, counts = nxt, next_rank, next_counts
+    return plan
+
+
+def _ranks(ids):
+    """ Stable order of elements by id, their position among those with the
+    same id, and the count of each id
+
+    >>> _ranks(np.array([1, 0, 1, 1]))
+    (array([1, 0, 2, 3]), array([0, 0, 1, 2]), array([1, 3]))
+    """
+    n = len(ids)
+    # Positions make the keys unique, so the sort is stable
+    order = np.argsort(ids * n + np.arange(n))
+    counts = np.bincount(ids)
+    starts = np.cumsum(counts) - counts
+    rank = np.empty(n, dtype=np.intp)
+    rank[order] = np.arange(n) - starts[ids[order]]
+    return order, rank, counts
+
+
+def take_shuffle(outname, inname, blockdims, index, axis=0, max_branch=32):
+    """ Index array with an unsorted list index, gathering with a shuffle
+
+    Forms a dask for the case
+
+        x[:, [5, 1, 9, 4, 5, ...], ...]
+
+    where the index is unsorted, may repeat, and may be large.  The output is
+    split into blocks as large as the largest input block along ``axis``.
+    Each input block is read once, taking all of the elements that it
+    contributes, in order.  These are then exchanged in stages between
+    groups of at most ``max_branch`` blocks, see ``shuffle_plan``, with a
+    task per block and stage that gathers its pieces with ``shuffle_join``.
+
+    See Also
+    --------
+    take - calls this function
+    """
+    n = len(blockdims)
+    sizes = blockdims[axis]
+    chunk = max(sizes)
+
+    src = _source_blocks(sizes, index)
+    starts = np.cumsum((0,) + tuple(sizes[:-1]))
+    local = index - starts[src]
+    dst = np.arange(len(index)) // chunk
+    plan = shuffle_plan(src, dst, max_branch)
+
+    def slc(idx):
+        return (colon, ) * axis + (idx, ) + (colon, ) * (n - axis - 1)
+
+    name = 'take-shuffle-' + outname
+    order, _, counts = _ranks(src)
+    gathers = [(s, local[part]) for s, part in
+               enumerate(np.split(order, np.cumsum(counts)[:-1])) if len(part)]
+
+    dims = [list(range(len(bd))) for i, bd in enumerate(blockdims)
+            if i != axis]
+    dsk = dict()
+    for d in product(*dims):
+        before, after = d[:axis], d[axis:]
+        for s, idx in gathers:
+            dsk[(name, 0, s) + d] = (getitem,
+                                     (inname, ) + before + (s, ) + after,
+                                     (colon, ) * axis + (idx, ) +
+                                     (colon, ) * (n - axis - 1))
+        for stage, blocks in enumerate(plan, 1):
+            if stage == len(plan):
+                keys = [(outname, ) + before + (b, ) + after
+                        for b, _, _ in blocks]
+            else:
+                keys = [(name, stage, b) + d for b, _, _ in blocks]
+            for key, (b, pieces, perm) in zip(keys, blocks):
+                dsk[key] = (shuffle_join,
+                            [(name, stage - 1, a) + d for a, _ in pieces],
+                            [idx for _, idx in pieces], perm, axis)
+
+    blockdims2 = list(blockdims)
+    blockdims2[axis] = tuple(np.diff(np.r_[0:len(index):chunk, len(index)])
+                             .tolist())
+    return tuple(blockdims2), dsk
+
+
 def posify_index(shape, ind):
     """ Flip negative indices around to positive ones
 
@@ -19,6 +19,7 @@ from toolz.curried import identity
 import dask
 import dask.array as da
 from dask.base import tokenize, compute_as_if_collection
+from dask.core import istask
 from dask.delayed import delayed
 from dask.local import get_sync
 from dask.utils import ignoring, tmpfile, tmpdir
@@ -1329,7 +1330,89 @@ def test_store_multiprocessing_lock():
     a = d + 1
 
     at = np.zeros(shape=(10, 10))
-    a.store(at, get=dask.multiprocessing.get, num_workers=10)
+    a.store(at, lock=Lock(), get=dask.multiprocessing.get, num_workers=10)
+
+
+class ChunkedStore(object):
+    def __init__(self, shape, chunks):
+        self.data = np.zeros(shape)
+        self.shape = shape
+        self.chunks = chunks
+        self.writes = []
+
+    def __setitem__(self, key, value):
+        self.writes.append(key)
+        self.data[key] = value
+
+
+def _store_locks(dsk):
+    # The locks of each write
+    return [v[4] if isinstance(v[4], tuple) else (v[4],) if v[4] else ()
+            for k, v in dsk.items() if k[0].startswith('store-')]
+
+
+def test_store_disjoint_writes_unlocked():
+    a = da.ones((10, 10), chunks=(2, 2)) + 1
+    at = np.zeros((10, 10))
+    v = store(a, at, compute=False)
+    assert not any(_store_locks(v.dask))
+    v.compute()
+    assert (at == 2).all()
+
+    at = ThreadSafeStore()
+    at.__dask_disjoint_writes__ = True
+    v = store(a, at, compute=False, lock='region')
+    assert not any(_store_locks(v.dask))
+
+
+def test_store_region_locks():
+    a = da.ones((8, 8), chunks=(4, 4)) + 1
+
+    # One lock per target chunk
+    at = ChunkedStore((8, 8), chunks=(4, 4))
+    v = store(a, at, lock='region', compute=False)
+    locks = _store_locks(v.dask)
+    assert all(len(l) == 1 for l in locks)
+    assert len(set(locks)) == 4
+    v.compute(get=dask.threaded.get)
+    assert (at.data == 2).all()
+
+    # Writes spanning several target chunks take all of their locks, and
+    # blocks within the same chunk are written at once
+    at = ChunkedStore((10, 8), chunks=(3, 8))
+    v = store(a, at, lock='region', regions=(slice(1, 9), slice(None)),
+              compute=False)
+    locks = sorted(_store_locks(v.dask), key=len)
+    assert list(map(len, locks)) == [2, 2]
+    assert len(set(sum(locks, ()))) == 3
+    v.compute(get=dask.threaded.get)
+    assert (at.data[1:9] == 2).all()
+    assert (at.data[[0, 9]] == 0).all()
+
+    # Without chunks the whole target is locked
+    at = NonthreadSafeStore()
+    store(a, at, lock='region', get=dask.threaded.get, num_workers=10)
+
+
+def test_store_coalesce():
+    x = np.arange(64).reshape((8, 8))
+    a = da.from_array(x, chunks=(2, 2))
+
+    at = ChunkedStore((8, 8), chunks=(4, 4))
+    store(a, at)
+    assert len(at.writes) == 4
+    assert (at.data == x).all()
+
+    at = ChunkedStore((8, 8), chunks=(4, 4))
+    store(a, at, coalesce=False)
+    assert len(at.writes) == 16
+    assert (at.data == x).all()
+
+    # Rows straddle the target chunks, so only columns are joined
+    at = ChunkedStore((9, 8), chunks=(3, 8))
+    store(a, at, regions=(slice(1, 9), slice(None)))
+    assert sorted(w[0].start for w in at.writes) == [1, 3, 5, 7]
+    assert (at.data[1:] == x).all()
 
 
 def test_to_hdf5():
@@ -2091,6 +2174,81 @@ def test_to_npy_stack():
         assert_eq(d, e)
 
 
+@pytest.mark.parametrize('compression', [None, 'zlib', 'blosc'])
+def test_npy_blocks(compression):
+    if compression == 'blosc':
+        pytest.importorskip('blosc')
+    x = np.arange(5 * 10 * 10).reshape((5, 10, 10))
+    d = da.from_array(x, chunks=(2, 4, 5))
+
+    with tmpdir() as dirname:
+        blockdir = os.path.join(dirname, 'test')
+        da.to_npy_blocks(blockdir, d, compression=compression)
+        files = set(os.listdir(blockdir))
+        assert len(files) == 3 * 3 * 2 + 1
+        assert 'index.json' in files
+
+        e = da.from_npy_blocks(blockdir)
+        assert e.chunks == d.chunks
+        assert_eq(d, e)
+        assert_eq(d[1:3, 5:, 2], e[1:3, 5:, 2])
+
+        # Slicing only reads the overlapping blocks
+        f = e[:2, :4]
+        dsk = f.__dask_optimize__(f.dask, f.__dask_keys__())
+        files = [v[1] for v in dsk.values() if istask(v)]
+        suffix = '.npy' if compression is None else '.npy.' + compression
+        assert sorted(map(os.path.basename, files)) == ['0.0.0' + suffix,
+                                                        '0.0.1' + suffix]
+
+        # Same data, same name
+        assert da.from_npy_blocks(blockdir).name == e.name
+
+        with pytest.raises(ValueError):
+            da.to_npy_blocks(blockdir, d, compression='not-a-codec')
+
+
+def test_npy_blocks_memory_mapped():
+    x = np.arange(100, dtype='f4').reshape((10, 10))
+    with tmpdir() as dirname:
+        da.to_npy_blocks(dirname, da.from_array(x, chunks=5))
+        e = da.from_npy_blocks(dirname)
+        block = e.dask[e.__dask_keys__()[0][0]]
+        assert isinstance(dask.get({'x': block}, 'x'), np.memmap)
+        e = da.from_npy_blocks(dirname, mmap_mode=None)
+        assert not isinstance(e.compute(), np.memmap)
+        assert_eq(e, x)
+
+
+def test_npy_blocks_dtypes_and_unknown_chunks():
+    x = np.zeros(10, dtype=[('a', 'i4'), ('b', [('c', 'f8', 2)])])
+    x['a'] = np.arange(10)
+    d = da.from_array(x, chunks=4)
+    with tmpdir() as dirname:
+        v = da.to_npy_blocks(dirname, d[d['a'] % 3 > 0], compute=False)
+        assert not os.path.exists(os.path.join(dirname, 'index.json'))
+        v.compute()
+        e = da.from_npy_blocks(dirname)
+        assert e.dtype == x.dtype
+        assert e.chunks == ((2, 3, 1),)
+        assert_eq(e, x[x['a'] % 3 > 0])
+
+    with tmpdir() as dirname:
+        da.to_npy_blocks(dirname, da.from_array(np.float32(1), chunks=()),
+                         compression='zlib')
+        assert_eq(da.from_npy_blocks(dirname), np.float32(1))
+
+    with tmpdir() as dirname:
+        with pytest.raises(ValueError):
+            da.to_npy_blocks(dirname, d, compression='foo')
+        with pytest.raises(ValueError):
+            da.to_npy_blocks(dirname, d.astype(object))
+        with open(os.path.join(dirname, 'index.json'), 'w') as f:
+            f.write('{}')
+        with pytest.raises(ValueError):
+            da.from_npy_blocks(dirname)
+
+
 def test_view():
     x = np.arange(56).reshape((7, 8))
     d = da.from_array(x, chunks=(2, 3))
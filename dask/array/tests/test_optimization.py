@@ -8,7 +8,8 @@ from dask.optimize import fuse
 from dask.utils import SerializableLock
 from dask.array.core import getter, getter_nofancy
 from dask.array.optimization import (getitem, optimize, optimize_slices,
-                                     fuse_slice)
+                                     fuse_slice, fuse_elemwise_kernels,
+                                     ElemwiseKernel)
 from dask.array.utils import assert_eq
 
 
@@ -270,3 +271,85 @@ def test_turn_off_fusion():
 
     assert dask.get(a, y.__dask_keys__()) == dask.get(b, y.__dask_keys__())
     assert len(a) < len(b)
+
+
+def test_fuse_elemwise_kernels():
+    x = da.ones((4, 4), chunks=2)
+    y = da.arange(16, chunks=4).reshape((4, 4)).rechunk(2)
+    z = da.sin(x + 1) * y - x ** 2
+
+    dsk = optimize(z.dask, z.__dask_keys__())
+    kernels = [v for k, v in dsk.items() if k[0] == z.name]
+    assert len(kernels) == 4
+    assert all(type(v[0]) is ElemwiseKernel for v in kernels)
+    assert len({id(v[0]) for v in kernels}) == 1
+    assert not any(k[0].startswith(('add', 'sin', 'mul', 'pow')) for k in dsk)
+    assert_eq(z, np.sin(2) * np.arange(16).reshape((4, 4)) - 1)
+
+    with dask.set_options(fuse_elemwise=False):
+        dsk = optimize(z.dask, z.__dask_keys__())
+    assert not any(type(v[0]) is ElemwiseKernel for v in dsk.values()
+                   if type(v) is tuple)
+
+    # Nor when fusion is turned off altogether
+    with dask.set_options(fuse_ave_width=0):
+        dsk = optimize(z.dask, z.__dask_keys__())
+    assert not any(type(v[0]) is ElemwiseKernel for v in dsk.values()
+                   if type(v) is tuple)
+
+    # Results used elsewhere are kept
+    from operator import add, mul
+    dsk = {'a': 1, 'b': (add, 'a', 1), 'c': (mul, 'b', 'b'),
+           'd': (add, 'c', 'a'), 'e': (sum, ['b', 'd'])}
+    deps = {'a': set(), 'b': {'a'}, 'c': {'b'}, 'd': {'a', 'c'},
+            'e': {'b', 'd'}}
+    dsk2, deps2 = fuse_elemwise_kernels(dsk, ['e'], deps)
+    assert set(dsk2) == {'a', 'b', 'd', 'e'}
+    assert deps2['d'] == {'a', 'b'}
+    assert dask.get(dsk2, 'e') == dask.get(dsk, 'e') == 7
+
+
+def test_elemwise_kernel_reuses_memory():
+    from operator import add, mul, neg, pow
+
+    # -((x + 1) * x) ** 2
+    kernel = ElemwiseKernel([(add, ((0, 0), (0, 1))),
+                             (mul, ((1, 0), (0, 0))),
+                             (pow, ((1, 1), (0, 2))),
+                             (neg, ((1, 2),))])
+    for dtype in ['f4', 'f8', 'c16']:
+        x = np.arange(5).astype(dtype)
+        x2 = x.copy()
+        result = kernel(x, 1, 2)
+        assert_eq(result, -((x + 1) * x) ** 2)
+        assert result.dtype == dtype
+        assert (x == x2).all()
+
+    # Intermediates are computed in the memory of earlier ones
+    buffers = []
+
+    def record(a, b):
+        buffers.append(a + b)
+        return buffers[-1]
+
+    kernel = ElemwiseKernel([(record, ((0, 0), (0, 1))),
+                             (np.sin, ((1, 0),)),
+                             (mul, ((1, 1), (0, 1)))])
+    result = kernel(np.ones(3), 2.0)
+    assert result is buffers[-1]
+    assert_eq(result, np.sin(np.ones(3) + 2) * 2)
+
+    # Unless dtypes, types or shapes differ
+    x = np.arange(5)
+    assert_eq(kernel(x, 2), np.sin(x + 2) * 2)
+    assert kernel(x, 2) is not buffers[-1]
+    assert_eq(kernel(x, 2.5j), np.sin(x + 2.5j) * 2.5j)
+    m = np.ma.masked_array(np.arange(3.0), mask=[0, 1, 0])
+    result = kernel(m, 2.0)
+    assert isinstance(result, np.ma.MaskedArray)
+    assert result.mask.tolist() == [False, True, False]
+    kernel = ElemwiseKernel([(np.exp, ((0, 0),)),
+                             (add, ((1, 0), (0, 1)))])
+    assert_eq(kernel(np.ones(3), np.ones((2, 3))), np.exp(1) + np.ones((2, 3)))
+    assert_eq(kernel(np.ones(3, dtype='f4'), np.ones(3)),
+              np.exp(np.ones(3, dtype='f4')) + np.ones(3))
@@ -51,3 +51,40 @@ def test_percentile_with_categoricals():
 def test_percentiles_with_empty_arrays():
     x = da.ones(10, chunks=((5, 0, 5),))
     assert_eq(da.percentile(x, [10, 50, 90]), np.array([1, 1, 1], dtype=x.dtype))
+
+
+def test_approx_percentile():
+    rs = np.random.RandomState(0)
+    q = [0, 5, 50, 95, 100]
+
+    # Exact when every value keeps its own centroid
+    x = rs.permutation(40)
+    d = da.from_array(x, chunks=7)
+    assert_eq(da.approx_percentile(d, q, compression=1000),
+              np.percentile(x, q))
+    assert_eq(da.approx_percentile(d, 50, compression=1000),
+              np.percentile(x, 50))
+    assert same_keys(da.approx_percentile(d, q), da.approx_percentile(d, q))
+    assert not same_keys(da.approx_percentile(d, q),
+                         da.approx_percentile(d, q, compression=50))
+
+    # Approximate along axes of N-d arrays
+    x = rs.standard_normal((6, 2000, 4))
+    d = da.from_array(x, chunks=(2, 250, 3))
+    for axis in [None, 1, (0, 1), -1]:
+        result = da.approx_percentile(d, q, axis=axis, split_every=2)
+        expected = np.percentile(x, q, axis=axis)
+        assert result.shape == expected.shape
+        assert_eq(result, expected, atol=0.2)
+        assert_eq(result[[0, -1]], expected[[0, -1]])
+
+    # NaNs and empty blocks are ignored
+    x = np.arange(100.)
+    x[::7] = np.nan
+    d = da.from_array(x, chunks=((50, 0, 50),))
+    assert_eq(da.approx_percentile(d, q), np.nanpercentile(x, q), atol=1)
+
+    assert np.isnan(da.approx_percentile(da.from_array(x[:0], chunks=5),
+                                         50).compute())
+    with pytest.raises(ValueError):
+        da.approx_percentile(d, [50, 101])
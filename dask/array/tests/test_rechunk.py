@@ -10,6 +10,8 @@ from dask.array.utils import assert_eq
 from dask.array.rechunk import intersect_chunks, rechunk, normalize_chunks
 from dask.array.rechunk import cumdims_label, _breakpoints, _intersect_1d, _old_to_new
 from dask.array.rechunk import plan_rechunk, divide_to_width, merge_to_number
+from dask.array.rechunk import (estimate_rechunk_cost, explain_rechunk,
+                                calibrate_rechunk)
 import dask.array as da
 
 
@@ -394,6 +396,79 @@ def test_plan_rechunk_asymmetric():
     assert len(y.dask) < 100000
 
 
+def test_estimate_rechunk_cost():
+    old = ((10,) * 10, (100,))
+    new = ((100,), (10,) * 10)
+    cost = estimate_rechunk_cost(old, [new], itemsize=8, num_workers=1,
+                                 task_overhead=1e-4, bandwidth=1e9)
+    assert cost.ntasks == 11 * 11
+    assert cost.nbytes == 100 * 100 * 8
+    # Each new block is cut from all old blocks
+    assert cost.memory == (100 * 100 + 100 * 10) * 8
+    assert cost.time == pytest.approx(121 * 1e-4 + 80000 / 1e9)
+
+    # Memory grows with the number of workers, up to twice the array
+    cost4 = estimate_rechunk_cost(old, [new], itemsize=8, num_workers=4,
+                                  task_overhead=1e-4, bandwidth=1e9)
+    assert cost4.memory == 2 * 100 * 100 * 8
+
+    # An intermediate step copies more, in smaller pieces
+    two_steps = estimate_rechunk_cost(old, [((20,) * 5, (50,) * 2), new],
+                                      itemsize=8, num_workers=1,
+                                      task_overhead=1e-4, bandwidth=1e9)
+    assert two_steps.nbytes == 2 * cost.nbytes
+    assert two_steps.memory == (100 * 50 + 100 * 10) * 8
+
+    # Costs don't depend on timings unless asked to
+    default = estimate_rechunk_cost(old, [new], itemsize=8)
+    assert default == estimate_rechunk_cost(old, [new], itemsize=8)
+    calibration = calibrate_rechunk(ntasks=10, nbytes=1000)
+    assert calibration['rechunk_task_overhead'] > 0
+    assert calibration['rechunk_bandwidth'] > 0
+    with dask.set_options(**calibration):
+        calibrated = estimate_rechunk_cost(old, [new], itemsize=8)
+    assert calibrated.time == pytest.approx(
+        121 * calibration['rechunk_task_overhead'] +
+        80000 / calibration['rechunk_bandwidth'])
+    assert estimate_rechunk_cost(old, [new], itemsize=8) == default
+
+
+def test_plan_rechunk_memory_limit():
+    c = ((1000,) * 2)   # coarse
+    f = ((2,) * 1000)   # fine
+    old, new = (f, c), (c, f)
+
+    steps = plan_rechunk(old, new, itemsize=8, num_workers=4)
+    assert steps[-1] == new
+    cost = estimate_rechunk_cost(old, steps, 8, 4)
+
+    steps2 = plan_rechunk(old, new, itemsize=8, num_workers=4,
+                          memory_limit=cost.memory - 1)
+    assert steps2[-1] == new
+    assert estimate_rechunk_cost(old, steps2, 8, 4).memory < cost.memory
+
+    text = explain_rechunk(old, new, itemsize=8, num_workers=4,
+                           memory_limit=cost.memory - 1)
+    assert 'within the memory limit' in text
+    assert 'direct' in text
+    assert 'No plan fits' in explain_rechunk(old, new, itemsize=8,
+                                             memory_limit=1)
+
+
+def test_rechunk_memory_limit():
+    x = da.ones((1000, 1000), chunks=(2, 1000))
+    y = x.rechunk((1000, 2), memory_limit=20e6, num_workers=2)
+    assert y.chunks == ((1000,), (2,) * 500)
+    assert_eq(y, np.ones((1000, 1000)))
+    assert not any('rechunk-disk' in str(k) for k in y.dask)
+
+    # No plan fits, so the array is rechunked on disk
+    y = x.rechunk((1000, 2), memory_limit=1e5, num_workers=2,
+                  block_size_limit=1e6, method='auto')
+    assert any('rechunk-disk' in str(k) for k in y.dask)
+    assert_eq(y, np.ones((1000, 1000)))
+
+
 def test_rechunk_warning():
     N = 20
     x = da.random.normal(size=(N, N, 100), chunks=(1, N, 100))
@@ -593,3 +668,67 @@ def test_rechunk_zero_dim():
 
     x = da.ones((0, 10, 100), chunks=(0, 10, 10)).rechunk((0, 10, 50))
     assert len(x.compute()) == 0
+
+
+@pytest.mark.parametrize('old, new', [
+    ((1, 20), (20, 1)),
+    ((3, 7), (5, 2)),
+    ((20, 20), (4, 20)),
+])
+def test_rechunk_disk(old, new):
+    x = np.random.random((20, 20))
+    d = da.from_array(x, chunks=old)
+    y = d.rechunk(new, method='disk')
+    assert y.chunks == normalize_chunks(new, x.shape)
+    assert_eq(y, x)
+    assert all(k[0].startswith('rechunk-disk') for k in y.__dask_keys__()[0])
+
+
+def test_rechunk_disk_removes_file():
+    import gc
+    import os
+    from dask.utils import tmpdir
+    with tmpdir() as dirname:
+        with dask.set_options(temporary_directory=dirname):
+            y = da.ones((10, 10), chunks=(1, 10)).rechunk((10, 1),
+                                                          method='disk')
+            assert_eq(y, np.ones((10, 10)))
+        assert len(os.listdir(dirname)) == 1
+        del y
+        gc.collect()
+        assert not os.listdir(dirname)
+
+
+def test_rechunk_disk_multiprocessing():
+    from dask.multiprocessing import get
+    x = np.arange(200).reshape((10, 20))
+    y = da.from_array(x, chunks=(2, 20)).rechunk((10, 3), method='disk')
+    assert_eq(y.compute(get=get), x)
+
+
+def test_rechunk_choose_method():
+    x = da.ones((100, 100), chunks=(1, 100))
+    # Small arrays are rechunked in memory
+    y = x.rechunk((100, 1))
+    assert not any('rechunk-disk' in k for k in y.dask.dicts)
+    y = x.rechunk((100, 1), method='auto')
+    assert not any('rechunk-disk' in k for k in y.dask.dicts)
+    # Large arrays with many intermediate steps only go through disk when
+    # asked to choose
+    y = x.rechunk((100, 1), block_size_limit=800)
+    assert not any('rechunk-disk' in k for k in y.dask.dicts)
+    y = x.rechunk((100, 1), block_size_limit=800, method='auto')
+    assert any('rechunk-disk' in k for k in y.dask.dicts)
+    assert_eq(y, np.ones((100, 100)))
+    with dask.set_options(rechunk_method='auto'):
+        assert any('rechunk-disk' in k for k in
+                   x.rechunk((100, 1), block_size_limit=800).dask.dicts)
+
+    with dask.set_options(rechunk_method='disk'):
+        assert any('rechunk-disk' in k
+                   for k in x.rechunk((100, 1)).dask.dicts)
+    with dask.set_options(rechunk_method='tasks'):
+        assert not any('rechunk-disk' in k for k in
+                       x.rechunk((100, 1), block_size_limit=800).dask.dicts)
+    with pytest.raises(NotImplementedError):
+        x.rechunk((100, 1), method='foo')
@@ -3,6 +3,9 @@ from __future__ import absolute_import, division, print_function
 import pytest
 pytest.importorskip('numpy')
 
+import operator
+
+import dask
 import dask.array as da
 from dask.array.utils import assert_eq as _assert_eq, same_keys
 from dask.core import get_deps
@@ -389,7 +392,8 @@ def test_array_reduction_out(func):
 
 @pytest.mark.parametrize("func", ["cumsum", "cumprod"])
 @pytest.mark.parametrize("axis", [None, 0, 1, -1])
-def test_array_cumreduction_axis(func, axis):
+@pytest.mark.parametrize("method", ["blelloch", "sequential"])
+def test_array_cumreduction_axis(func, axis, method):
     np_func = getattr(np, func)
     da_func = getattr(da, func)
 
@@ -398,13 +402,144 @@ def test_array_cumreduction_axis(func, axis):
     d = da.from_array(a, chunks=(4, 5, 6))
 
     a_r = np_func(a, axis=axis)
-    d_r = da_func(d, axis=axis)
+    d_r = da_func(d, axis=axis, method=method)
 
     assert_eq(a_r, d_r)
 
 
+def _longest_chain(dsk):
+    deps, _ = get_deps(dsk)
+    depth = dict()
+
+    def visit(k):
+        if k not in depth:
+            depth[k] = 1 + max([visit(d) for d in deps[k]] or [0])
+        return depth[k]
+    return max(visit(k) for k in dsk)
+
+
+def test_cumreduction_parallel_scan():
+    x = np.arange(1000)
+    d = da.from_array(x, chunks=1)
+    assert_eq(da.cumsum(d), np.cumsum(x))
+    assert _longest_chain(d.cumsum(axis=0).dask) < 25
+    assert _longest_chain(d.cumsum(axis=0, method='sequential').dask) > 1000
+    assert d.cumsum(axis=0).name == d.cumsum(axis=0).name
+    assert d.cumsum(axis=0).name != d.cumsum(axis=0, method='sequential').name
+    with pytest.raises(ValueError):
+        d.cumsum(axis=0, method='foo')
+
+    # Associative binops that aren't commutative
+    from dask.array.reductions import cumreduction, prefix_scan
+    x = np.arange(1, 41, dtype=object).reshape((4, 10))
+    x[...] = [[str(i) for i in row] for row in x]
+    d = da.from_array(x, chunks=(3, 3))
+    for axis in [0, 1]:
+        result = cumreduction(np.cumsum, np.add, '', d, axis=axis)
+        assert (result.compute() == np.cumsum(x, axis=axis)).all()
+
+    for n in range(1, 20):
+        dsk = dict((('x', i), str(i)) for i in range(n))
+        prefixes = prefix_scan(dsk, operator.add, sorted(dsk),
+                               lambda *k: ('s',) + k)
+        assert len(dsk) < 3 * n
+        assert list(dask.get(dsk, prefixes)) == \
+            [''.join(map(str, range(i + 1))) for i in range(n)]
+
+
 @pytest.mark.parametrize('func', [np.cumsum, np.cumprod])
 def test_array_cumreduction_out(func):
     x = da.ones((10, 10), chunks=(4, 4))
     func(x, axis=0, out=x)
     assert_eq(x, func(np.ones((10, 10)), axis=0))
+
+
+@pytest.mark.parametrize('axis', [None, 0, 1, (0, 1), -1])
+@pytest.mark.parametrize('keepdims', [False, True])
+def test_aggregate(axis, keepdims):
+    x = np.random.randint(0, 10, size=(20, 30))
+    d = da.from_array(x, chunks=(7, 8))
+    funcs = ['min', 'max', 'sum', 'prod', 'mean', 'var', 'std']
+    results = da.aggregate(d, funcs, axis=axis, keepdims=keepdims,
+                           split_every=2)
+    assert len(results) == len(funcs)
+    for f, r in zip(funcs, results):
+        assert_eq(r, getattr(np, f)(x, axis=axis, keepdims=keepdims))
+        assert_eq(r, getattr(da, f)(d, axis=axis, keepdims=keepdims))
+
+
+def test_aggregate_single_pass():
+    x = np.random.random((20, 30)).astype('f4')
+    d = da.from_array(x, chunks=(5, 5))
+    lo, mean, std, lo2 = da.aggregate(d, ['min', 'mean', 'std', 'min'],
+                                      axis=0, ddof=1)
+    assert_eq(lo, x.min(axis=0))
+    assert_eq(lo2, x.min(axis=0))
+    assert_eq(mean, x.mean(axis=0))
+    assert_eq(std, x.std(axis=0, ddof=1))
+    assert std.dtype == x.std(ddof=1).dtype
+
+    # All reductions share the tasks of each chunk
+    dsk = dict(lo.dask)
+    for r in (mean, std):
+        dsk.update(r.dask)
+    chunks = [k for k in dsk if 'aggregate_chunk' in k[0]]
+    assert len(chunks) == d.npartitions
+    assert same_keys(da.aggregate(d, ['min'])[0], da.aggregate(d, ['min'])[0])
+
+    assert da.aggregate(d, []) == ()
+    with pytest.raises(ValueError):
+        da.aggregate(d, ['median'])
+
+
+def test_auto_split_every():
+    from dask.array.reductions import auto_split_every, AUTO_SPLIT_EVERY_MAX
+    x = da.from_array(np.arange(242).reshape((11, 22)), chunks=(1, 1))
+    # The fan-in is fixed unless 'auto' is asked for
+    assert_max_deps(x.sum(axis=0), 4)
+    assert_max_deps(x.sum(axis=0, split_every='auto'), 11)
+
+    # Tiny intermediates give shallow trees
+    with set_options(split_every='auto'):
+        assert_max_deps(x.sum(), AUTO_SPLIT_EVERY_MAX, False)
+        assert_max_deps(x.sum(axis=0), 11)
+        assert_eq(x.sum(axis=0), np.arange(242).reshape((11, 22)).sum(axis=0))
+
+    # Large intermediates are combined few at a time
+    x = da.from_array(np.arange(242).reshape((11, 22)), chunks=(1, 22))
+    with set_options(split_every='auto', reduction_combine_size=22 * 8 * 3):
+        assert_max_deps(x.sum(axis=0), 3)
+        assert_max_deps(x.mean(axis=0), 2)   # means of (total, n) pairs
+        assert_max_deps(x.argmin(axis=0), 2)
+        assert_eq(x.mean(axis=0), np.arange(242).reshape((11, 22)).mean(0))
+
+    # Fan-in is spread over the axes with the most blocks
+    chunks = ((1,) * 3, (1,) * 100, (5,))
+    assert auto_split_every(chunks, (0, 1), 8) == {0: 3, 1: 10}
+    assert auto_split_every(chunks, (0, 1), 8, combine_size=8 * 5 * 4) == \
+        {0: 2, 1: 2}
+    assert auto_split_every(((1,), (1,) * 10), (0, 1), 8) == {0: 1, 1: 10}
+
+
+def test_auto_split_every_intermediates():
+    from dask.array.reductions import reduction
+    calls = []
+
+    def top2(x, axis=None, keepdims=None):
+        calls.append(x)
+        return np.sort(x, axis=axis[0])[-2:]
+
+    x = da.from_array(np.arange(100), chunks=1)
+    with set_options(split_every='auto', reduction_combine_size=8 * 2 * 3):
+        # Intermediates are sized from their dtype, without running chunk
+        assert_max_deps(reduction(x, top2, top2, axis=0, dtype='i8'), 6)
+        assert_max_deps(reduction(x, top2, top2, axis=0, dtype='i1',
+                                  intermediate_dtype='i8'), 6)
+        assert not calls
+
+        # Intermediates that keep several elements along the reduced axis
+        r = reduction(x, top2, top2, axis=0, dtype='i8',
+                      intermediate_size=2)
+        assert_max_deps(r, 3)
+        (result,) = dask.get(r.dask, r.__dask_keys__())
+        assert result.tolist() == [98, 99]
@@ -7,7 +7,9 @@ from distutils.version import LooseVersion
 
 np = pytest.importorskip('numpy')
 
+import dask
 import dask.array as da
+from dask.core import get_dependencies
 from dask.utils import ignoring
 from dask.array.utils import assert_eq, same_keys
 
@@ -246,6 +248,33 @@ def test_matmul(x_shape, y_shape):
             assert_eq(expected, da.matmul(d1, d2))
 
 
+@pytest.mark.parametrize('func', [da.matmul, da.tensordot])
+@pytest.mark.parametrize('split_every', [None, 2, 8])
+def test_contraction_split_every(func, split_every):
+    x = np.random.random((10, 40))
+    y = np.random.random((40, 10))
+    a = da.from_array(x, chunks=(5, 4))
+    b = da.from_array(y, chunks=(4, 5))
+    if func is da.tensordot:
+        result = func(a, b, axes=1, split_every=split_every)
+    else:
+        result = func(a, b, split_every=split_every)
+    assert_eq(result, x.dot(y))
+
+    # No task holds more than ``split_every`` partial products, or pairs of
+    # blocks of the inputs
+    dsk = result.__dask_optimize__(result.dask, result.__dask_keys__())
+    width = max(len(get_dependencies(dsk, k)) for k in dsk)
+    assert width <= max(split_every or 4, 2)
+
+
+def test_matmul_dtype():
+    x = np.arange(12, dtype='i4').reshape((3, 4))
+    a = da.from_array(x, chunks=2)
+    assert_eq(da.matmul(a, a.T), np.matmul(x, x.T))
+    assert da.matmul(a, a.T).dtype == np.matmul(x, x.T).dtype
+
+
 def test_tensordot():
     x = np.arange(400).reshape((20, 20))
     a = da.from_array(x, chunks=(5, 4))
@@ -438,6 +467,77 @@ def test_topk_k_bigger_than_chunk():
     assert_eq(e, np.array([6, 5, 2]))
 
 
+@pytest.mark.parametrize('chunks', [1, 3, 7, 100])
+def test_sort(chunks):
+    rs = np.random.RandomState(0)
+    for x in [rs.randn(100), rs.randint(0, 5, 100), np.arange(100)[::-1],
+              np.array([3., np.nan, 1., 2., np.nan, 0.])]:
+        d = da.from_array(x, chunks=chunks)
+        s = da.sort(d)
+        assert_eq(s, np.sort(x), equal_nan=True)
+        assert_eq(da.argsort(d), np.argsort(x, kind='mergesort'))
+        assert s.name == da.sort(d).name
+        assert s.name != da.argsort(d).name
+        s2, a2 = dask.compute(s, da.argsort(d))
+        assert_eq(s2, np.sort(x), equal_nan=True)
+        assert_eq(a2, np.argsort(x, kind='mergesort'))
+        if d.numblocks[0] > 1:
+            assert np.isnan(s.chunks[0]).all()
+
+    # Buckets hold about as many elements as blocks
+    x = rs.randn(1000)
+    s = da.sort(da.from_array(x, chunks=100))
+    blocks = dask.get(s.__dask_graph__(), s.__dask_keys__())
+    sizes = [len(b) for b in blocks]
+    assert sum(sizes) == 1000
+    assert max(sizes) <= 200
+
+    # Also when most values are the same
+    x = np.zeros(100000)
+    x[::10000] = rs.randn(10)
+    for method in [da.sort, da.argsort]:
+        s = method(da.from_array(x, chunks=10000))
+        blocks = dask.get(s.__dask_graph__(), s.__dask_keys__())
+        sizes = [len(b) for b in blocks]
+        assert sum(sizes) == 100000
+        assert max(sizes) <= 20000
+    assert_eq(da.sort(da.from_array(x, chunks=10000)), np.sort(x))
+    assert_eq(da.argsort(da.from_array(x, chunks=10000)),
+              np.argsort(x, kind='mergesort'))
+
+
+def test_sort_axis():
+    x = np.random.RandomState(0).randn(10, 12)
+    d = da.from_array(x, chunks=(3, 4))
+    for axis in [0, 1, -1, None]:
+        assert_eq(da.sort(d, axis=axis), np.sort(x, axis=axis))
+        assert_eq(da.argsort(d, axis=axis),
+                  np.argsort(x, axis=axis, kind='mergesort'))
+
+    with pytest.raises(ValueError):
+        da.sort(d, axis=2)
+    with pytest.raises(ValueError):
+        da.argsort(da.sort(da.arange(10, chunks=3)))
+
+
+def test_searchsorted():
+    x = np.random.RandomState(0).randint(0, 20, 50)
+    s = da.sort(da.from_array(x, chunks=7))
+    v = np.array([[-1, 0, 3], [10, 19, 25]])
+    for side in ['left', 'right']:
+        expected = np.searchsorted(np.sort(x), v, side=side)
+        assert_eq(da.searchsorted(s, v, side=side), expected)
+        assert_eq(da.searchsorted(s, da.from_array(v, chunks=(1, 2)),
+                                  side=side, split_every=2), expected)
+        assert_eq(da.searchsorted(s, 10, side=side),
+                  np.searchsorted(np.sort(x), 10, side=side))
+
+    with pytest.raises(ValueError):
+        da.searchsorted(s, v, side='middle')
+    with pytest.raises(ValueError):
+        da.searchsorted(da.ones((2, 2), chunks=1), v)
+
+
 def test_bincount():
     x = np.array([2, 1, 5, 2, 1])
     d = da.from_array(x, chunks=2)
@@ -10,7 +10,7 @@ import dask
 import dask.array as da
 from dask.array.slicing import (_sanitize_index_element, _slice_1d,
                                 new_blockdim, sanitize_index, slice_array,
-                                take, normalize_index)
+                                take, normalize_index, shuffle_plan)
 from dask.array.utils import assert_eq, same_keys
 
 
@@ -273,6 +273,62 @@ def test_take():
     assert chunks == ((20, 20, 20, 20), (4,))
 
 
+@pytest.mark.parametrize('max_branch', [2, 3, 32])
+def test_take_shuffle(max_branch):
+    rs = np.random.RandomState(0)
+    x = np.arange(60 * 4).reshape((60, 4))
+    for chunks in [((7, 3, 10, 10, 20, 10), 2), (5, 4)]:
+        d = da.from_array(x, chunks=chunks)
+        index = rs.randint(0, 60, size=45)
+        blockdims, dsk = take('y', d.name, d.chunks, index, axis=0,
+                              max_branch=max_branch)
+        assert blockdims[0] == tuple(np.diff(np.r_[0:45:max(d.chunks[0]),
+                                                   45]))
+        # Every input block is read once
+        reads = [k for k, v in dsk.items() if d.name in str(v)]
+        assert len(reads) == len(d.chunks[0]) * len(d.chunks[1])
+        # Blocks gather from at most max_branch blocks
+        assert all(len(v[1]) <= max(max_branch, len(d.chunks[0]))
+                   for v in dsk.values() if type(v[1]) is list)
+
+        y = d[index]
+        assert_eq(y, x[index])
+        assert_eq(d[:, index[:3] % 4], x[:, index[:3] % 4])
+        assert_eq(d.T[:, index], x.T[:, index])
+
+    # Duplicates and reversed order
+    d = da.from_array(np.arange(100), chunks=10)
+    index = np.repeat(np.arange(100)[::-1], 3)
+    y = d[index]
+    assert y.chunks == ((10,) * 30,)
+    assert_eq(y, index)
+    assert same_keys(y, d[index])
+
+
+def test_shuffle_plan():
+    src = np.array([3, 0, 2, 1, 3, 3, 0, 1])
+    dst = np.array([0, 0, 0, 1, 1, 2, 2, 3])
+    for max_branch in [2, 4]:
+        plan = shuffle_plan(src, dst, max_branch)
+        assert len(plan) == (2 if max_branch == 2 else 1)
+
+        # Follow the elements through the stages
+        blocks = dict((s, [i for i, b in enumerate(src) if b == s])
+                      for s in set(src))
+        for stage in plan:
+            new = dict()
+            for b, pieces, perm in stage:
+                assert len(pieces) <= max_branch
+                elements = sum([blocks[a] if idx is None
+                                else [blocks[a][i] for i in idx]
+                                for a, idx in pieces], [])
+                if perm is not None:
+                    elements = [elements[i] for i in perm]
+                new[b] = elements
+            blocks = new
+        assert blocks == {0: [0, 1, 2], 1: [3, 4], 2: [5, 6], 3: [7]}
+
+
 def test_take_sorted():
     chunks, dsk = take('y', 'x', [(20, 20, 20, 20)], [1, 3, 5, 47], axis=0)
     expected = {('y', 0): (getitem, ('x', 0), ([1, 3, 5],)),
@@ -1,7 +1,7 @@
 from __future__ import absolute_import, division, print_function
 
 from abc import ABCMeta
-from collections import OrderedDict, Iterator
+from collections import OrderedDict, Iterator, namedtuple
 from functools import partial
 from hashlib import md5
 import inspect
@@ -15,7 +15,7 @@ from toolz import merge, groupby, curry, identity
 from toolz.functoolz import Compose
 
 from .compatibility import long, unicode
-from .context import _globals, thread_state
+from .context import _globals, thread_state, GlobalMethod
 from .core import flatten
 from .hashing import hash_buffer_hex
 from .utils import Dispatch, ensure_dict
@@ -23,7 +23,7 @@ from .utils import Dispatch, ensure_dict
 
 __all__ = ("DaskMethodsMixin",
            "is_dask_collection",
-           "compute", "persist", "visualize",
+           "compute", "persist", "visualize", "estimate_memory",
            "tokenize", "normalize_token")
 
 
@@ -226,20 +226,32 @@ def collections_to_dsk(collections, optimize_graph=True, **kwargs):
     """
     optimizations = (kwargs.pop('optimizations', None) or
                      _globals.get('optimizations', []))
+    cache = _globals.get('dependency_cache')
+    registered = []
 
-    if optimize_graph:
-        groups = groupby(optimization_function, collections)
-        groups = {opt: _extract_graph_and_keys(val)
-                  for opt, val in groups.items()}
-
-        for opt in optimizations:
-            groups = {k: (opt(dsk, keys), keys)
-                      for k, (dsk, keys) in groups.items()}
-
-        dsk = merge(*(opt(dsk, keys, **kwargs)
-                      for opt, (dsk, keys) in groups.items()))
-    else:
-        dsk, _ = _extract_graph_and_keys(collections)
+    try:
+        if optimize_graph:
+            groups = {}
+            for opt, val in groupby(optimization_function,
+                                    collections).items():
+                dsk, keys = _extract_graph_and_keys(val)
+                groups[opt] = (dsk, keys)
+                layers = _graph_layers(val) if cache is not None else None
+                if layers is not None:
+                    cache.register(dsk, cache.dependencies(dsk, layers))
+                    registered.append(dsk)
+
+            for opt in optimizations:
+                groups = {k: (opt(dsk, keys), keys)
+                          for k, (dsk, keys) in groups.items()}
+
+            dsk = merge(*(opt(dsk, keys, **kwargs)
+                          for opt, (dsk, keys) in groups.items()))
+        else:
+            dsk, _ = _extract_graph_and_keys(collections)
+    finally:
+        for d in registered:
+            cache.release(d)
 
     return dsk
 
@@ -249,11 +261,15 @@ def _extract_graph_and_keys(vals):
     that ``get(dsk, keys)`` is equivalent to ``[v.compute() v in vals]``."""
     dsk = {}
     keys = []
+    merged = set()
     for v in vals:
         d = v.__dask_graph__()
         if hasattr(d, 'dicts'):
-            for dd in d.dicts.values():
-                dsk.update(dd)
+            # Collections often share layers, only merge each once
+            for name, dd in d.dicts.items():
+                if name not in merged:
+                    merged.add(name)
+                    dsk.update(dd)
         else:
             dsk.update(d)
         keys.append(v.__dask_keys__())
@@ -261,6 +277,19 @@ def _extract_graph_and_keys(vals):
     return dsk, keys
 
 
+def _graph_layers(vals):
+    """ The layers of the graphs of dask vals by name, or None if any graph
+    isn't made of layers """
+    layers = {}
+    for v in vals:
+        d = v.__dask_graph__()
+        if not hasattr(d, 'dicts'):
+            return None
+        for name, dd in d.dicts.items():
+            layers.setdefault(name, dd)
+    return layers
+
+
 def compute(*args, **kwargs):
     """Compute several dask collections at once.
 
@@ -287,6 +316,18 @@ def compute(*args, **kwargs):
     kwargs
         Extra keywords to forward to the scheduler ``get`` function.
 
+    Notes
+    -----
+    For small graphs the overhead of optimizing and scheduling can outweigh
+    the cost of the tasks themselves. The ``small_graph_threshold`` option
+    computes graphs with fewer tasks than the threshold directly in the
+    calling thread, without optimization, when no scheduler is specified.
+    This lowers latency for interactive use, but gives up parallelism, so
+    is only appropriate when individual tasks are cheap.
+
+    >>> with dask.set_options(small_graph_threshold=50):  # doctest: +SKIP
+    ...     compute(a, b)
+
     Examples
     --------
     >>> import dask.array as da
@@ -318,6 +359,11 @@ def compute(*args, **kwargs):
         from distributed.worker import get_worker
         get = get_worker().client.get
 
+    if not get and _is_small_graph(variables):
+        from .local import get_inline
+        get = get_inline
+        optimize_graph = False
+
     if not get:
         get = variables[0].__dask_scheduler__
         if not all(a.__dask_scheduler__ == get for a in variables):
@@ -336,6 +382,45 @@ def compute(*args, **kwargs):
                  for f, a in postcomputes)
 
 
+def _is_small_graph(collections):
+    """ Whether collections may be computed with ``dask.local.get_inline``
+
+    This is the case if their graphs have fewer than ``small_graph_threshold``
+    tasks (set with ``set_options``, disabled by default), no callbacks are
+    registered, and their optimizations haven't been overridden.
+    """
+    threshold = _globals.get('small_graph_threshold')
+    if (not threshold or _globals['callbacks'] or
+            _globals.get('optimizations')):
+        return False
+    n = 0
+    for c in collections:
+        if not _has_default_optimize(c):
+            return False
+        dsk = c.__dask_graph__()
+        if hasattr(dsk, 'dicts'):
+            n += sum(map(len, dsk.dicts.values()))
+        else:
+            n += len(dsk)
+        if n >= threshold:
+            return False
+    return True
+
+
+def _has_default_optimize(x):
+    """ Whether the optimization of a collection is its builtin default
+
+    Defaults are only there for performance, and so may be skipped. Custom
+    optimizations may be required for correctness.
+    """
+    for cls in inspect.getmro(type(x)):
+        if '__dask_optimize__' in cls.__dict__:
+            method = cls.__dict__['__dask_optimize__']
+            return (isinstance(method, GlobalMethod) and
+                    method._key not in _globals)
+    return True
+
+
 def visualize(*args, **kwargs):
     """
     Visualize several dask graphs at once.
@@ -504,6 +589,175 @@ def persist(*args, **kwargs):
                  for r, ks, s in postpersists)
 
 
+MemoryEstimate = namedtuple('MemoryEstimate', ('nbytes', 'key', 'keys'))
+
+
+def estimate_memory(*args, **kwargs):
+    """ Estimate the peak memory needed to compute several dask collections
+
+    This walks through the graph in the same order as the local schedulers in
+    ``dask.local.get_async``, holding and releasing results under the same
+    rules as ``finish_task``, but without running any tasks. The returned
+    estimate covers the data held by the scheduler between tasks; memory used
+    internally by a running task is not included.
+
+    The size of each result is estimated by, in order of preference:
+
+    1. The ``sizes`` keyword
+    2. ``dask.sizeof.sizeof`` for concrete data in the graph
+    3. Collection metadata. For arrays this is the chunk shape and dtype, for
+       dataframes the size of a row of ``_meta`` times ``rows_per_partition``
+    4. The largest estimate among the task's dependencies, or ``default`` if
+       it has none
+
+    Parameters
+    ----------
+    args : dask collections
+    sizes : dict, optional
+        Mapping of key to size in bytes, overriding all other estimates.
+    rows_per_partition : int, optional
+        Expected number of rows in each dataframe partition. If not provided
+        dataframe metadata is not used.
+    default : int, optional
+        Size in bytes used for tasks with no other estimate. Defaults to 0.
+    num_workers : int, optional
+        Number of tasks the simulated scheduler runs at once. Defaults to 1.
+    optimize_graph : bool, optional
+        If True [default], the graph is optimized before simulation.
+    kwargs
+        Extra keywords to forward to the optimization passes.
+
+    Returns
+    -------
+    MemoryEstimate
+        A namedtuple of the peak number of bytes held, the key whose
+        completion caused the peak, and the keys held at that time.
+
+    Examples
+    --------
+    >>> import dask.array as da
+    >>> x = da.ones((1000, 1000), chunks=(100, 1000))
+    >>> estimate_memory(x).nbytes
+    8000000
+
+    Intermediate results don't carry metadata, so their sizes may need to be
+    provided explicitly. Here the chunks of ``x`` are only intermediates of
+    the sum, and are taken to be as small as the sums of each chunk
+
+    >>> total = x.sum()
+    >>> estimate_memory(total, optimize_graph=False).nbytes
+    8
+    >>> sizes = {k: 800000 if k[0] == x.name else 8
+    ...          for k in total.__dask_graph__()}
+    >>> estimate_memory(total, sizes=sizes, optimize_graph=False).nbytes
+    800032
+    """
+    from .local import start_state_from_dask, finish_task, release_data
+    from .optimize import cull
+    from .order import order
+    from .sizeof import sizeof
+
+    sizes = kwargs.pop('sizes', None) or {}
+    rows_per_partition = kwargs.pop('rows_per_partition', None)
+    default = kwargs.pop('default', 0)
+    num_workers = kwargs.pop('num_workers', 1)
+    optimize_graph = kwargs.pop('optimize_graph', True)
+
+    collections = [a for a in args if is_dask_collection(a)]
+    if not collections:
+        return MemoryEstimate(0, None, [])
+
+    dsk = collections_to_dsk(collections, optimize_graph, **kwargs)
+    keys = list(flatten([c.__dask_keys__() for c in collections]))
+    results = set(keys)
+
+    known = {}
+    for c in collections:
+        known.update(_metadata_nbytes(c, rows_per_partition))
+
+    dsk, dependencies = cull(dsk, keys)
+    keyorder = order(dsk)
+    state = start_state_from_dask(dsk, cache={}, sortkey=keyorder.get)
+
+    nbytes = {}
+    # Step at which each key entered and left the (simulated) cache
+    stored = {}
+    freed = {}
+    step = [0]
+    held = [0]
+
+    def estimate(key):
+        if key in sizes:
+            return sizes[key]
+        if key in state['cache']:
+            return sizeof(state['cache'][key])
+        if key in known:
+            return known[key]
+        deps = [nbytes[dep] for dep in dependencies[key] if dep in nbytes]
+        return max(deps) if deps else default
+
+    def release(key, state, delete=True):
+        release_data(key, state, delete=delete)
+        held[0] -= nbytes[key]
+        freed[key] = step[0]
+
+    for key in state['cache']:
+        nbytes[key] = estimate(key)
+        stored[key] = 0
+        held[0] += nbytes[key]
+    peak = (held[0], None, 0)
+
+    running = []
+    while state['ready'] or running:
+        while state['ready'] and len(running) < num_workers:
+            key = state['ready'].pop()
+            state['running'].add(key)
+            running.append(key)
+        # Assume tasks finish in the order they were started
+        key = running.pop(0)
+        step[0] += 1
+        nbytes[key] = estimate(key)
+        stored[key] = step[0]
+        state['cache'][key] = None
+        held[0] += nbytes[key]
+        if held[0] > peak[0]:
+            peak = (held[0], key, step[0])
+        finish_task(dsk, key, state, results, keyorder.get,
+                    release_data=release)
+
+    total, key, when = peak
+    held_keys = [k for k, v in stored.items()
+                 if v <= when and freed.get(k, when) >= when]
+    return MemoryEstimate(total, key, held_keys)
+
+
+def _metadata_nbytes(x, rows_per_partition=None):
+    """ Estimate the size of each output key of a collection from metadata
+
+    Returns a dict mapping key to size in bytes, with no entries if the
+    metadata is insufficient.
+    """
+    # Check the type, as ``Delayed`` objects have every attribute
+    cls = type(x)
+    keys = list(flatten(x.__dask_keys__()))
+    if hasattr(cls, 'chunks') and hasattr(cls, 'dtype'):
+        from itertools import product
+        from operator import mul
+        from functools import reduce
+        itemsize = x.dtype.itemsize
+        shapes = product(*x.chunks)
+        return {k: reduce(mul, shape, itemsize)
+                for k, shape in zip(keys, shapes)}
+    if (rows_per_partition is not None and hasattr(cls, '_meta_nonempty') and
+            hasattr(cls, 'npartitions')):
+        from .sizeof import sizeof
+        nonempty = x._meta_nonempty
+        per_row = (sizeof(nonempty) - sizeof(x._meta)) / max(len(nonempty), 1)
+        nbytes = sizeof(x._meta) + int(per_row * rows_per_partition)
+        return dict.fromkeys(keys, nbytes)
+    return {}
+
+
 ############
 # Tokenize #
 ############
@@ -0,0 +1,115 @@
+from __future__ import absolute_import, division, print_function
+
+import os
+import pickle
+import shutil
+import uuid
+from timeit import default_timer
+
+from .base import tokenize
+from .callbacks import Callback
+from .core import quote
+from .utils import key_split
+
+
+class Checkpoint(Callback):
+    """ Save results to disk so that failed computations can be resumed
+
+    Results of selected tasks are written to a local directory as they
+    complete. When a graph containing those keys is computed again, the saved
+    results are loaded in place of their tasks, so that neither they nor any
+    of the tasks they depend on are rerun.
+
+    Parameters
+    ----------
+    directory : str
+        Directory in which to store results. Created if it doesn't exist.
+    prefixes : iterable of str, optional
+        Only save results of keys with these prefixes, as determined by
+        ``dask.utils.key_split``.
+    min_duration : float, optional
+        Only save results of tasks that took at least this many seconds.
+
+    If neither ``prefixes`` nor ``min_duration`` are given all results are
+    saved.
+
+    Examples
+    --------
+
+    >>> ckpt = Checkpoint('/tmp/checkpoint', prefixes=['read-csv'])  # doctest: +SKIP
+
+    The checkpoint can be used as a context manager around ``compute`` or
+    ``get`` calls:
+
+    >>> with ckpt:          # doctest: +SKIP
+    ...     result = x.compute()
+
+    If this computation fails, rerunning it within the same checkpoint skips
+    any tasks whose results were saved. Once no longer needed, the saved
+    results can be removed:
+
+    >>> ckpt.clear()        # doctest: +SKIP
+
+    Keys are used to identify results, so graphs should use consistent key
+    names (as dask.array, dask.dataframe, dask.bag, and dask.delayed with
+    ``pure=True`` do).
+    """
+
+    def __init__(self, directory, prefixes=None, min_duration=None):
+        self.directory = directory
+        self.prefixes = set(prefixes) if prefixes is not None else None
+        self.min_duration = min_duration
+        self.starttimes = dict()
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+
+    def _path(self, key):
+        return os.path.join(self.directory, tokenize(key) + '.pkl')
+
+    def __contains__(self, key):
+        return os.path.exists(self._path(key))
+
+    def load(self, key):
+        """ Load the saved result of ``key`` """
+        with open(self._path(key), 'rb') as f:
+            return pickle.load(f)
+
+    def save(self, key, value):
+        """ Save the result of ``key`` """
+        # Write to a temporary file first, so that interruptions never leave
+        # a partially written result behind
+        fn = self._path(key)
+        tmp = '%s.%s.tmp' % (fn, uuid.uuid4().hex)
+        with open(tmp, 'wb') as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.rename(tmp, fn)
+
+    def clear(self):
+        """ Remove all saved results """
+        shutil.rmtree(self.directory)
+        os.makedirs(self.directory)
+
+    def _start(self, dsk):
+        saved = set(os.listdir(self.directory))
+        if not saved:
+            return
+        for key in list(dsk):
+            if os.path.basename(self._path(key)) in saved:
+                dsk[key] = quote(self.load(key))
+
+    def _pretask(self, key, dsk, state):
+        if self.min_duration is not None:
+            self.starttimes[key] = default_timer()
+
+    def _posttask(self, key, value, dsk, state, id):
+        if self.prefixes is not None and key_split(key) not in self.prefixes:
+            return
+        if self.min_duration is not None:
+            duration = default_timer() - self.starttimes.pop(key)
+            if duration < self.min_duration:
+                return
+        if key not in self:
+            self.save(key, value)
+
+    def _finish(self, dsk, state, errored):
+        self.starttimes.clear()
@@ -29,6 +29,32 @@ class set_options(object):
             likely to contain functions.  Defaults to
             cloudpickle.loads/cloudpickle.dumps
         optimizations - List of additional optimizations to run
+        small_graph_threshold - Compute graphs with fewer tasks than this
+            inline in the calling thread, see ``dask.compute``
+        fuse_by_size - Fuse tasks by estimated output size rather than graph
+            structure, see ``dask.optimize.fuse_by_size``
+        fuse_num_workers - Number of workers that ``fuse_by_size`` keeps
+            busy, by default the number of cores
+        dependency_cache - Reuse the dependencies of graph layers across
+            computations, see ``dask.core.DependencyCache``
+        retry - Policy to retry failing tasks, or a dict mapping key prefixes
+            to policies, see ``dask.local.Retry``
+        task_history - Recorded task durations and sizes to use in
+            optimizations, see ``dask.diagnostics.TaskHistory``
+        rechunk_method - How to rechunk dask arrays, 'tasks', 'disk' or
+            'auto', see ``dask.array.rechunk``
+        rechunk_task_overhead/rechunk_bandwidth - Seconds per task and bytes
+            copied per second assumed when choosing rechunk plans by their
+            cost, see ``dask.array.rechunk.calibrate_rechunk``
+        split_every - Fan-in of tree reductions of dask arrays, or 'auto' to
+            choose it from the size of intermediate results
+        reduction_combine_size - Bytes of intermediate results combined at
+            once with ``split_every='auto'``, see
+            ``dask.array.reductions.auto_split_every``
+        fuse_elemwise - Whether to fuse elementwise operations of dask arrays
+            into kernels that reuse memory, defaults to True unless
+            ``fuse_ave_width`` is 0, see
+            ``dask.array.optimization.fuse_elemwise_kernels``
 
     Examples
     --------
@@ -1,6 +1,8 @@
 from __future__ import absolute_import, division, print_function
 
+from collections import OrderedDict
 from itertools import chain
+from threading import Lock
 
 from .utils_test import add, inc  # noqa: F401
 
@@ -232,6 +234,159 @@ def get_deps(dsk):
     return dependencies, dependents
 
 
+class DependencyCache(object):
+    """ Cache of the dependencies of graph layers, to reuse across computations
+
+    Every computation finds the dependencies of all of its tasks.  When a
+    collection is extended step by step and computed after each step, most
+    of its layers are the same every time.  With this cache the dependencies
+    of a layer are found once, and only new layers are inspected.
+
+    The cache is used when collections are computed with it set in
+    ``set_options``, by ``cull`` and so by the optimizations of the dask
+    collections.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of layers to hold, the least recently used are evicted
+        first
+
+    Examples
+    --------
+    >>> cache = DependencyCache()
+    >>> dsk = {'x': 1, 'y': (inc, 'x'), 'z': (add, 'y', 'x')}
+    >>> layers = {'x': {'x': 1}, 'yz': {'y': (inc, 'x'), 'z': (add, 'y', 'x')}}
+    >>> sorted(cache.dependencies(dsk, layers)['z'])
+    ['x', 'y']
+
+    >>> with dask.set_options(dependency_cache=cache):  # doctest: +SKIP
+    ...     x.compute()
+
+    Notes
+    -----
+    Entries are only reused for the same layer object, so the cache holds a
+    reference to every layer in it.  A layer is inspected again if any of the
+    objects in its tasks that were not keys of the graph before are keys of
+    the graph at hand, or if any of its dependencies outside the layer are
+    missing, so results are always the same as those of
+    ``get_dependencies``.
+    """
+    def __init__(self, maxsize=1000):
+        self.maxsize = maxsize
+        self.layers = OrderedDict()
+        self.graphs = dict()
+        self.lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def dependencies(self, dsk, layers):
+        """ Dependencies of all keys of a graph
+
+        Parameters
+        ----------
+        dsk : dict
+            The graph
+        layers : dict
+            Mapping of names to the layers that make up ``dsk``
+
+        Returns
+        -------
+        Dict mapping ``{key: [deps]}``
+        """
+        contains = dsk.__contains__
+        result = dict()
+        with self.lock:
+            for name, layer in layers.items():
+                entry = self.layers.pop(name, None)
+                if (entry is not None and entry[0] is layer and
+                        all(map(contains, entry[2])) and
+                        not any(map(contains, entry[3]))):
+                    self.hits += 1
+                else:
+                    self.misses += 1
+                    entry = _layer_dependencies(layer, dsk)
+                self.layers[name] = entry
+                result.update(entry[1])
+            while len(self.layers) > self.maxsize:
+                self.layers.popitem(last=False)
+        return result
+
+    def register(self, dsk, dependencies):
+        """ Remember the dependencies of graph ``dsk`` until ``release`` """
+        with self.lock:
+            self.graphs[id(dsk)] = (dsk, dependencies)
+
+    def release(self, dsk):
+        with self.lock:
+            self.graphs.pop(id(dsk), None)
+
+    def get(self, dsk):
+        """ Dependencies of a registered graph, or None """
+        with self.lock:
+            entry = self.graphs.get(id(dsk))
+        if entry is not None and entry[0] is dsk:
+            return entry[1]
+
+    def clear(self):
+        with self.lock:
+            self.layers.clear()
+            self.graphs.clear()
+
+    def __len__(self):
+        return len(self.layers)
+
+
+def _layer_dependencies(layer, dsk):
+    """ Dependencies of the keys of a layer of ``dsk``
+
+    Returns the layer, its dependencies, its dependencies outside the layer
+    and the other hashable objects in its tasks.
+    """
+    dependencies = dict()
+    external = set()
+    literals = set()
+    for key, task in layer.items():
+        deps = []
+        for w in _hashable_leaves(task):
+            if w in dsk:
+                deps.append(w)
+                if w not in layer:
+                    external.add(w)
+            else:
+                literals.add(w)
+        dependencies[key] = deps
+    return layer, dependencies, external, literals
+
+
+def _hashable_leaves(task):
+    """ Objects in a task that are dependencies if they are in the graph
+
+    Traverses the task like ``get_dependencies``
+    """
+    result = []
+    work = [task]
+    while work:
+        new_work = []
+        for w in work:
+            typ = type(w)
+            if typ is tuple and w and callable(w[0]):  # istask(w)
+                new_work += w[1:]
+            elif typ is list:
+                new_work += w
+            elif typ is dict:
+                new_work += w.values()
+            else:
+                try:
+                    hash(w)
+                except TypeError:  # not hashable
+                    pass
+                else:
+                    result.append(w)
+        work = new_work
+    return result
+
+
 def flatten(seq, container=list):
     """
 
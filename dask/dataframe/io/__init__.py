@@ -6,7 +6,8 @@ from .io import (from_array, from_bcolz, from_array, from_bcolz,
 from .csv import read_csv, to_csv, read_table
 from .hdf import read_hdf, to_hdf
 from .sql import read_sql_table
-from . import demo
+from ...utils import LazyModule
+demo = LazyModule('dask.dataframe.io.demo')
 try:
     from .parquet import read_parquet, to_parquet
 except ImportError:
@@ -12,13 +12,13 @@ except ImportError:
 from . import threaded
 from .base import Base, is_dask_collection, dont_optimize
 from .base import tokenize as _tokenize
-from .compatibility import apply
+from .compatibility import apply, long, unicode
 from .core import quote
 from .context import _globals, globalmethod
 from .utils import funcname, methodcaller, OperatorMethodMixin
 from . import sharedict
 
-__all__ = ['Delayed', 'delayed']
+__all__ = ['Delayed', 'delayed', 'batch']
 
 
 def unzip(ls, nout):
@@ -451,6 +451,28 @@ def call_function(func, func_token, args, kwargs, pure=None, nout=None):
         name = dask_key_name
 
     dsk = sharedict.ShareDict()
+    args = merge_args(args, dsk)
+
+    if kwargs:
+        dask_kwargs, dsk2 = to_task_dask(kwargs)
+        dsk.update(dsk2)
+        task = (apply, func, list(args), dask_kwargs)
+    else:
+        task = (func,) + args
+
+    dsk.update_with_key({name: task}, key=name)
+    nout = nout if nout is not None else None
+    return Delayed(name, dsk, length=nout)
+
+
+# Types that ``to_task_dask`` passes through unchanged
+literal_types = {int, long, float, complex, bool, str, unicode, bytes,
+                 type(None)}
+
+
+def merge_args(args, dsk):
+    """Normalize arguments with ``to_task_dask``, merging their graphs into
+    the ``ShareDict`` ``dsk``. Returns a tuple of the normalized arguments."""
     args_dasks = list(map(to_task_dask, args))
     for arg, d in args_dasks:
         if isinstance(d, sharedict.ShareDict):
@@ -459,19 +481,95 @@ def call_function(func, func_token, args, kwargs, pure=None, nout=None):
             dsk.update_with_key(d, key=arg)
         else:
             dsk.update(d)
+    return tuple(pluck(0, args_dasks))
 
-    args = tuple(pluck(0, args_dasks))
 
-    if kwargs:
+def batch(func, *iterables, **kwargs):
+    """Lazily apply a function to every element of one or more iterables.
+
+    This is equivalent to
+
+    >>> [delayed(func)(*args, **kwargs)
+    ...  for args in zip(*iterables)]  # doctest: +SKIP
+
+    but is much cheaper for large numbers of calls. All calls are placed in a
+    single graph layer shared by every output, and the function and keyword
+    arguments (common to all calls) are normalized and hashed only once.
+
+    Parameters
+    ----------
+    func : callable or Delayed
+        The function to apply. If a ``Delayed`` function created by
+        ``delayed`` is passed its ``pure`` and ``nout`` settings are used.
+    *iterables : iterables
+        Positional arguments for each call, as in the builtin ``map``.
+    pure : bool, optional
+        Whether ``func`` is pure, see ``delayed``.
+    nout : int, optional
+        The number of outputs returned by each call, see ``delayed``.
+    dask_key_name : str, optional
+        The name of the layer. Each output has the key ``(name, i)``.
+    **kwargs
+        Keyword arguments passed to every call.
+
+    Returns
+    -------
+    A list of ``Delayed`` objects, one per call.
+
+    Examples
+    --------
+    >>> def add(a, b):
+    ...     return a + b
+    >>> out = batch(add, [1, 2, 3], [10, 20, 30], pure=True)
+    >>> len(out)
+    3
+    >>> out[0].key  # doctest: +SKIP
+    ('add-c0fb6e5d1ca5bdd4b5a6ee0e4d3e1c54', 0)
+    >>> import dask
+    >>> dask.compute(*out)
+    (11, 22, 33)
+    """
+    pure = kwargs.pop('pure', None)
+    nout = kwargs.pop('nout', None)
+    name = kwargs.pop('dask_key_name', None)
+
+    if isinstance(func, DelayedLeaf):
+        pure = func._pure if pure is None else pure
+        nout = func._nout if nout is None else nout
+        func = func._obj
+
+    iterables = [list(it) for it in iterables]
+    if name is None:
+        if isinstance(func, Delayed):
+            prefix, func_token = 'apply', func.key
+        else:
+            prefix, func_token = funcname(func), func
+        name = '%s-%s' % (prefix,
+                          tokenize(func_token, kwargs, *iterables, pure=pure))
+
+    dsk = sharedict.ShareDict()
+    # Calling a ``Delayed`` function requires it to be an argument of apply
+    if isinstance(func, Delayed):
+        func, = merge_args((func,), dsk)
+        head = (apply, func)
+    else:
+        head = (func,) if not kwargs else (apply, func)
+    if kwargs or len(head) == 2:
         dask_kwargs, dsk2 = to_task_dask(kwargs)
         dsk.update(dsk2)
-        task = (apply, func, list(args), dask_kwargs)
-    else:
-        task = (func,) + args
 
-    dsk.update_with_key({name: task}, key=name)
-    nout = nout if nout is not None else None
-    return Delayed(name, dsk, length=nout)
+    layer = {}
+    for i, args in enumerate(zip(*iterables)):
+        # Skip normalization for arguments that never contain dask objects
+        if not all(type(a) in literal_types for a in args):
+            args = merge_args(args, dsk)
+        if len(head) == 2:
+            layer[(name, i)] = head + (list(args), dask_kwargs)
+        else:
+            layer[(name, i)] = head + args
+
+    dsk.update_with_key(layer, key=name)
+    return [Delayed((name, i), dsk, length=nout) for i in range(len(layer))]
 
 
 class DelayedLeaf(Delayed):
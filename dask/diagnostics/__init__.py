@@ -1,5 +1,10 @@
 from __future__ import absolute_import, division, print_function
 
-from .profile import Profiler, ResourceProfiler, CacheProfiler
+from .profile import (Profiler, ResourceProfiler, CacheProfiler,
+                      MemoryProfiler)
 from .progress import ProgressBar
 from .profile_visualize import visualize
+from ..utils import ignoring
+
+with ignoring(ImportError):
+    from .history import TaskHistory
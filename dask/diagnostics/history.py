@@ -0,0 +1,252 @@
+from __future__ import absolute_import, division, print_function
+
+from collections import namedtuple
+from contextlib import closing
+import os
+import sqlite3
+import threading
+from timeit import default_timer
+
+from ..callbacks import Callback
+from ..core import istask
+from ..sizeof import sizeof
+from ..utils import funcname, key_split
+
+
+# Mean and maximum duration and output size of a group of tasks
+TaskStats = namedtuple('TaskStats', ('count', 'duration', 'max_duration',
+                                     'nbytes', 'max_nbytes'))
+
+_schema = """
+CREATE TABLE IF NOT EXISTS tasks (
+    prefix TEXT NOT NULL,
+    func TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    duration REAL NOT NULL,
+    max_duration REAL NOT NULL,
+    nbytes REAL NOT NULL,
+    max_nbytes INTEGER NOT NULL,
+    PRIMARY KEY (prefix, func)
+)
+"""
+
+
+def default_path():
+    return os.path.join(os.path.expanduser('~'), '.dask', 'task-history.db')
+
+
+class TaskHistory(Callback):
+    """ A persistent record of task durations and output sizes
+
+    Records how long tasks take and how large their results are, per key
+    prefix (as given by ``key_split``) and function.  The statistics are
+    added to a SQLite database file when each computation finishes, so that
+    they accumulate across computations and sessions.
+
+    The history may be queried for the expected duration and output size of
+    tasks.  Set with ``set_options(task_history=...)``, it is used by
+    ``dask.optimize.fuse_by_size`` to estimate the costs and sizes of tasks.
+
+    Parameters
+    ----------
+    path : str, optional
+        Path of the database file, which is created if it doesn't exist.
+        Defaults to ``~/.dask/task-history.db``.
+
+    Examples
+    --------
+    >>> from operator import add, mul
+    >>> from dask.threaded import get
+    >>> dsk = {'x': 1, 'y': (add, 'x', 10), 'z': (mul, 'y', 2)}
+    >>> history = TaskHistory('history.db')  # doctest: +SKIP
+    >>> with history:  # doctest: +SKIP
+    ...     get(dsk, 'z')
+    22
+
+    >>> history.stats()  # doctest: +SKIP
+    {('y', 'add'): TaskStats(count=1, duration=1.2e-06, max_duration=1.2e-06,
+                             nbytes=28.0, max_nbytes=28),
+     ('z', 'mul'): TaskStats(count=1, duration=1.0e-06, max_duration=1.0e-06,
+                             nbytes=28.0, max_nbytes=28)}
+    >>> history.duration('y')  # doctest: +SKIP
+    1.2e-06
+
+    Record all computations, and use the history when optimizing
+
+    >>> history.register()  # doctest: +SKIP
+    >>> dask.set_options(task_history=history)  # doctest: +SKIP
+    """
+    def __init__(self, path=None):
+        if path is None:
+            path = default_path()
+        directory = os.path.dirname(os.path.abspath(path))
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        self.path = path
+        self._lock = threading.Lock()
+        self._start_times = {}
+        self._pending = {}
+        self._prefixes = None
+        with self._connect() as conn:
+            conn.execute(_schema)
+
+    def _connect(self):
+        # A connection per use, as callbacks may run in worker threads
+        return closing(sqlite3.connect(self.path, timeout=30))
+
+    def _pretask(self, key, dsk, state):
+        self._start_times[key] = default_timer()
+
+    def _posttask(self, key, value, dsk, state, id):
+        duration = default_timer() - self._start_times.pop(key)
+        task = dsk[key]
+        func = funcname(task[0]) if istask(task) else ''
+        nbytes = sizeof(value)
+        group = (key_split(key), func)
+        with self._lock:
+            stats = self._pending.get(group)
+            if stats is None:
+                self._pending[group] = [1, duration, duration, nbytes, nbytes]
+            else:
+                stats[0] += 1
+                stats[1] += duration
+                stats[2] = max(stats[2], duration)
+                stats[3] += nbytes
+                stats[4] = max(stats[4], nbytes)
+
+    def _finish(self, dsk, state, errored):
+        self.flush()
+
+    def flush(self):
+        """ Write the statistics of finished tasks to the database """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return
+        with self._connect() as conn:
+            with conn:
+                for (prefix, func), stats in pending.items():
+                    count, duration, max_duration, nbytes, max_nbytes = stats
+                    cursor = conn.execute(
+                        "UPDATE tasks SET count = count + ?, "
+                        "duration = duration + ?, "
+                        "max_duration = max(max_duration, ?), "
+                        "nbytes = nbytes + ?, "
+                        "max_nbytes = max(max_nbytes, ?) "
+                        "WHERE prefix = ? AND func = ?",
+                        (count, duration, max_duration, nbytes, max_nbytes,
+                         prefix, func))
+                    if not cursor.rowcount:
+                        conn.execute("INSERT INTO tasks VALUES "
+                                     "(?, ?, ?, ?, ?, ?, ?)",
+                                     (prefix, func) + tuple(stats))
+        self._prefixes = None
+
+    def clear(self):
+        """ Remove all recorded statistics """
+        with self._lock:
+            self._pending.clear()
+            self._start_times.clear()
+        with self._connect() as conn:
+            with conn:
+                conn.execute("DELETE FROM tasks")
+        self._prefixes = None
+
+    def stats(self, prefix=None, func=None):
+        """ Statistics of tasks by prefix and function
+
+        Parameters
+        ----------
+        prefix, func : str, optional
+            Only include tasks with this key prefix or function name
+
+        Returns
+        -------
+        Dict mapping ``{(prefix, func): TaskStats}``
+        """
+        query = ("SELECT prefix, func, count, duration, max_duration, nbytes, "
+                 "max_nbytes FROM tasks")
+        conditions = []
+        args = []
+        if prefix is not None:
+            conditions.append("prefix = ?")
+            args.append(prefix)
+        if func is not None:
+            conditions.append("func = ?")
+            args.append(func)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        with self._connect() as conn:
+            rows = conn.execute(query, args).fetchall()
+        return {(row[0], row[1]): _stats(*row[2:]) for row in rows}
+
+    def prefixes(self):
+        """ Statistics of tasks by key prefix, over all functions
+
+        Returns
+        -------
+        Dict mapping ``{prefix: TaskStats}``
+        """
+        if self._prefixes is None:
+            with self._connect() as conn:
+                rows = conn.execute(
+                    "SELECT prefix, sum(count), sum(duration), "
+                    "max(max_duration), sum(nbytes), max(max_nbytes) "
+                    "FROM tasks GROUP BY prefix").fetchall()
+            self._prefixes = {row[0]: _stats(*row[1:]) for row in rows}
+        return self._prefixes
+
+    def duration(self, key):
+        """ Mean duration of tasks with the prefix of ``key``, or None """
+        stats = self.prefixes().get(key_split(key))
+        return stats.duration if stats is not None else None
+
+    def nbytes(self, key):
+        """ Mean output size of tasks with the prefix of ``key``, or None """
+        stats = self.prefixes().get(key_split(key))
+        return stats.nbytes if stats is not None else None
+
+    def costs(self, dsk):
+        """ Expected durations of the tasks of a graph
+
+        Tasks with unknown prefixes are expected to take the mean duration of
+        all recorded tasks.  Data costs nothing.
+
+        Returns
+        -------
+        Dict mapping ``{key: duration}``, or None if nothing is recorded
+        """
+        prefixes = self.prefixes()
+        if not prefixes:
+            return None
+        total = sum(s.duration * s.count for s in prefixes.values())
+        default = total / sum(s.count for s in prefixes.values())
+        result = {}
+        for k, v in dsk.items():
+            if istask(v):
+                stats = prefixes.get(key_split(k))
+                result[k] = stats.duration if stats is not None else default
+            else:
+                result[k] = 0
+        return result
+
+    def sizes(self, dsk):
+        """ Expected output sizes of the tasks of a graph
+
+        Returns
+        -------
+        Dict mapping ``{key: nbytes}`` for tasks with known prefixes
+        """
+        prefixes = self.prefixes()
+        result = {}
+        for k, v in dsk.items():
+            if istask(v):
+                stats = prefixes.get(key_split(k))
+                if stats is not None:
+                    result[k] = stats.nbytes
+        return result
+
+
+def _stats(count, duration, max_duration, nbytes, max_nbytes):
+    return TaskStats(count, duration / count, max_duration, nbytes / count,
+                     max_nbytes)
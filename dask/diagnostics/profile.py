@@ -7,7 +7,8 @@ from time import sleep
 from multiprocessing import Process, Pipe, current_process
 
 from ..callbacks import Callback
-from ..utils import import_required
+from ..sizeof import sizeof
+from ..utils import import_required, key_split
 
 
 # Stores execution data for each task
@@ -364,3 +365,133 @@ class CacheProfiler(Callback):
         self._cache = {}
         self._dsk = {}
         self._start_time = None
+
+
+MemoryPeak = namedtuple('MemoryPeak', ('time', 'nbytes', 'keys'))
+MemoryGroupData = namedtuple('MemoryGroupData', ('name', 'count', 'nbytes',
+                                                 'peak_nbytes', 'byte_seconds'))
+
+
+class MemoryProfiler(CacheProfiler):
+    """A profiler for the memory held in the scheduler cache.
+
+    Records the following information for each key held by the scheduler:
+        1. Key
+        2. Task
+        3. Size in bytes, as measured by ``dask.sizeof.sizeof``
+        4. Cache entry time in seconds since the epoch
+        5. Cache exit time in seconds since the epoch
+
+    Additionally the total number of bytes resident in the scheduler cache when
+    each task finishes (including inputs released by that task) is recorded in
+    ``timeline``, as ``(time, nbytes)`` pairs.
+
+    Examples
+    --------
+
+    >>> from operator import add, mul
+    >>> from dask.threaded import get
+    >>> dsk = {'x': 1, 'y': (add, 'x', 10), 'z': (mul, 'y', 2)}
+    >>> with MemoryProfiler() as mprof:
+    ...     get(dsk, 'z')
+    22
+
+    >>> mprof.results    # doctest: +SKIP
+    [CacheData('x', 1, 28, 1435352238.48039, 1435352238.480655),
+     CacheData('y', (add, 'x', 10), 28, 1435352238.48039, 1435352238.480803),
+     CacheData('z', (mul, 'y', 2), 28, 1435352238.480657, 1435352238.480803)]
+
+    The peak number of bytes held at once, along with the keys responsible,
+    is available as ``peak``
+
+    >>> mprof.peak    # doctest: +SKIP
+    MemoryPeak(time=1435352238.480655, nbytes=56, keys=['x', 'y'])
+
+    and ``key_groups`` summarizes which groups of keys (as determined by
+    ``dask.utils.key_split``) held the most memory over time
+
+    >>> mprof.key_groups()    # doctest: +SKIP
+    [MemoryGroupData(name='y', count=1, nbytes=28, peak_nbytes=28, byte_seconds=1.2e-05),
+     ...]
+
+    The profiling results can be visualized in a bokeh plot using the
+    ``visualize`` method. Note that this requires bokeh to be installed.
+
+    >>> mprof.visualize() # doctest: +SKIP
+
+    If you use the profiler globally you will need to clear out old results
+    manually.
+
+    >>> mprof.clear()
+    """
+
+    def __init__(self):
+        super(MemoryProfiler, self).__init__(metric=sizeof,
+                                             metric_name='bytes')
+
+    def _start_state(self, dsk, state):
+        # Data present before any task runs is also held by the scheduler
+        t = default_timer()
+        for k, v in state['cache'].items():
+            if k in dsk and k not in self._cache:
+                self._add(k, v, t)
+
+    def _add(self, key, value, t):
+        nbytes = self._metric(value)
+        self._cache[key] = (nbytes, t)
+        self._nbytes += nbytes
+
+    def _posttask(self, key, value, dsk, state, id):
+        t = default_timer()
+        self._add(key, value, t)
+        # The result and its inputs were held together before the release
+        self.timeline.append((t, self._nbytes))
+        if self._nbytes > self._peak[1]:
+            self._peak = (t, self._nbytes)
+        # Only dependencies of ``key`` can have been released by this task
+        for dep in state['dependencies'][key]:
+            if dep in self._cache and dep in state['released']:
+                nbytes, start = self._cache.pop(dep)
+                self._nbytes -= nbytes
+                self.results.append(CacheData(dep, dsk[dep], nbytes, start, t))
+
+    def _finish(self, dsk, state, failed):
+        super(MemoryProfiler, self)._finish(dsk, state, failed)
+        self._nbytes = 0
+
+    @property
+    def peak(self):
+        """The peak number of bytes held, and the keys holding them"""
+        t, nbytes = self._peak
+        keys = [r.key for r in self.results
+                if r.cache_time <= t <= r.free_time]
+        return MemoryPeak(t, nbytes, keys)
+
+    def key_groups(self):
+        """Summarize memory use by group of keys.
+
+        Keys are grouped with ``dask.utils.key_split``. For each group this
+        returns the number of keys, the total bytes produced, the bytes held
+        at the time of the peak, and the integral of bytes held over time.
+        Groups are sorted by the last, so that the groups pinning the most
+        memory come first.
+        """
+        t = self._peak[0]
+        groups = {}
+        for r in self.results:
+            name = key_split(r.key)
+            count, nbytes, peak, byte_seconds = groups.get(name, (0, 0, 0, 0))
+            if r.cache_time <= t <= r.free_time:
+                peak += r.metric
+            groups[name] = (count + 1, nbytes + r.metric, peak,
+                            byte_seconds + r.metric * (r.free_time - r.cache_time))
+        out = [MemoryGroupData(name, *v) for name, v in groups.items()]
+        return sorted(out, key=lambda g: (g.byte_seconds, g.nbytes),
+                      reverse=True)
+
+    def clear(self):
+        """Clear out old results from profiler"""
+        super(MemoryProfiler, self).clear()
+        self.timeline = []
+        self._nbytes = 0
+        self._peak = (None, 0)
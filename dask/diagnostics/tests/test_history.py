@@ -0,0 +1,113 @@
+from operator import add, mul
+import subprocess
+import sys
+from time import sleep
+
+import pytest
+pytest.importorskip('sqlite3')
+
+import dask
+from dask.diagnostics import TaskHistory
+from dask.optimize import fuse_by_size
+from dask.threaded import get
+from dask.utils import tmpfile
+
+
+dsk = {'a': 1,
+       'b': 2,
+       'c': (add, 'a', 'b'),
+       'd': (mul, 'a', 'b'),
+       'e': (mul, 'c', 'd')}
+
+
+def test_history():
+    with tmpfile('db') as fn:
+        history = TaskHistory(fn)
+        with history:
+            assert get(dsk, 'e') == 6
+        stats = history.stats()
+        assert set(stats) == {('c', 'add'), ('d', 'mul'), ('e', 'mul')}
+        assert stats[('c', 'add')].count == 1
+        assert stats[('c', 'add')].nbytes == dask.sizeof.sizeof(3)
+        assert set(history.stats(func='mul')) == {('d', 'mul'), ('e', 'mul')}
+        assert set(history.stats(prefix='c')) == {('c', 'add')}
+
+        # Statistics accumulate across computations and sessions
+        with history:
+            get(dsk, 'c')
+        history = TaskHistory(fn)
+        assert history.stats(prefix='c')[('c', 'add')].count == 2
+        assert history.prefixes()['c'].count == 2
+
+        history.clear()
+        assert not history.stats()
+
+
+def test_duration_and_nbytes():
+    def slow(x):
+        sleep(0.05)
+        return x
+
+    dsk = {('x', i): (slow, i) for i in range(3)}
+    dsk['y'] = (sum, list(dsk))
+    with tmpfile('db') as fn:
+        history = TaskHistory(fn)
+        with history:
+            get(dsk, 'y')
+        stats = history.prefixes()['x']
+        assert stats.count == 3
+        assert stats.max_duration >= stats.duration >= 0.04
+        assert history.duration(('x', 10)) == stats.duration
+        assert history.nbytes('x') == stats.nbytes
+        assert history.duration('z') is None
+
+        costs = history.costs({('x', 5): (slow, 1), 'z': (slow, 1), 'w': 1})
+        assert costs[('x', 5)] == stats.duration
+        assert 0 < costs['z'] < stats.duration
+        assert costs['w'] == 0
+        assert history.sizes({('x', 5): (slow, 1), 'z': (slow, 1)}) == \
+            {('x', 5): stats.nbytes}
+
+
+def test_errored_computations_are_recorded():
+    def bad(x):
+        raise ValueError()
+
+    with tmpfile('db') as fn:
+        history = TaskHistory(fn)
+        with history:
+            with pytest.raises(ValueError):
+                get({'x': 1, 'y': (add, 'x', 1), 'z': (bad, 'y')}, 'z')
+        assert set(history.stats()) == {('y', 'add')}
+
+
+def test_fuse_by_size_uses_history():
+    g = {('a', 0): (abs, 1), ('a', 1): (abs, 1),
+         ('b', 0): (abs, 1), ('b', 1): (abs, 1),
+         'c': (sum, [('a', 0), ('a', 1), ('b', 0), ('b', 1)])}
+    dsk2, _ = fuse_by_size(g, keys=['c'], num_workers=4, rename_keys=False)
+    assert len(dsk2) == 3
+
+    # 'a' is recorded to be expensive and 'b' cheap, so only one 'a' is
+    # fused into 'c', along with both 'b'
+    with tmpfile('db') as fn:
+        history = TaskHistory(fn)
+        history._pending = {('a', 'abs'): [1, 10.0, 10.0, 8, 8],
+                            ('b', 'abs'): [1, 0.1, 0.1, 8, 8]}
+        history.flush()
+        with dask.set_options(task_history=history):
+            dsk2, _ = fuse_by_size(g, keys=['c'], num_workers=4,
+                                   rename_keys=False)
+        assert len(dsk2) == 2
+        assert [k for k in dsk2 if k != 'c'][0][0] == 'a'
+        assert dask.get(dsk2, 'c') == 4
+
+
+def test_diagnostics_without_sqlite3():
+    code = """if 1:
+        import sys
+        sys.modules['sqlite3'] = None
+        import dask.diagnostics
+        assert not hasattr(dask.diagnostics, 'TaskHistory')
+        """
+    subprocess.check_call([sys.executable, '-c', code])
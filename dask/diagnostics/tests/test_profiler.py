@@ -3,7 +3,8 @@ import os
 from time import sleep
 from distutils.version import LooseVersion
 
-from dask.diagnostics import Profiler, ResourceProfiler, CacheProfiler
+from dask.diagnostics import (Profiler, ResourceProfiler, CacheProfiler,
+                              MemoryProfiler)
 from dask.threaded import get
 from dask.utils import ignoring, tmpfile
 from dask.compatibility import apply
@@ -147,12 +148,60 @@ def test_cache_profiler():
     assert CacheProfiler(metric=nbytes, metric_name='foo')._metric_name == 'foo'
 
 
+def test_memory_profiler():
+    np = pytest.importorskip('numpy')
+    dsk = {'x-1': (np.ones, 100),
+           'x-2': (np.ones, 200),
+           'y-1': (add, 'x-1', 1),
+           'y-2': (add, 'x-2', 1),
+           'z': (lambda a, b: a.sum() + b.sum(), 'y-1', 'y-2')}
+    with MemoryProfiler() as mprof:
+        get(dsk, 'z')
+    results = mprof.results
+    assert all(isinstance(i, tuple) and len(i) == 5 for i in results)
+    nbytes = dict((r.key, r.metric) for r in results)
+    assert nbytes['x-1'] == nbytes['y-1'] == 800
+    assert nbytes['x-2'] == nbytes['y-2'] == 1600
+    assert mprof._metric_name == 'bytes'
+
+    assert mprof.timeline
+    assert all(len(i) == 2 for i in mprof.timeline)
+    assert mprof.timeline[-1][1] == nbytes['z'] + 800 + 1600
+
+    peak = mprof.peak
+    assert peak.nbytes == max(n for _, n in mprof.timeline)
+    assert peak.nbytes == sum(nbytes[k] for k in peak.keys)
+
+    groups = mprof.key_groups()
+    assert set(g.name for g in groups) == {'x', 'y', 'z'}
+    assert all(g.byte_seconds >= 0 for g in groups)
+    assert sum(g.peak_nbytes for g in groups) == peak.nbytes
+    x = [g for g in groups if g.name == 'x'][0]
+    assert x.count == 2
+    assert x.nbytes == 2400
+
+    mprof.clear()
+    assert mprof.results == []
+    assert mprof.timeline == []
+    assert mprof.peak.nbytes == 0
+
+
+def test_memory_profiler_counts_input_data():
+    dsk = {'a': [1] * 1000, 'b': (len, 'a')}
+    with MemoryProfiler() as mprof:
+        get(dsk, 'b')
+    keys = sorted(r.key for r in mprof.results)
+    assert keys == ['a', 'b']
+    assert 'a' in mprof.peak.keys
+
+
 @pytest.mark.parametrize(
     'profiler',
     [Profiler,
      pytest.param(lambda: ResourceProfiler(dt=0.01),
                   marks=pytest.mark.skipif("not psutil")),
-     CacheProfiler])
+     CacheProfiler,
+     MemoryProfiler])
 def test_register(profiler):
     prof = profiler()
     try:
@@ -116,14 +116,15 @@ from __future__ import absolute_import, division, print_function
 
 import os
 import sys
+import time
 
 from .compatibility import Queue, Empty, reraise
 from .core import (istask, flatten, reverse_dict, get_dependencies, ishashable,
-                   has_tasks)
+                   has_tasks, toposort)
 from .context import _globals
 from .order import order
 from .callbacks import unpack_callbacks, local_callbacks
-from .optimize import cull
+from .optimize import cull, key_split
 from .utils_test import add, inc  # noqa: F401
 
 
@@ -154,9 +155,12 @@ else:
 DEBUG = False
 
 
-def start_state_from_dask(dsk, cache=None, sortkey=None):
+def start_state_from_dask(dsk, cache=None, sortkey=None, dependencies=None):
     """ Start state from a dask
 
+    The ``dependencies`` of every key in ``dsk``, as a dict of sets, may be
+    provided to avoid computing them again.
+
     Examples
     --------
 
@@ -196,7 +200,13 @@ def start_state_from_dask(dsk, cache=None, sortkey=None):
     dsk2 = dsk.copy()
     dsk2.update(cache)
 
-    dependencies = {k: get_dependencies(dsk2, k) for k in dsk}
+    if dependencies is None:
+        dependencies = {k: get_dependencies(dsk2, k) for k in dsk}
+    else:
+        dependencies = dict(dependencies)
+        # Values from the cache replace their tasks
+        for k in data_keys:
+            dependencies[k] = get_dependencies(dsk2, k)
     waiting = {k: v.copy()
                for k, v in dependencies.items()
                if k not in data_keys}
@@ -277,7 +287,100 @@ def _execute_task(arg, cache, dsk=None):
         return arg
 
 
-def execute_task(key, task_info, dumps, loads, get_id, pack_exception):
+class Retry(object):
+    """ Policy to retry tasks that fail with transient errors
+
+    Failing tasks are run again in the same worker after a delay, that grows
+    exponentially with every attempt.
+
+    Parameters
+    ----------
+    attempts : int
+        Maximum number of times to run a task, including the first
+    delay : float
+        Seconds to wait before the first retry
+    backoff : float
+        Factor by which the delay grows after every retry
+    max_delay : float, optional
+        Upper bound on the delay
+    exceptions : exception type or tuple of types
+        The exceptions to retry on, others fail immediately.  Defaults to
+        ``EnvironmentError``, which includes ``IOError`` and ``OSError``.
+
+    Examples
+    --------
+    >>> retry = Retry(attempts=4, delay=1, backoff=2)
+    >>> list(retry.delays())
+    [1, 2, 4]
+
+    Use it for all tasks, or for tasks with given key prefixes
+
+    >>> x.compute(retry=retry)  # doctest: +SKIP
+    >>> with dask.set_options(retry={'read-csv': retry}):  # doctest: +SKIP
+    ...     x.compute()
+    """
+    def __init__(self, attempts=3, delay=0.1, backoff=2, max_delay=None,
+                 exceptions=EnvironmentError):
+        if attempts < 1:
+            raise ValueError("attempts must be at least 1, got %d" % attempts)
+        self.attempts = attempts
+        self.delay = delay
+        self.backoff = backoff
+        self.max_delay = max_delay
+        self.exceptions = exceptions
+
+    def __repr__(self):
+        return 'Retry(attempts=%d, delay=%r, backoff=%r)' % (
+            self.attempts, self.delay, self.backoff)
+
+    def delays(self):
+        """ The delays before every retry """
+        delay = self.delay
+        for _ in range(self.attempts - 1):
+            if self.max_delay is not None:
+                delay = min(delay, self.max_delay)
+            yield delay
+            delay = delay * self.backoff
+
+    def run(self, func, *args):
+        """ Call ``func(*args)``, retrying on failure """
+        for delay in self.delays():
+            try:
+                return func(*args)
+            except self.exceptions:
+                time.sleep(delay)
+        return func(*args)
+
+
+def retry_policy(retry, key):
+    """ The ``Retry`` to use for a key
+
+    ``retry`` is either a ``Retry``, or a dict mapping key prefixes to
+    ``Retry`` policies.  Prefixes are matched against the start of the name
+    of the key, or of any part of it after a ``-``.  Fused tasks join the
+    names of the tasks they are made of with ``-``, so they match the
+    policies of all of them.  The longest matching prefix wins.
+
+    >>> policy = Retry()
+    >>> retry_policy({'read-csv': policy}, ('read-csv-1234', 0)) is policy
+    True
+    >>> retry_policy({'read-csv': policy}, ('add-read-csv-1234', 0)) is policy
+    True
+    >>> retry_policy({'read-csv': policy}, 'x') is None
+    True
+    """
+    if retry is None or isinstance(retry, Retry):
+        return retry
+    name = key_split(key)
+    matches = [prefix for prefix in retry
+               if name.startswith(prefix) or '-' + prefix in name]
+    if not matches:
+        return None
+    return retry[max(matches, key=len)]
+
+
+def execute_task(key, task_info, dumps, loads, get_id, pack_exception,
+                 retry=None):
     """
     Compute task and handle all administration
 
@@ -287,7 +390,10 @@ def execute_task(key, task_info, dumps, loads, get_id, pack_exception):
     """
     try:
         task, data = loads(task_info)
-        result = _execute_task(task, data)
+        if retry is None:
+            result = _execute_task(task, data)
+        else:
+            result = retry.run(_execute_task, task, data)
         id = get_id()
         result = dumps((result, id))
         failed = False
@@ -405,7 +511,8 @@ The main function of the scheduler.  Get is the main entry point.
 def get_async(apply_async, num_workers, dsk, result, cache=None,
               get_id=default_get_id, rerun_exceptions_locally=None,
               pack_exception=default_pack_exception, raise_exception=reraise,
-              callbacks=None, dumps=identity, loads=identity, **kwargs):
+              callbacks=None, dumps=identity, loads=identity, retry=None,
+              **kwargs):
     """ Asynchronous get function
 
     This is a general version of various asynchronous schedulers for dask.  It
@@ -446,6 +553,10 @@ def get_async(apply_async, num_workers, dsk, result, cache=None,
         Callbacks are passed in as tuples of length 5. Multiple sets of
         callbacks may be passed in as a list of tuples. For more information,
         see the dask.diagnostics documentation.
+    retry : Retry or dict, optional
+        Policy to retry failing tasks, or a dict mapping key prefixes to
+        policies.  Defaults to the ``retry`` option of ``set_options``, see
+        ``Retry``.
 
     See Also
     --------
@@ -471,10 +582,13 @@ def get_async(apply_async, num_workers, dsk, result, cache=None,
                 started_cbs.append(cb)
 
             dsk, dependencies = cull(dsk, list(results))
+            dependencies = {k: set(v) for k, v in dependencies.items()}
 
-            keyorder = order(dsk)
+            keyorder = order(dsk, dependencies=dependencies)
 
-            state = start_state_from_dask(dsk, cache=cache, sortkey=keyorder.get)
+            state = start_state_from_dask(dsk, cache=cache,
+                                          sortkey=keyorder.get,
+                                          dependencies=dependencies)
 
             for _, start_state, _, _, _ in callbacks:
                 if start_state:
@@ -483,6 +597,9 @@ def get_async(apply_async, num_workers, dsk, result, cache=None,
             if rerun_exceptions_locally is None:
                 rerun_exceptions_locally = _globals.get('rerun_exceptions_locally', False)
 
+            if retry is None:
+                retry = _globals.get('retry')
+
             if state['waiting'] and not state['ready']:
                 raise ValueError("Found no accessible jobs in dask")
 
@@ -500,7 +617,8 @@ def get_async(apply_async, num_workers, dsk, result, cache=None,
                 # Submit
                 apply_async(execute_task,
                             args=(key, dumps((dsk[key], data)),
-                                  dumps, loads, get_id, pack_exception),
+                                  dumps, loads, get_id, pack_exception,
+                                  retry_policy(retry, key)),
                             callback=queue.put)
 
             # Seed initial tasks into the thread pool
@@ -562,6 +680,38 @@ def get_sync(dsk, keys, **kwargs):
     return get_async(apply_sync, 1, dsk, keys, **kwargs)
 
 
+def get_inline(dsk, keys, retry=None, **kwargs):
+    """ Compute a small graph directly in the calling thread
+
+    Tasks are run one after another in topological order with
+    ``_execute_task``, without the scheduling state, callbacks and worker
+    dispatch of ``get_async``. Intermediate results are held until the end of
+    the computation, so this is only suitable for small graphs, where that
+    overhead dominates.
+
+    >>> dsk = {'x': 1, 'y': 2, 'z': (inc, 'x'), 'w': (add, 'z', 'y')}
+    >>> get_inline(dsk, 'w')
+    4
+    >>> get_inline(dsk, ['w', 'y'])
+    (4, 2)
+    """
+    if isinstance(keys, list):
+        result_flat = list(flatten(keys))
+    else:
+        result_flat = [keys]
+    if retry is None:
+        retry = _globals.get('retry')
+    dsk, dependencies = cull(dsk, result_flat)
+    cache = dict()
+    for key in toposort(dsk, dependencies=dependencies):
+        policy = retry_policy(retry, key)
+        if policy is None:
+            cache[key] = _execute_task(dsk[key], cache)
+        else:
+            cache[key] = policy.run(_execute_task, dsk[key], cache)
+    return nested_get(keys, cache)
+
+
 def sortkey(item):
     """ Sorting key function that is robust to different types
 
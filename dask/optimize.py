@@ -2,6 +2,7 @@ from __future__ import absolute_import, division, print_function
 
 import math
 import re
+from multiprocessing import cpu_count
 from operator import getitem
 
 from .compatibility import unicode
@@ -38,12 +39,17 @@ def cull(dsk, keys):
     seen = set()
     dependencies = dict()
 
+    cache = _globals.get('dependency_cache')
+    known = cache.get(dsk) if cache is not None else None
     work = list(set(flatten(keys)))
     while work:
         new_work = []
         out_keys += work
-        deps = [(k, get_dependencies(dsk, k, as_list=True))  # fuse needs lists
-                for k in work]
+        if known is None:
+            deps = [(k, get_dependencies(dsk, k, as_list=True))  # fuse needs lists
+                    for k in work]
+        else:
+            deps = [(k, list(known[k])) for k in work]
         dependencies.update(deps)
         for _, deplist in deps:
             for d in deplist:
@@ -497,6 +503,10 @@ def fuse(dsk, keys=None, dependencies=None, ave_width=None, max_width=None,
     dsk: output graph with keys fused
     dependencies: dict mapping dependencies after fusion.  Useful side effect
         to accelerate other downstream optimizations.
+
+    See Also
+    --------
+    fuse_by_size
     """
     if keys is not None and not isinstance(keys, set):
         if not isinstance(keys, list):
@@ -530,6 +540,9 @@ def fuse(dsk, keys=None, dependencies=None, ave_width=None, max_width=None,
     if not ave_width or not max_height:
         return dsk, dependencies
 
+    if _globals.get('fuse_by_size'):
+        return fuse_by_size(dsk, keys, dependencies, rename_keys=rename_keys)
+
     if rename_keys is None:
         rename_keys = _globals.get('fuse_rename_keys', True)
     if rename_keys is True:
@@ -752,6 +765,192 @@ def fuse(dsk, keys=None, dependencies=None, ave_width=None, max_width=None,
     return rv, deps
 
 
+def _estimate_nbytes(dsk, dependencies, order, known=None):
+    """ Estimate the size in bytes of the output of every task
+
+    Literal data is measured with ``sizeof``.  Tasks are assumed to produce
+    outputs as large as their largest input, and lists of keys as large as
+    all of their elements.  Estimates in ``known`` take precedence.
+    """
+    from .sizeof import sizeof
+    known = known or {}
+    nbytes = {}
+    for k in order:
+        if k in known:
+            nbytes[k] = known[k]
+            continue
+        v = dsk[k]
+        deps = dependencies[k]
+        if istask(v) or (ishashable(v) and v in dsk):
+            nbytes[k] = max([nbytes[d] for d in deps]) if deps else 0
+        elif deps:
+            nbytes[k] = sum(nbytes[d] for d in deps)
+        else:
+            nbytes[k] = sizeof(v)
+    return nbytes
+
+
+def fuse_by_size(dsk, keys=None, dependencies=None, nbytes=None, cost=None,
+                 num_workers=None, rename_keys=None):
+    """ Fuse tasks to avoid moving large intermediate results between tasks
+
+    Like ``fuse`` this fuses tasks into their only dependent, but rather than
+    using the structure of the graph it uses estimated output sizes and task
+    costs.  Tasks are visited from the bottom of the graph up, and at each
+    task its dependencies are fused largest output first.  Fusing a chain of
+    tasks never loses parallelism, so chains are always fused.  Fusing
+    sibling tasks runs them one after another, so this is only done while
+    the work that would be serialized is at most ``1 / num_workers`` of the
+    total work in the graph.
+
+    This is especially useful for schedulers where moving data between tasks
+    is expensive, like the multiprocessing scheduler.  It can be selected in
+    place of ``fuse`` with ``set_options(fuse_by_size=True)``.
+
+    Parameters
+    ----------
+    dsk: dict
+        dask graph
+    keys: list or set, optional
+        Keys that must remain in the returned dask graph
+    dependencies: dict, optional
+        {key: [list-of-keys]}.  Must be a list to provide count of each key
+        This optional input often comes from ``cull``
+    nbytes: dict, optional
+        {key: estimated size of its output in bytes}, for example from
+        collection metadata.  Missing keys are estimated from the sizes of
+        the data in the graph using ``sizeof``.
+    cost: dict or callable, optional
+        {key: estimated cost of its task}, or a function of the key.
+        Defaults to a cost of one for every task, and zero for data.
+    num_workers: int, optional
+        Number of workers to keep busy.  Defaults to the ``fuse_num_workers``
+        global option, or the number of cores.
+    rename_keys: bool or func, optional
+        Whether to rename the fused keys, as in ``fuse``.
+
+    Returns
+    -------
+    dsk: output graph with keys fused
+    dependencies: dict mapping dependencies after fusion.
+
+    Notes
+    -----
+    If a ``dask.diagnostics.TaskHistory`` is set with
+    ``set_options(task_history=...)``, the durations and output sizes it has
+    recorded are used when ``cost`` and ``nbytes`` are not given.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> dsk = {'x': np.ones(1000), 'y': (inc, 'x'), 'z': (sum, 'y')}
+    >>> dsk2, deps = fuse_by_size(dsk, keys=['z'], rename_keys=False)
+    >>> dsk2['z'][0] is sum
+    True
+    >>> sorted(dsk2)
+    ['z']
+    """
+    if keys is not None and not isinstance(keys, set):
+        if not isinstance(keys, list):
+            keys = [keys]
+        keys = set(flatten(keys))
+
+    if num_workers is None:
+        num_workers = _globals.get('fuse_num_workers') or cpu_count()
+
+    if rename_keys is None:
+        rename_keys = _globals.get('fuse_rename_keys', True)
+    if rename_keys is True:
+        key_renamer = default_fused_keys_renamer
+    elif rename_keys is False:
+        key_renamer = None
+    else:
+        key_renamer = rename_keys
+
+    if dependencies is None:
+        deps = {k: get_dependencies(dsk, k, as_list=True) for k in dsk}
+    else:
+        deps = dict(dependencies)
+
+    rdeps = {}
+    for k, vals in deps.items():
+        for v in vals:
+            if v not in rdeps:
+                rdeps[v] = [k]
+            else:
+                rdeps[v].append(k)
+        deps[k] = set(vals)
+
+    reducible = {k for k, vals in rdeps.items() if len(vals) == 1}
+    if keys:
+        reducible -= keys
+    if not reducible:
+        return dsk, deps
+
+    history = _globals.get('task_history')
+    if history is not None:
+        if nbytes is None:
+            nbytes = history.sizes(dsk)
+        if cost is None:
+            cost = history.costs(dsk)
+
+    order = toposort(dsk, dependencies=deps)
+    nbytes = _estimate_nbytes(dsk, deps, order, known=nbytes)
+    if cost is None:
+        costs = {k: 1 if istask(v) else 0 for k, v in dsk.items()}
+    elif callable(cost):
+        costs = {k: cost(k) for k in dsk}
+    else:
+        costs = {k: cost.get(k, 1 if istask(v) else 0)
+                 for k, v in dsk.items()}
+    max_serial = sum(costs.values()) / num_workers
+
+    rv = dsk.copy()
+    fused_trees = {}
+    # Total cost, and cost of the longest path, of the tasks fused into each
+    work = {}
+    span = {}
+    for k in order:
+        children = [d for d in deps[k] if d in reducible]
+        if not children:
+            if k in reducible:
+                work[k] = span[k] = costs[k]
+            continue
+        children.sort(key=nbytes.__getitem__, reverse=True)
+        w = s = c = costs[k]
+        task = rv[k]
+        deps_k = deps[k]
+        fused_keys = []
+        for child in children:
+            w2 = w + work[child]
+            s2 = max(s, span[child] + c)
+            if w2 - s2 > max_serial:
+                continue
+            w, s = w2, s2
+            task = subs(task, child, rv.pop(child))
+            deps_k.remove(child)
+            deps_k |= deps.pop(child)
+            if key_renamer is not None:
+                fused_keys.extend(fused_trees.pop(child, [child]))
+        rv[k] = task
+        if fused_keys:
+            fused_keys.append(k)
+            fused_trees[k] = fused_keys
+        if k in reducible:
+            work[k] = w
+            span[k] = s
+
+    if key_renamer is not None:
+        for root_key, fused_keys in fused_trees.items():
+            alias = key_renamer(fused_keys)
+            if alias is not None and alias not in rv:
+                rv[alias] = rv[root_key]
+                rv[root_key] = alias
+                deps[alias] = deps[root_key]
+                deps[root_key] = {alias}
+    return rv, deps
+
+
 # Defining `key_split` (used by key renamers in `fuse`) in utils.py
 # results in messy circular imports, so define it here instead.
 hex_pattern = re.compile('[a-f]+')
@@ -0,0 +1,127 @@
+""" Compact serialization of task graphs
+
+The tasks of a graph are highly repetitive: the tasks of a layer usually
+differ only in the integers of their keys and indices.  So their pickle
+compresses well, even with the fastest level of ``zlib``, which makes graphs
+several times smaller at little cost in time.
+
+Graphs are written as a stream of frames, one per layer of a ``ShareDict``,
+so that large graphs can be written and read one layer at a time.
+"""
+from __future__ import absolute_import, division, print_function
+
+import pickle
+import zlib
+
+from .compatibility import BytesIO
+from .sharedict import ShareDict
+
+
+_VERSION = 3
+
+# The level of ``zlib`` compression of layers.  Higher levels are several
+# times slower, for graphs only slightly smaller.
+_LEVEL = 1
+
+
+def _dumps(x):
+    try:
+        return pickle.dumps(x, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        # Fall back to the slower cloudpickle for lambdas and the like
+        try:
+            import cloudpickle
+        except ImportError:
+            raise
+        return cloudpickle.dumps(x, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _layers(dsk):
+    if isinstance(dsk, ShareDict):
+        return list(dsk.dicts.items())
+    return [(None, dsk)]
+
+
+def dump_graph(dsk, file):
+    """ Write a task graph to an open binary file
+
+    See Also
+    --------
+    dumps_graph
+    load_graph
+    """
+    layers = _layers(dsk)
+    dump = pickle.Pickler(file, protocol=pickle.HIGHEST_PROTOCOL).dump
+    dump(('dask-graph', _VERSION, isinstance(dsk, ShareDict), len(layers)))
+    for name, layer in layers:
+        dump((name, zlib.compress(_dumps(layer), _LEVEL)))
+
+
+def load_graph(file):
+    """ Read a task graph written with ``dump_graph`` from an open file
+
+    See Also
+    --------
+    loads_graph
+    dump_graph
+    """
+    load = pickle.Unpickler(file).load
+    header = load()
+    if header[:2] != ('dask-graph', _VERSION):
+        raise ValueError("Not a serialized dask graph: %s" % (header,))
+    _, _, is_sharedict, nlayers = header
+
+    out = ShareDict() if is_sharedict else dict()
+    for _ in range(nlayers):
+        name, data = load()
+        layer = pickle.loads(zlib.decompress(data))
+        if is_sharedict:
+            out.update_with_key(layer, key=name)
+        else:
+            out = layer
+    return out
+
+
+def dumps_graph(dsk):
+    """ Serialize a task graph to bytes
+
+    Each layer of the graph is pickled, with ``cloudpickle`` for lambdas and
+    the like if it is installed, and compressed with ``zlib``.  Graphs with
+    many similar tasks, like those of dask arrays and dataframes, serialize
+    to a fraction of the size of their pickle, in about as much time.  The
+    layers of a ``ShareDict`` are kept.
+
+    Parameters
+    ----------
+    dsk : dict or ShareDict
+        The task graph
+
+    Examples
+    --------
+    >>> from operator import add
+    >>> dsk = {('x', i): (add, ('y', i), 1) for i in range(3)}
+    >>> b = dumps_graph(dsk)
+    >>> loads_graph(b) == dsk
+    True
+
+    See Also
+    --------
+    loads_graph
+    dump_graph
+    """
+    f = BytesIO()
+    dump_graph(dsk, f)
+    return f.getvalue()
+
+
+def loads_graph(b):
+    """ Deserialize a task graph serialized with ``dumps_graph``
+
+    As with ``pickle``, only load data from trusted sources.
+
+    See Also
+    --------
+    dumps_graph
+    load_graph
+    """
+    return load_graph(BytesIO(b))
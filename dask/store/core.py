@@ -3,9 +3,15 @@ from __future__ import absolute_import, division, print_function
 from collections import defaultdict, MutableMapping
 from operator import getitem
 from datetime import datetime
-from time import time
-
-from ..core import istask, ishashable
+from timeit import default_timer
+import os
+import pickle
+import threading
+import uuid
+
+from ..callbacks import Callback
+from ..core import istask, ishashable, get_dependencies
+from ..sizeof import sizeof
 from ..utils_test import add  # noqa: F401
 
 
@@ -33,6 +39,20 @@ class Store(MutableMapping):
     >>> s['y']
     15
 
+    Missing intermediate results are computed in parallel with the threaded
+    scheduler. Requesting a list of keys computes them all at once.
+
+    >>> list(s[['x', 'y']])
+    [10, 15]
+
+    To bound memory use provide a budget of ``available_memory`` bytes.  Once
+    cached intermediate results exceed this budget the results that are
+    cheapest to recompute per byte, and that were accessed least recently,
+    are evicted.  If a ``spill_directory`` is provided evicted results are
+    written to disk there instead of being discarded.
+
+    >>> s = ds.Store(available_memory=1e9)  # doctest: +SKIP
+
     Design
     ------
 
@@ -45,12 +65,18 @@ class Store(MutableMapping):
     data: set
         The keys in the cache that can not be removed for correctness.
     compute_time: dict:: {key: float}
-        dict mapping the time it took to compute each key
+        dict mapping the time it took to compute each key, including the time
+        to compute its dependencies
     access_times: dict:: {key: [datetimes]}
         The times at which a key was accessed
+    nbytes: dict:: {key: int}
+        The size of each cached intermediate value
+    spilled: dict:: {key: filename}
+        Intermediate values evicted to disk
     """
 
-    def __init__(self, cache=None):
+    def __init__(self, cache=None, available_memory=None,
+                 spill_directory=None, num_workers=None):
         self.dsk = dict()
         if cache is None:
             cache = dict()
@@ -58,51 +84,126 @@ class Store(MutableMapping):
         self.data = set()
         self.compute_time = dict()
         self.access_times = defaultdict(list)
+        self.nbytes = dict()
+        self.spilled = dict()
+        self.available_memory = available_memory
+        self.spill_directory = spill_directory
+        self.num_workers = num_workers
+        self._lock = threading.RLock()
 
     def __setitem__(self, key, value):
-        if key in self.dsk:
-            if (self.dsk[key] == value or
-                self.dsk[key] == (getitem, self.cache, key) and
-               self.cache[key] == value):
-                return
+        with self._lock:
+            if key in self.dsk:
+                if (self.dsk[key] == value or
+                    self.dsk[key] == (getitem, self.cache, key) and
+                   self.cache[key] == value):
+                    return
+                else:
+                    raise KeyError("Can not overwrite data")
+            if istask(value):
+                self.dsk[key] = value
             else:
-                raise KeyError("Can not overwrite data")
-        if istask(value):
-            self.dsk[key] = value
-        else:
-            self.cache[key] = value
-            self.dsk[key] = (getitem, self.cache, key)
-            self.data.add(key)
+                self.cache[key] = value
+                self.dsk[key] = (getitem, self.cache, key)
+                self.data.add(key)
 
     def __getitem__(self, key):
         if isinstance(key, list):
-            return (self[item] for item in key)
+            return iter(self._get(key))
         if not ishashable(key):
             return key
         if key not in self.dsk:
             return key
-
-        self.access_times[key].append(datetime.now())
-
-        if key in self.cache:
-            return self.cache[key]
-
-        task = self.dsk[key]
-        func, args = task[0], task[1:]
-
-        if func == getitem and args[0] is self.cache:
-            return self.cache[args[1]]
-
-        args = [self[arg] for arg in args]
-
-        start = time()
-        result = func(*args)
-        end = time()
-
-        self.cache[key] = result
-        self.compute_time[key] = end - start
-
-        return result
+        return self._get([key])[0]
+
+    def _get(self, keys):
+        """ Get many keys, computing any missing values together """
+        keys2 = [k for k in keys if ishashable(k) and k in self.dsk]
+        now = datetime.now()
+        with self._lock:
+            for k in keys2:
+                self.access_times[k].append(now)
+            dsk = self._missing_graph(keys2, now)
+            found = {k: self.cache[k] for k in keys2 if k in self.cache}
+
+        if dsk:
+            from ..threaded import get
+            missing = [k for k in keys2 if k not in found]
+            # Pass the callback explicitly, as the global callbacks are
+            # shared with computations running in other threads
+            cb = _StoreCallback(self)
+            values = get(dsk, missing, num_workers=self.num_workers,
+                         callbacks=[cb._callback])
+            found.update(zip(missing, values))
+            with self._lock:
+                self._evict()
+
+        return [found.get(k, k) if ishashable(k) else k for k in keys]
+
+    def _missing_graph(self, keys, now):
+        """ Graph of tasks needed to compute ``keys``, with available values
+        included as data.  Must be called with the lock held. """
+        dsk = dict()
+        stack = [k for k in keys if k not in self.cache]
+        seen = set(stack)
+        while stack:
+            k = stack.pop()
+            if k in self.spilled:
+                self._unspill(k)
+            if k in self.cache:
+                dsk[k] = self.cache[k]
+                continue
+            dsk[k] = self.dsk[k]
+            for dep in get_dependencies(self.dsk, k):
+                self.access_times[dep].append(now)
+                if dep not in seen:
+                    seen.add(dep)
+                    stack.append(dep)
+        return dsk
+
+    def _store_result(self, key, value, duration):
+        with self._lock:
+            self.cache[key] = value
+            self.compute_time[key] = duration
+            self.nbytes[key] = sizeof(value)
+
+    def _score(self, key, now):
+        """ Higher scores are more valuable to keep in memory """
+        last = self.access_times[key][-1] if self.access_times[key] else now
+        staleness = (now - last).total_seconds()
+        cost = self.compute_time.get(key, 0) / max(self.nbytes.get(key, 1), 1)
+        return cost * len(self.access_times[key]) / (1 + staleness)
+
+    def _evict(self):
+        """ Evict intermediate results until within ``available_memory`` """
+        if self.available_memory is None:
+            return
+        held = [k for k in self.nbytes if k in self.cache and k not in self.data]
+        total = sum(self.nbytes[k] for k in held)
+        if total <= self.available_memory:
+            return
+        now = datetime.now()
+        for k in sorted(held, key=lambda k: self._score(k, now)):
+            if total <= self.available_memory:
+                break
+            if self.spill_directory is not None:
+                self._spill(k)
+            del self.cache[k]
+            total -= self.nbytes[k]
+
+    def _spill(self, key):
+        if not os.path.exists(self.spill_directory):
+            os.makedirs(self.spill_directory)
+        fn = os.path.join(self.spill_directory, '%s.pkl' % uuid.uuid4().hex)
+        with open(fn, 'wb') as f:
+            pickle.dump(self.cache[key], f, protocol=pickle.HIGHEST_PROTOCOL)
+        self.spilled[key] = fn
+
+    def _unspill(self, key):
+        fn = self.spilled.pop(key)
+        with open(fn, 'rb') as f:
+            self.cache[key] = pickle.load(f)
+        os.remove(fn)
 
     def __len__(self):
         return len(self.dsk)
@@ -112,3 +213,24 @@ class Store(MutableMapping):
 
     def __delitem__(self, key):
         raise ValueError("Dask Store does not support deletion")
+
+
+class _StoreCallback(Callback):
+    """ Record results and compute times of tasks run for a ``Store`` """
+    def __init__(self, store):
+        self.store = store
+        self.starttimes = dict()
+        self.durations = dict()
+
+    def _pretask(self, key, dsk, state):
+        self.starttimes[key] = default_timer()
+
+    def _posttask(self, key, value, dsk, state, id):
+        duration = default_timer() - self.starttimes.pop(key)
+        # Include the time to compute dependencies, as in ``dask.cache``
+        deps = state['dependencies'][key]
+        if deps:
+            duration += max(self.durations.get(k, 0) or
+                            self.store.compute_time.get(k, 0) for k in deps)
+        self.durations[key] = duration
+        self.store._store_result(key, value, duration)
@@ -1,6 +1,12 @@
+import os
+import threading
+from time import sleep
+
 import pytest
 
+from dask.sizeof import sizeof
 from dask.store import Store
+from dask.utils import tmpdir
 from dask.utils_test import inc, add
 
 
@@ -48,3 +54,94 @@ def test_update():
     pytest.raises(Exception, lambda: s.update({'x': 2}))
     # Test that it doesn't raise
     s.update({'x': 1})
+
+
+def test_compute_many_keys_in_parallel():
+    s = Store(num_workers=4)
+    lock = threading.Lock()
+    running = [0, 0]
+
+    def slow_inc(x):
+        with lock:
+            running[0] += 1
+            running[1] = max(running)
+        sleep(0.05)
+        with lock:
+            running[0] -= 1
+        return x + 1
+
+    s['x'] = 1
+    for i in range(4):
+        s['y-%d' % i] = (slow_inc, 'x')
+    s['z'] = (sum, ['y-0', 'y-1', 'y-2', 'y-3'])
+
+    assert s['z'] == 8
+    assert running[1] > 1
+    assert all(s.cache['y-%d' % i] == 2 for i in range(4))
+    assert s.compute_time['z'] >= s.compute_time['y-0']
+
+    assert list(s[['z', 'y-0', 10]]) == [8, 2, 10]
+
+
+def test_concurrent_access():
+    s = Store()
+    s['x'] = 1
+    for i in range(20):
+        s['y-%d' % i] = (add, 'x', i)
+
+    results = {}
+
+    def f(i):
+        results[i] = s['y-%d' % i]
+
+    threads = [threading.Thread(target=f, args=(i,)) for i in range(20)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert results == {i: i + 1 for i in range(20)}
+
+
+def test_eviction():
+    s = Store(available_memory=sizeof(list(range(100))) * 2.5)
+    s['x'] = 100
+    for i in range(5):
+        s['y-%d' % i] = (lambda n: list(range(n)), 'x')
+        s['z-%d' % i] = (len, 'y-%d' % i)
+
+    for i in range(5):
+        assert s['z-%d' % i] == 100
+
+    # Ground data is never evicted
+    assert s.cache['x'] == 100
+    assert sum(1 for k in s.cache if k.startswith('y')) <= 2
+    assert sum(s.nbytes[k] for k in s.cache if k not in s.data) <= s.available_memory
+
+    # Evicted results are recomputed when needed
+    assert all(s['y-%d' % i] == list(range(100)) for i in range(5))
+
+
+def test_spill_to_disk():
+    calls = []
+
+    def make_list(n):
+        calls.append(n)
+        return list(range(n))
+
+    with tmpdir() as d:
+        s = Store(available_memory=0, spill_directory=d)
+        s['x'] = 10
+        s['y'] = (make_list, 'x')
+        s['z'] = (len, 'y')
+
+        assert s['z'] == 10
+        assert 'y' not in s.cache
+        assert set(s.spilled) == {'y', 'z'}
+        assert len(os.listdir(d)) == 2
+
+        # Spilled results are loaded rather than recomputed
+        s['w'] = (lambda y: y[-1], 'y')
+        assert s['w'] == 9
+        assert s['y'] == list(range(10))
+        assert calls == [10]
+        assert len(os.listdir(d)) == len(s.spilled)
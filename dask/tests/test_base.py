@@ -12,7 +12,9 @@ from dask import delayed
 from dask.base import (compute, tokenize, normalize_token, normalize_function,
                        visualize, persist, function_cache, is_dask_collection,
                        DaskMethodsMixin)
+from dask.core import flatten
 from dask.delayed import Delayed
+from dask.sizeof import sizeof
 from dask.utils import tmpdir, tmpfile, ignoring
 from dask.utils_test import inc, dec
 from dask.compatibility import long, unicode
@@ -395,6 +397,26 @@ def test_compute_array():
     assert np.allclose(out2, arr + 2)
 
 
+@pytest.mark.skipif('not da')
+def test_compute_dependency_cache():
+    from dask.core import DependencyCache
+    cache = DependencyCache()
+    x = da.ones((10, 10), chunks=(5, 5))
+    with dask.set_options(dependency_cache=cache):
+        for i in range(3):
+            x = x + 1
+            assert x.sum().compute() == 100 * (i + 2)
+    assert cache.hits > 0
+    assert not cache.graphs
+
+    # Graphs are released whether or not they are optimized
+    with dask.set_options(dependency_cache=cache):
+        x.sum().compute(optimize_graph=False)
+        x.persist(optimize_graph=False)
+        dask.estimate_memory(x, optimize_graph=False)
+    assert not cache.graphs
+
+
 @pytest.mark.skipif('not da')
 def test_persist_array():
     from dask.array.utils import assert_eq
@@ -545,6 +567,53 @@ def test_default_imports():
         assert mod not in modules
 
 
+@pytest.mark.parametrize('module,blacklist', [
+    ('dask.array', ['dask.array.random', 'dask.array.linalg',
+                    'dask.array.ghost', 'dask.array.learn', 'dask.array.fft',
+                    'dask.array.image', 'dask.array.stats', 'scipy',
+                    'dask.dataframe', 'pandas']),
+    ('dask.dataframe', ['dask.dataframe.io.demo',
+                        'dask.dataframe.tseries.resample', 'dask.array.random',
+                        'dask.array.linalg', 'dask.array.fft', 'scipy',
+                        'fastparquet', 'pyarrow', 'sqlalchemy', 'tables'])])
+def test_collection_imports(module, blacklist):
+    """
+    Startup time: rarely used submodules and optional backends are only
+    imported on first use.
+    """
+    pytest.importorskip(module)
+    code = """if 1:
+        import %s
+        import sys
+
+        print(sorted(sys.modules))
+        """ % module
+
+    out = subprocess.check_output([sys.executable, '-c', code])
+    modules = set(eval(out.decode()))
+    assert module in modules
+    for mod in blacklist:
+        assert mod not in modules
+
+
+@pytest.mark.parametrize('module,limit', [('dask', 25), ('dask.array', 45),
+                                          ('dask.dataframe', 80)])
+def test_import_cost(module, limit):
+    """
+    Startup time: importing a collection loads few of dask's own modules
+    """
+    pytest.importorskip(module)
+    code = """if 1:
+        import sys
+        import %s
+        print([m for m in sys.modules if m.split('.')[0] == 'dask'])
+        """ % module
+
+    out = subprocess.check_output([sys.executable, '-c', code])
+    modules = eval(out.decode())
+    assert len(modules) <= limit, sorted(modules)
+
+
 def test_persist_literals():
     assert persist(1, 2, 3) == (1, 2, 3)
 
@@ -628,3 +697,93 @@ def test_optimize_None():
 
     with dask.set_options(array_optimize=None, get=my_get):
         y.compute()
+
+
+def test_estimate_memory_delayed():
+    x = delayed(b'x' * 1000, name='x')
+    y = delayed(len)(x, dask_key_name='y')
+    z = delayed(inc)(y, dask_key_name='z')
+
+    est = dask.estimate_memory(z, sizes={'y': 100, 'z': 10})
+    # ``x`` and ``y`` are held together when ``y`` finishes
+    assert est.key == 'y'
+    assert est.nbytes == sizeof(b'x' * 1000) + 100
+    assert sorted(est.keys) == ['x', 'y']
+
+    assert dask.estimate_memory(1, 2) == (0, None, [])
+
+
+@pytest.mark.skipif('not da')
+def test_estimate_memory_array():
+    x = da.ones((100, 100), chunks=(10, 100))
+    est = dask.estimate_memory(x)
+    assert est.nbytes == x.nbytes
+    assert len(est.keys) == x.npartitions
+
+    # Depth-first execution only holds a few blocks at once
+    sizes = {k: 8000 for k in flatten(x.__dask_keys__())}
+    y = x.map_blocks(lambda b: b[:1], chunks=(1, 100))
+    est = dask.estimate_memory(y, sizes=sizes, optimize_graph=False)
+    assert est.nbytes < x.nbytes + y.nbytes
+
+    a = dask.estimate_memory(x, num_workers=4)
+    assert a.nbytes == x.nbytes
+
+
+@pytest.mark.skipif('not dd')
+def test_estimate_memory_dataframe():
+    pdf = pd.DataFrame({'x': range(100), 'y': [1.0] * 100})
+    ddf = dd.from_pandas(pdf, npartitions=4)
+    est = dask.estimate_memory(ddf.x + 1, rows_per_partition=25,
+                               default=10**9)
+    parts = dask.compute(*ddf.to_delayed())
+    real = sum(p.memory_usage(deep=True).sum() for p in parts)
+    # All input partitions are held at the peak, along with at most as much
+    # output; sizeof adds a fixed overhead per pandas object
+    assert real <= est.nbytes <= 2 * (real + 1000 * ddf.npartitions)
+
+
+def test_compute_small_graph_inline():
+    import threading
+    main = threading.current_thread()
+
+    def f(x):
+        assert threading.current_thread() is main
+        return x + 1
+
+    x = delayed(f)(1)
+    y = delayed(add)(x, delayed(f)(2))
+    with dask.set_options(small_graph_threshold=10):
+        assert compute(x, y) == (2, 5)
+
+        # Graph above the threshold uses the scheduler
+        z = delayed(sum)([delayed(inc)(i) for i in range(20)])
+        assert z.compute() == 210
+        with pytest.raises(AssertionError):
+            delayed(f)(z).compute()
+
+
+@pytest.mark.skipif('not da')
+def test_compute_small_graph_respects_options():
+    x = da.ones(10, chunks=5) + 1
+    calls = []
+
+    def my_get(dsk, keys, **kwargs):
+        calls.append(1)
+        return dask.get(dsk, keys)
+
+    def optimize_double(dsk, keys):
+        return {k: (mul, 2, v) for k, v in dsk.items()}
+
+    with dask.set_options(small_graph_threshold=50):
+        assert (x.compute() == np.ones(10) + 1).all()
+        assert (x.compute(get=my_get) == np.ones(10) + 1).all()
+        assert calls == [1]
+        with dask.set_options(array_optimize=optimize_double):
+            assert (x.compute() == (np.ones(10) * 2 + 1) * 2).all()
+
+        from dask.callbacks import Callback
+        keys = []
+        with Callback(pretask=lambda key, dsk, state: keys.append(key)):
+            x.compute()
+        assert keys
@@ -0,0 +1,83 @@
+import os
+
+import pytest
+
+from dask.checkpoint import Checkpoint
+from dask.context import _globals
+from dask.local import get_sync
+from dask.threaded import get
+from dask.utils import tmpdir
+from dask.utils_test import add
+
+
+calls = []
+
+
+def inc(x):
+    calls.append(x)
+    return x + 1
+
+
+def make_task():
+    return (inc, 1)
+
+
+def fail(x):
+    raise ValueError("Oh no")
+
+
+def test_checkpoint_resume():
+    del calls[:]
+    with tmpdir() as d:
+        ckpt = Checkpoint(d)
+        dsk = {'x': (inc, 1), 'y': (inc, 'x'), 'z': (fail, 'y')}
+        with pytest.raises(ValueError):
+            with ckpt:
+                get(dsk, 'z')
+        assert calls == [1, 2]
+        assert 'x' in ckpt and 'y' in ckpt
+        assert ckpt.load('y') == 3
+
+        # Resuming skips saved tasks, and everything they depend on
+        dsk['z'] = (inc, 'y')
+        with ckpt:
+            assert get(dsk, 'z') == 4
+        assert calls == [1, 2, 3]
+
+        ckpt.clear()
+        assert os.listdir(d) == []
+        assert 'x' not in ckpt
+
+    assert not _globals['callbacks']
+
+
+def test_checkpoint_prefixes():
+    with tmpdir() as d:
+        ckpt = Checkpoint(d, prefixes=['a'])
+        dsk = {('a', 0): (inc, 1), ('a', 1): (inc, 2),
+               'b-1': (add, ('a', 0), ('a', 1))}
+        with ckpt:
+            assert get_sync(dsk, 'b-1') == 5
+        assert ('a', 0) in ckpt and ('a', 1) in ckpt
+        assert 'b-1' not in ckpt
+
+
+def test_checkpoint_min_duration():
+    with tmpdir() as d:
+        ckpt = Checkpoint(d, min_duration=10)
+        with ckpt:
+            assert get({'x': (inc, 1)}, 'x') == 2
+        assert 'x' not in ckpt
+        assert not ckpt.starttimes
+
+
+def test_checkpoint_quotes_tasklike_results():
+    with tmpdir() as d:
+        ckpt = Checkpoint(d)
+        dsk = {'x': (make_task,), 'y': (len, 'x')}
+        with ckpt:
+            assert get(dsk, 'y') == 2
+        assert ckpt.load('x') == (inc, 1)
+        with ckpt:
+            assert get(dsk, 'x') == (inc, 1)
+            assert get(dsk, 'y') == 2
@@ -3,10 +3,13 @@ from collections import namedtuple
 import pytest
 import pickle
 
+from toolz import merge
+
 from dask.utils_test import GetFunctionTestMixin, inc, add
 from dask import core
 from dask.core import (istask, get_dependencies, get_deps, flatten, subs,
-                       preorder_traversal, literal, quote, has_tasks)
+                       preorder_traversal, literal, quote, has_tasks,
+                       DependencyCache)
 
 
 def contains(a, b):
@@ -232,3 +235,44 @@ def test_quote():
 def test_literal_serializable():
     l = literal((add, 1, 2))
     assert pickle.loads(pickle.dumps(l)).data == (add, 1, 2)
+
+
+def test_dependency_cache():
+    x = {('x', i): i for i in range(3)}
+    y = {('y', i): (add, ('x', i), [('x', 0), 'a', 1]) for i in range(3)}
+    dsk = merge(x, y)
+    layers = {'x': x, 'y': y}
+
+    cache = DependencyCache()
+    for _ in range(2):
+        deps = cache.dependencies(dsk, layers)
+        assert deps == {k: get_dependencies(dsk, k, as_list=True)
+                        for k in dsk}
+    assert (cache.hits, cache.misses) == (2, 2)
+
+    # Reinspected when objects of its tasks become keys
+    dsk2 = dict(dsk, a=1)
+    layers['a'] = {'a': 1}
+    assert cache.dependencies(dsk2, layers)[('y', 0)] == [('x', 0), ('x', 0),
+                                                          'a']
+    assert cache.misses == 4
+
+    # or when dependencies go missing
+    del dsk2[('x', 0)]
+    layers['x'] = {('x', i): i for i in range(1, 3)}
+    assert cache.dependencies(dsk2, layers)[('y', 0)] == ['a']
+
+    # or for a different layer with the same name
+    y2 = {('y', 0): (inc, ('x', 1))}
+    assert cache.dependencies(merge(x, y2), {'x': x, 'y': y2}) == \
+        {('x', 0): [], ('x', 1): [], ('x', 2): [], ('y', 0): [('x', 1)]}
+
+
+def test_dependency_cache_maxsize():
+    cache = DependencyCache(maxsize=2)
+    layers = {i: {i: (inc, i - 1) if i else 0} for i in range(4)}
+    dsk = {i: v for layer in layers.values() for i, v in layer.items()}
+    cache.dependencies(dsk, layers)
+    assert len(cache) == 2
+    cache.clear()
+    assert len(cache) == 0
@@ -9,7 +9,7 @@ import pytest
 import dask
 from dask import set_options, compute
 from dask.compatibility import PY2, PY3
-from dask.delayed import delayed, to_task_dask, Delayed
+from dask.delayed import delayed, to_task_dask, Delayed, batch
 from dask.utils_test import inc
 
 
@@ -502,3 +502,58 @@ def test_keys_from_array():
     xs = [delayed(inc)(x) for x in X]
 
     _check_dsk(xs[0].dask)
+
+
+def test_batch():
+    out = batch(add, [1, 2, 3], [10, 20, 30])
+    assert len(out) == 3
+    assert all(isinstance(o, Delayed) for o in out)
+    assert compute(*out) == (11, 22, 33)
+    assert out[1].compute() == 22
+
+    # A single layer is shared by all outputs
+    name = out[0].key[0]
+    assert all(o.key == (name, i) for i, o in enumerate(out))
+    assert all(o.dask is out[0].dask for o in out)
+    assert list(out[0].dask.dicts) == [name]
+
+    # zip semantics
+    assert len(batch(add, [1, 2, 3], [1, 2])) == 2
+    assert batch(add, [], []) == []
+
+
+def test_batch_pure_and_names():
+    a = batch(add, [1, 2], [3, 4], pure=True)
+    b = batch(add, [1, 2], [3, 4], pure=True)
+    c = batch(add, [1, 2], [3, 5], pure=True)
+    assert [x.key for x in a] == [x.key for x in b]
+    assert a[0].key != c[0].key
+    assert a[0].key[0].startswith('add-')
+
+    assert batch(add, [1], [2])[0].key != batch(add, [1], [2])[0].key
+
+    out = batch(add, [1, 2], [3, 4], dask_key_name='foo')
+    assert [o.key for o in out] == [('foo', 0), ('foo', 1)]
+
+    # Settings of a delayed function are respected
+    f = delayed(add, pure=True)
+    assert batch(f, [1], [2])[0].key == batch(f, [1], [2])[0].key
+
+
+def test_batch_kwargs_and_dask_arguments():
+    def f(x, y, z=0):
+        return x + sum(y) + z
+
+    x = delayed(1)
+    out = batch(f, [x, x, 2], [(1, 2), [x], {x}], z=delayed(inc)(1))
+    assert compute(*out) == (1 + 3 + 2, 1 + 1 + 2, 2 + 1 + 2)
+
+    g = delayed(lambda: f)()
+    assert compute(*batch(g, [1, 2], [[3], [4]], z=10)) == (14, 16)
+
+
+def test_batch_nout():
+    out = batch(divmod, [7, 9], [2, 4], nout=2)
+    q, r = out[0]
+    assert (q.compute(), r.compute()) == (3, 1)
+    assert compute(*out[1]) == (2, 1)
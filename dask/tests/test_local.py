@@ -1,9 +1,15 @@
 from __future__ import absolute_import, division, print_function
 
+from collections import OrderedDict
+
+import pytest
+
 import dask
 
-from dask.local import start_state_from_dask, get_sync, finish_task, sortkey
+from dask.local import (start_state_from_dask, get_sync, finish_task, sortkey,
+                        get_inline, Retry, retry_policy)
 from dask.order import order
+from dask.optimize import default_fused_keys_renamer
 from dask.utils_test import GetFunctionTestMixin, inc, add
 
 
@@ -101,6 +107,10 @@ class TestGetAsync(GetFunctionTestMixin):
         self.get({'x': (inc, 'y'), 'y': 1}, 'x', num_workers=2)
 
 
+class TestGetInline(GetFunctionTestMixin):
+    get = staticmethod(get_inline)
+
+
 def test_cache_options():
     try:
         from chest import Chest
@@ -191,3 +201,83 @@ def test_ordering():
     get_sync(dsk, 'y')
 
     assert L == sorted(L)
+
+
+class Flaky(object):
+    """ Fails with ``exc`` the first ``n`` times it is called """
+    def __init__(self, n, exc=IOError):
+        self.n = n
+        self.exc = exc
+        self.calls = 0
+
+    def __call__(self, x):
+        self.calls += 1
+        if self.calls <= self.n:
+            raise self.exc("transient")
+        return x + 1
+
+
+def test_retry_delays():
+    assert list(Retry(attempts=1).delays()) == []
+    assert list(Retry(attempts=4, delay=1, backoff=3).delays()) == [1, 3, 9]
+    assert list(Retry(attempts=4, delay=1, max_delay=2).delays()) == [1, 2, 2]
+    with pytest.raises(ValueError):
+        Retry(attempts=0)
+
+
+def test_retry_policy():
+    a, b = Retry(), Retry()
+    assert retry_policy(None, 'x') is None
+    assert retry_policy(a, 'x') is a
+    policies = {'read': a, 'load-csv': b}
+    assert retry_policy(policies, ('read-csv-123', 0)) is a
+    assert retry_policy(policies, 'load-csv-123') is b
+    assert retry_policy(policies, 'x') is None
+
+    # The longest of overlapping prefixes wins, whatever the order
+    c = Retry()
+    for items in [[('read', a), ('read-csv', c)],
+                  [('read-csv', c), ('read', a)]]:
+        policies = OrderedDict(items)
+        assert retry_policy(policies, ('read-csv-123', 0)) is c
+        assert retry_policy(policies, ('read-json-123', 0)) is a
+
+
+def test_retry_policy_fused_keys():
+    a, b = Retry(), Retry()
+    policies = {'read-csv': a, 'inc': b}
+    # The names of the other fused tasks come before that of the last one
+    key = default_fused_keys_renamer([('add-1', 0), ('read-csv-123', 0)])
+    assert key == ('add-read-csv-123', 0)
+    assert retry_policy(policies, key) is a
+    key = default_fused_keys_renamer(['read-csv-123', 'inc-1'])
+    assert retry_policy(policies, key) is a
+    assert retry_policy(policies, 'add-1') is None
+
+
+@pytest.mark.parametrize('get', [get_sync, get_inline])
+def test_retry(get):
+    f = Flaky(2)
+    dsk = {'x': 1, 'y': (f, 'x')}
+    assert get(dsk, 'y', retry=Retry(attempts=3, delay=0)) == 2
+    assert f.calls == 3
+
+    f = Flaky(3)
+    dsk = {'x': 1, 'y': (f, 'x')}
+    with pytest.raises(IOError):
+        get(dsk, 'y', retry=Retry(attempts=3, delay=0))
+    assert f.calls == 3
+
+    f = Flaky(1, exc=ValueError)
+    dsk = {'x': 1, 'y': (f, 'x')}
+    with pytest.raises(ValueError):
+        get(dsk, 'y', retry=Retry(attempts=3, delay=0))
+    assert f.calls == 1
+
+
+def test_retry_set_options():
+    dsk = {'x': 1, 'read-y': (Flaky(1), 'x'), 'z': (Flaky(1), 'x')}
+    with dask.set_options(retry={'read': Retry(delay=0)}):
+        assert get_sync(dsk, 'read-y') == 2
+        with pytest.raises(IOError):
+            get_sync(dsk, 'z')
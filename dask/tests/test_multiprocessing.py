@@ -1,4 +1,5 @@
 import multiprocessing
+import os
 from operator import add
 import pickle
 import random
@@ -10,6 +11,7 @@ import pytest
 from dask import compute, delayed
 from dask.context import set_options
 from dask.multiprocessing import get, _dumps, _loads, remote_exception
+from dask.utils import tmpfile
 from dask.utils_test import inc
 
 
@@ -130,3 +132,21 @@ def test_random_seeds(random):
         results, = compute([delayed(f, pure=False)() for i in range(N)])
 
     assert len(set(results)) == N
+
+
+def fail_once(path):
+    if os.path.exists(path):
+        return 1
+    with open(path, 'w'):
+        pass
+    raise IOError("transient")
+
+
+def test_retry():
+    from dask.local import Retry
+    with tmpfile() as fn:
+        dsk = {'x': (fail_once, fn)}
+        with pytest.raises(IOError):
+            get(dsk, 'x')
+        os.remove(fn)
+        assert get(dsk, 'x', retry=Retry(delay=0)) == 1
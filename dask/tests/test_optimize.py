@@ -3,10 +3,13 @@ from functools import partial
 
 import pytest
 
+import dask
+from dask.context import set_options
 from dask.utils_test import add, inc
 from dask.core import get_dependencies
 from dask.optimize import (cull, fuse, inline, inline_functions, functions_of,
-                           fuse_getitem, fuse_selections, fuse_linear)
+                           fuse_getitem, fuse_selections, fuse_linear,
+                           fuse_by_size)
 
 
 def double(x):
@@ -1061,3 +1064,90 @@ def test_fuse_reductions_multiple_input():
         'b1-b3-c1-c2-d': (f, (f, (f, 'a1'), 'b2'), (f, 'b2', (f, 'a2'))),
         'd': 'b1-b3-c1-c2-d',
     })
+
+
+def test_fuse_by_size_chains():
+    dsk = {'a': 1, 'b': (inc, 'a'), 'c': (inc, 'b'), 'd': (inc, 'c'),
+           'x': 1, 'y': (inc, 'x'), 'z': (add, 'd', 'y')}
+    # Chains don't lose any parallelism, so are always fused.  Fusing both
+    # chains into 'z' would serialize them.
+    dsk2, deps = fuse_by_size(dsk, keys=['z'], nbytes={'d': 100},
+                              num_workers=10, rename_keys=False)
+    assert dsk2 == {'y': (inc, 1), 'z': (add, (inc, (inc, (inc, 1))), 'y')}
+    assert deps == {'y': set(), 'z': {'y'}}
+
+    dsk2, deps = fuse_by_size(dsk, keys=['z'], nbytes={'d': 100},
+                              num_workers=1, rename_keys=False)
+    assert dsk2 == {'z': (add, (inc, (inc, (inc, 1))), (inc, 1))}
+
+    dsk2, deps = fuse_by_size(dsk, keys=['z', 'b'], nbytes={'y': 100},
+                              num_workers=10, rename_keys=False)
+    assert dsk2 == {'b': (inc, 1), 'd': (inc, (inc, 'b')),
+                    'z': (add, 'd', (inc, 1))}
+    assert dask.get(dsk2, 'z') == 6
+
+
+def test_fuse_by_size_keeps_parallelism():
+    dsk = {('x', i): (inc, i) for i in range(8)}
+    dsk['total'] = (sum, list(dsk))
+
+    dsk2, deps = fuse_by_size(dsk, keys=['total'], num_workers=1,
+                              rename_keys=False)
+    assert list(dsk2) == ['total']
+
+    # Serialize at most half of the 9 tasks
+    dsk2, deps = fuse_by_size(dsk, keys=['total'], num_workers=2,
+                              rename_keys=False)
+    assert len(dsk2) == 1 + 3
+    assert deps['total'] == set(dsk2) - {'total'}
+    assert dask.get(dsk2, 'total') == dask.get(dsk, 'total')
+
+
+def test_fuse_by_size_prefers_large_outputs():
+    dsk = {('x', i): (inc, i) for i in range(8)}
+    dsk['total'] = (sum, list(dsk))
+    nbytes = {('x', i): i for i in range(8)}
+    dsk2, deps = fuse_by_size(dsk, keys=['total'], nbytes=nbytes,
+                              num_workers=2, rename_keys=False)
+    assert set(dsk2) == {'total', ('x', 0), ('x', 1), ('x', 2)}
+
+    # Sizes of literal data are measured
+    dsk = {'a': list(range(1000)), 'b': 1,
+           'c': (len, 'a'), 'd': (inc, 'b'),
+           'e': (add, 'c', 'd')}
+    dsk2, deps = fuse_by_size(dsk, keys=['e'], num_workers=4,
+                              rename_keys=False)
+    assert 'c' not in dsk2 and 'a' not in dsk2
+    assert 'd' in dsk2
+
+
+def test_fuse_by_size_costs():
+    dsk = {'a': (inc, 1), 'b': (inc, 2), 'c': (add, 'a', 'b')}
+    # Running 'a' and 'b' one after another would serialize a third of the
+    # work, more than can be spared with three workers
+    dsk2, deps = fuse_by_size(dsk, keys=['c'], num_workers=3,
+                              cost={'a': 10, 'b': 10, 'c': 1},
+                              rename_keys=False)
+    assert len(dsk2) == 2
+
+    # Running 'a' before 'b' barely makes the computation longer
+    dsk2, deps = fuse_by_size(dsk, keys=['c'], num_workers=3,
+                              cost={'a': 1, 'b': 10, 'c': 1},
+                              rename_keys=False)
+    assert dsk2 == {'c': (add, (inc, 1), (inc, 2))}
+
+
+def test_fuse_by_size_rename_keys():
+    dsk = {'a': 1, 'b': (inc, 'a'), 'c': (inc, 'b')}
+    dsk2, deps = fuse_by_size(dsk, keys=['c'])
+    assert dsk2 == {'a-b-c': (inc, (inc, 1)), 'c': 'a-b-c'}
+    assert deps == {'a-b-c': set(), 'c': {'a-b-c'}}
+
+
+def test_fuse_by_size_set_options():
+    dsk = {('x', i): (inc, i) for i in range(8)}
+    dsk['total'] = (sum, list(dsk))
+    with set_options(fuse_by_size=True, fuse_num_workers=2):
+        dsk2, deps = fuse(dsk, keys=['total'], rename_keys=False)
+    assert len(dsk2) == 4
+    assert dask.get(dsk2, 'total') == 36
@@ -0,0 +1,114 @@
+from collections import namedtuple
+from operator import add, getitem
+import pickle
+
+import pytest
+
+import dask
+from dask.compatibility import BytesIO
+from dask.serialize import dumps_graph, loads_graph, dump_graph, load_graph
+from dask.sharedict import ShareDict
+from dask.utils_test import inc
+
+
+Point = namedtuple('Point', ['x', 'y'])
+
+
+def test_roundtrip():
+    dsk = {('x', i, j): (add, (len, ('y', i, j)), ('z', j, i))
+           for i in range(10) for j in range(10)}
+    dsk.update({('y', i, j): (getitem, 'data', slice(i, None, j + 1))
+                for i in range(10) for j in range(10)})
+    dsk.update({('z', i, j): (inc, i) for i in range(10) for j in range(10)})
+    dsk['data'] = list(range(100))
+    dsk2 = loads_graph(dumps_graph(dsk))
+    assert dsk2 == dsk
+    assert dask.get(dsk2, ('x', 3, 4)) == dask.get(dsk, ('x', 3, 4))
+
+
+@pytest.mark.parametrize('value', [
+    None, True, False, 0, 1, -1, 2 ** 70, -2 ** 70, 1.5, 'a', u'é',
+    b'bytes', (), [], (1,), [[1], (2,)], {'a': ('x', 1)}, {1, 2},
+    slice(None), slice(1, 2, 3), Point(1, 2), (inc, 1), [(inc, 'a'), True]])
+def test_roundtrip_values(value):
+    dsk = {'a': 1, 'b': value, ('c', 0): (inc, 'a'), ('c', 1): value}
+    dsk2 = loads_graph(dumps_graph(dsk))
+    assert dsk2 == dsk
+    for k, v in dsk.items():
+        assert type(dsk2[k]) is type(v)
+
+
+def test_bools_and_ints_are_distinct():
+    dsk = {('x', i): (add, True, False) if i % 2 else (add, 1, 0)
+           for i in range(10)}
+    dsk2 = loads_graph(dumps_graph(dsk))
+    for k, v in dsk.items():
+        assert [type(a) for a in dsk2[k]] == [type(a) for a in v]
+
+
+def test_deeply_nested_tasks():
+    task = 'x'
+    for i in range(200):
+        task = (inc, task)
+    dsk = {'x': 1, 'y': task}
+    dsk2 = loads_graph(dumps_graph(dsk))
+    assert dsk2 == dsk
+    assert dask.get(dsk2, 'y') == 201
+
+
+def test_shared_objects_are_serialized_once():
+    data = list(range(10000))
+    dsk = {('x', i): (getitem, data, i) for i in range(100)}
+    b = dumps_graph(dsk)
+    assert len(b) < len(pickle.dumps(data)) + 1000
+    dsk2 = loads_graph(b)
+    assert dsk2 == dsk
+    assert dsk2[('x', 0)][1] is dsk2[('x', 1)][1]
+
+
+def test_lambdas():
+    pytest.importorskip('cloudpickle')
+    dsk = {'x': 1, 'y': (lambda x: x + 1, 'x')}
+    dsk2 = loads_graph(dumps_graph(dsk))
+    assert dask.get(dsk2, 'y') == 2
+
+
+def test_sharedict_layers():
+    s = ShareDict()
+    s.update_with_key({('x', i): i for i in range(5)}, key='x')
+    s.update_with_key({('y', i): (inc, ('x', i)) for i in range(5)}, key='y')
+    s2 = loads_graph(dumps_graph(s))
+    assert isinstance(s2, ShareDict)
+    assert set(s2.dicts) == {'x', 'y'}
+    assert s2.dicts['y'] == s.dicts['y']
+    assert dict(s2) == dict(s)
+
+
+def test_stream():
+    f = BytesIO()
+    dump_graph({'x': 1}, f)
+    dump_graph({'y': (inc, 'x')}, f)
+    f.seek(0)
+    assert load_graph(f) == {'x': 1}
+    assert load_graph(f) == {'y': (inc, 'x')}
+
+
+def test_invalid():
+    with pytest.raises(ValueError):
+        loads_graph(pickle.dumps(('not-a-graph',)))
+    with pytest.raises(ValueError):
+        loads_graph(pickle.dumps(('dask-graph', 2, False, 1)))
+
+
+def test_smaller_than_pickle():
+    da = pytest.importorskip('dask.array')
+    x = da.ones((1000, 1000), chunks=(10, 10))
+    y = (x + x.T).sum(axis=0)
+    for dsk in [y.__dask_graph__(),
+                y.__dask_optimize__(y.__dask_graph__(), y.__dask_keys__())]:
+        b = dumps_graph(dsk)
+        size = len(pickle.dumps(dict(dsk), protocol=pickle.HIGHEST_PROTOCOL))
+        assert len(b) < size / 4
+        dsk2 = loads_graph(b)
+        assert set(dsk2) == set(dsk)
+        assert all(repr(dsk2[k]) == repr(v) for k, v in dsk.items())
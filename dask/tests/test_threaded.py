@@ -9,8 +9,8 @@ import pytest
 
 from dask.context import set_options
 from dask.compatibility import PY2
-from dask.threaded import get
-from dask.utils_test import inc, add
+from dask.threaded import get, get_stealing
+from dask.utils_test import inc, add, GetFunctionTestMixin
 
 
 def test_get():
@@ -139,3 +139,107 @@ def test_interrupt():
     stop = time()
     if stop - start > 4:
         assert False, "Failed to interrupt"
+
+
+def test_retry():
+    from dask.local import Retry
+    lock = threading.Lock()
+    calls = []
+
+    def f(x):
+        with lock:
+            calls.append(x)
+            if calls.count(x) < 3:
+                raise IOError("transient")
+        return x
+
+    dsk = {('x', i): (f, i) for i in range(10)}
+    with set_options(retry=Retry(attempts=3, delay=0.01)):
+        assert get(dsk, list(dsk)) == tuple(range(10))
+    assert len(calls) == 30
+
+
+class TestGetStealing(GetFunctionTestMixin):
+    get = staticmethod(get_stealing)
+
+
+def test_stealing_many_tasks():
+    dsk = {('x', i): (inc, i) for i in range(1000)}
+    dsk.update({('y', i): (add, ('x', i), ('x', 999 - i)) for i in range(1000)})
+    dsk['z'] = (sum, [('y', i) for i in range(1000)])
+    for num_workers in [1, 2, 4]:
+        assert get_stealing(dsk, 'z', num_workers=num_workers) == 1001000
+
+
+def test_stealing_uses_several_workers():
+    ids = set()
+    lock = threading.Lock()
+
+    def f(i):
+        with lock:
+            ids.add(threading.current_thread().ident)
+        sleep(0.01)
+        return i
+
+    dsk = {('x', i): (f, i) for i in range(20)}
+    dsk['y'] = (sum, list(dsk))
+    assert get_stealing(dsk, 'y', num_workers=4) == 190
+    assert len(ids) > 1
+
+
+def test_stealing_exceptions():
+    dsk = {('x', i): (inc, i) for i in range(100)}
+    dsk[('x', 50)] = (bad, 1)
+    dsk['y'] = (sum, [('x', i) for i in range(100)])
+    with pytest.raises(ValueError):
+        get_stealing(dsk, 'y', num_workers=4)
+    # Workers are done, and the pool is reusable
+    assert get_stealing({'x': (inc, 1)}, 'x', num_workers=4) == 2
+
+
+def test_stealing_callbacks():
+    from dask.callbacks import Callback
+    started, finished = [], []
+    with Callback(pretask=lambda key, dsk, state: started.append(key),
+                  posttask=lambda key, *args: finished.append(key)):
+        dsk = {('x', i): (inc, i) for i in range(10)}
+        get_stealing(dsk, list(dsk), num_workers=3)
+    assert sorted(started) == sorted(finished) == sorted(dsk)
+
+
+def test_stealing_releases_data():
+    dsk = {'x': 1, 'y': (inc, 'x'), 'z': (inc, 'y')}
+    cache = {}
+    get_stealing(dsk, 'z', cache=cache)
+    assert set(cache) == {'z'}
+
+
+def test_stealing_runs_tasks_in_parallel():
+    # Tasks that release the GIL run on all workers at once
+    dsk = {('x', i): (sleep, 0.1) for i in range(16)}
+    dsk['y'] = (len, list(dsk))
+    start = time()
+    assert get_stealing(dsk, 'y', num_workers=4) == 16
+    assert time() - start < 16 * 0.1 / 2
+
+
+def test_stealing_rerun_exceptions_locally():
+    threads = []
+
+    def f():
+        threads.append(threading.current_thread())
+        raise ValueError()
+
+    dsk = {('x', i): (inc, i) for i in range(10)}
+    dsk['y'] = (f,)
+    with pytest.raises(ValueError):
+        get_stealing(dsk, ['y'] + list(dsk), num_workers=4,
+                     rerun_exceptions_locally=True)
+    assert len(threads) == 2
+    assert threads[-1] is threading.current_thread()
+
+    def raise_exception(exc, tb):
+        raise KeyError()
+
+    with pytest.raises(KeyError):
+        get_stealing(dsk, 'y', num_workers=4, raise_exception=raise_exception)
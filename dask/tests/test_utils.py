@@ -1,6 +1,7 @@
 import functools
 import operator
 import pickle
+import sys
 
 import numpy as np
 import pytest
@@ -9,10 +10,29 @@ from dask.sharedict import ShareDict
 from dask.utils import (takes_multiple_arguments, Dispatch, random_state_data,
                         memory_repr, methodcaller, M, skip_doctest,
                         SerializableLock, funcname, ndeepmap, ensure_dict,
-                        extra_titles, asciitable, itemgetter, partial_by_order)
+                        extra_titles, asciitable, itemgetter, partial_by_order,
+                        LazyModule)
 from dask.utils_test import inc
 
 
+def test_lazy_module():
+    m = LazyModule('dask.sharedict')
+    assert repr(m) == "<lazy module 'dask.sharedict'>"
+    assert m.ShareDict is ShareDict
+    assert 'merge' in dir(m)
+    assert pickle.loads(pickle.dumps(m)) is sys.modules['dask.sharedict']
+
+    # Module attributes are available before anything else loads the module
+    m = LazyModule('json')
+    assert not hasattr(m, '__wrapped__')
+    assert 'dumps' not in vars(m)
+    json = __import__('json')
+    assert m.__doc__ == json.__doc__
+    assert m.__file__ == json.__file__
+    assert m.__all__ == json.__all__
+    assert m.__path__ == json.__path__
+
+
 def test_takes_multiple_arguments():
     assert takes_multiple_arguments(map)
     assert not takes_multiple_arguments(sum)
@@ -6,13 +6,19 @@ See scheduler.py
 from __future__ import absolute_import, division, print_function
 
 import sys
-from collections import defaultdict
+from collections import defaultdict, deque
 from multiprocessing.pool import ThreadPool
 import threading
 from threading import current_thread, Lock
 
-from .local import get_async
+from .callbacks import local_callbacks, unpack_callbacks
+from .compatibility import reraise
+from .core import flatten
+from .local import (get_async, start_state_from_dask, release_data,
+                    _execute_task, nested_get, retry_policy)
 from .context import _globals
+from .optimize import cull
+from .order import order
 from .utils_test import inc, add  # noqa: F401
 
 
@@ -54,6 +60,18 @@ def get(dsk, result, cache=None, num_workers=None, **kwargs):
     >>> get(dsk, ['w', 'y'])
     (4, 2)
     """
+    pool = _get_pool(num_workers)
+
+    results = get_async(pool.apply_async, len(pool._pool), dsk, result,
+                        cache=cache, get_id=_thread_get_id,
+                        pack_exception=pack_exception, **kwargs)
+
+    _cleanup_pools()
+
+    return results
+
+
+def _get_pool(num_workers):
     global default_pool
     pool = _globals['pool']
     thread = current_thread()
@@ -69,12 +87,12 @@ def get(dsk, result, cache=None, num_workers=None, **kwargs):
             else:
                 pool = ThreadPool(num_workers)
                 pools[thread][num_workers] = pool
+    return pool
 
-    results = get_async(pool.apply_async, len(pool._pool), dsk, result,
-                        cache=cache, get_id=_thread_get_id,
-                        pack_exception=pack_exception, **kwargs)
 
-    # Cleanup pools associated to dead threads
+def _cleanup_pools():
+    """ Cleanup pools associated to dead threads """
+    thread = current_thread()
     with pools_lock:
         active_threads = set(threading.enumerate())
         if thread is not main_thread:
@@ -83,4 +101,233 @@ def get(dsk, result, cache=None, num_workers=None, **kwargs):
                     for p in pools.pop(t).values():
                         p.close()
 
-    return results
+
+def get_stealing(dsk, result, cache=None, num_workers=None, callbacks=None,
+                 retry=None, rerun_exceptions_locally=None,
+                 raise_exception=reraise, **kwargs):
+    """ Threaded get function with work stealing
+
+    Unlike ``get``, there is no scheduler thread that all tasks pass through.
+    Each worker runs the tasks that its own tasks make ready, depth-first,
+    from a deque of its own, and steals the oldest tasks of other workers
+    when it runs out of work.  Each deque has its own lock, and only the
+    bookkeeping of finished tasks is shared, under another lock.  The
+    calling thread is one of the workers.
+
+    This lowers the overhead per task, which helps with graphs of many small
+    tasks.  Arguments are as for ``get``, and ``rerun_exceptions_locally``
+    and ``raise_exception`` as for ``dask.local.get_async``.  Other keyword
+    arguments, like those of optimizations passed on by ``compute``, are
+    ignored.
+
+    Examples
+    --------
+    >>> dsk = {'x': 1, 'y': 2, 'z': (inc, 'x'), 'w': (add, 'z', 'y')}
+    >>> get_stealing(dsk, 'w')
+    4
+    >>> get_stealing(dsk, ['w', 'y'])
+    (4, 2)
+
+    See Also
+    --------
+    get
+    """
+    pool = _get_pool(num_workers)
+    nworkers = len(pool._pool)
+
+    if isinstance(result, list):
+        results = set(flatten(result))
+    else:
+        results = set([result])
+
+    dsk = dict(dsk)
+    state = {}
+    with local_callbacks(callbacks) as callbacks:
+        _, _, pretask_cbs, posttask_cbs, _ = unpack_callbacks(callbacks)
+        started_cbs = []
+        succeeded = False
+        try:
+            for cb in callbacks:
+                if cb[0]:
+                    cb[0](dsk)
+                started_cbs.append(cb)
+
+            dsk, dependencies = cull(dsk, list(results))
+            dependencies = {k: set(v) for k, v in dependencies.items()}
+            keyorder = order(dsk, dependencies=dependencies)
+            state = start_state_from_dask(dsk, cache=cache,
+                                          sortkey=keyorder.get,
+                                          dependencies=dependencies)
+
+            for _, start_state, _, _, _ in callbacks:
+                if start_state:
+                    start_state(dsk, state)
+
+            if rerun_exceptions_locally is None:
+                rerun_exceptions_locally = _globals.get('rerun_exceptions_locally', False)
+
+            if retry is None:
+                retry = _globals.get('retry')
+
+            if state['waiting'] and not state['ready']:
+                raise ValueError("Found no accessible jobs in dask")
+
+            error = _run_stealing(pool, nworkers, dsk, state, results,
+                                  keyorder.get, pretask_cbs, posttask_cbs,
+                                  retry)
+            if error is not None:
+                key, (_, exc, tb) = error
+                if rerun_exceptions_locally and key is not None:
+                    _execute_task(dsk[key], state['cache'])  # Re-execute locally
+                raise_exception(exc, tb)
+            succeeded = True
+        finally:
+            for _, _, _, _, finish in started_cbs:
+                if finish:
+                    finish(dsk, state, not succeeded)
+
+    _cleanup_pools()
+
+    return nested_get(result, state['cache'])
+
+
+def _run_stealing(pool, nworkers, dsk, state, results, sortkey, pretask_cbs,
+                  posttask_cbs, retry):
+    """ Run all tasks of ``state`` with ``nworkers`` work stealing workers
+
+    Workers push and pop tasks at the end of their own deque, and steal from
+    the start of the deques of others, under the lock of the deque.  All of
+    ``state``, and the callbacks, are only accessed under the shared
+    ``lock``.  Tasks are held in ``state['ready']`` as a set until they are
+    finished.
+
+    Returns the key and ``sys.exc_info()`` of the first failure, with a key
+    of None if it wasn't in a task, or None if all tasks succeeded.
+    """
+    lock = Lock()
+    condition = threading.Condition(lock)
+    deques = [deque() for _ in range(nworkers)]
+    deque_locks = [Lock() for _ in range(nworkers)]
+    deques[0].extend(state['ready'])  # sorted with the first task last
+    state['ready'] = set(state['ready'])
+    errors = []
+    active = [0]
+    # Number of tasks left to run
+    remaining = [len(state['ready']) + len(state['waiting'])]
+    # Number of workers waiting for tasks, and of pushes of tasks that they
+    # may have missed when they last looked for work
+    idle = [0]
+    pushes = [0]
+
+    cache = state['cache']
+    waiting = state['waiting']
+    waiting_data = state['waiting_data']
+    ready = state['ready']
+
+    def done():
+        return errors or not remaining[0]
+
+    def next_task(i):
+        with deque_locks[i]:
+            if deques[i]:
+                return deques[i].pop()
+        for j in range(1, nworkers):
+            j = (i + j) % nworkers
+            if deques[j]:
+                with deque_locks[j]:
+                    if deques[j]:
+                        return deques[j].popleft()
+        return None
+
+    def finish_task(key, value):
+        # As ``dask.local.finish_task``, returning the newly ready tasks
+        cache[key] = value
+        new = []
+        for dep in state['dependents'][key]:
+            s = waiting[dep]
+            s.remove(key)
+            if not s:
+                del waiting[dep]
+                new.append(dep)
+        ready.update(new)
+
+        for dep in state['dependencies'][key]:
+            if dep in waiting_data:
+                s = waiting_data[dep]
+                s.remove(key)
+                if not s and dep not in results:
+                    release_data(dep, state)
+            elif dep not in results:
+                release_data(dep, state)
+
+        state['finished'].add(key)
+        ready.remove(key)
+        remaining[0] -= 1
+        return new
+
+    def fail(key):
+        with lock:
+            errors.append((key, sys.exc_info()))
+            condition.notify_all()
+
+    def work(i):
+        worker_id = _thread_get_id()
+        with lock:
+            active[0] += 1
+        try:
+            while not done():
+                seen = pushes[0]
+                key = next_task(i)
+                if key is None:
+                    with lock:
+                        # Wait, unless tasks were pushed since we looked
+                        if not done() and pushes[0] == seen:
+                            idle[0] += 1
+                            condition.wait()
+                            idle[0] -= 1
+                    continue
+                if pretask_cbs:
+                    with lock:
+                        for f in pretask_cbs:
+                            f(key, dsk, state)
+                policy = retry_policy(retry, key)
+                try:
+                    if policy is None:
+                        value = _execute_task(dsk[key], cache)
+                    else:
+                        value = policy.run(_execute_task, dsk[key], cache)
+                except BaseException:
+                    fail(key)
+                    break
+                with lock:
+                    new = finish_task(key, value)
+                    for f in posttask_cbs:
+                        f(key, value, dsk, state, worker_id)
+                    if not remaining[0]:
+                        condition.notify_all()
+                if new:
+                    new.sort(key=sortkey, reverse=True)
+                    with deque_locks[i]:
+                        deques[i].extend(new)
+                    if len(new) > 1:
+                        with lock:
+                            pushes[0] += 1
+                            if idle[0]:
+                                condition.notify(len(new) - 1)
+        except BaseException:
+            fail(None)
+        finally:
+            with lock:
+                active[0] -= 1
+                condition.notify_all()
+
+    for i in range(1, nworkers):
+        pool.apply_async(work, args=(i,))
+    work(0)
+
+    # Wait for workers still running tasks
+    with lock:
+        while active[0]:
+            condition.wait()
+
+    return errors[0] if errors else None
@@ -6,6 +6,7 @@ import os
 import shutil
 import sys
 import tempfile
+import types
 from errno import ENOENT
 from collections import Iterator
 from contextlib import contextmanager
@@ -94,6 +95,50 @@ def import_required(mod_name, error_msg):
         raise RuntimeError(error_msg)
 
 
+class LazyModule(types.ModuleType):
+    """ Placeholder for a module that is only imported on first use
+
+    Used to expose rarely needed submodules as package attributes without
+    paying for their import at startup.  The first attribute access imports
+    the real module and copies its namespace onto the placeholder.  Importing
+    the real module also replaces the placeholder on its parent package.
+
+    Examples
+    --------
+    >>> json = LazyModule('json')
+    >>> json.dumps([1, 2])
+    '[1, 2]'
+    """
+    # Looked up by tools such as doctest on every object of a module, which
+    # shouldn't import the modules that these objects stand for
+    _lazy_attrs = frozenset(['__wrapped__'])
+
+    def _load(self):
+        module = import_module(self.__name__)
+        self.__dict__.update(module.__dict__)
+        return module
+
+    def __getattribute__(self, attr):
+        # ModuleType gives placeholders a __doc__ of None
+        if attr == '__doc__':
+            return self._load().__doc__
+        return types.ModuleType.__getattribute__(self, attr)
+
+    def __getattr__(self, attr):
+        if attr in LazyModule._lazy_attrs:
+            raise AttributeError(attr)
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        return "<lazy module %r>" % self.__name__
+
+    def __reduce__(self):
+        return (import_module, (self.__name__,))
+
+
 @contextmanager
 def tmpfile(extension='', dir=None):
     extension = '.' + extension.lstrip('.')